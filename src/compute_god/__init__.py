@@ -40,6 +40,8 @@ from .happiness_scheduler import (
 
 from .core import (
     ApplyFn,
+    ArrayState,
+    ConvergencePredicate,
     FixpointEngine,
     FixpointResult,
     God,
@@ -54,6 +56,8 @@ from .core import (
     Metric,
     combine_observers,
     fixpoint,
+    fuse_rules,
+    linf_predicate,
     recursive_descent_fixpoint,
     rule,
 )
@@ -262,6 +266,7 @@ _register_compat_module(
     "rule",
     Rule=Rule,
     rule=rule,
+    fuse_rules=fuse_rules,
     ApplyFn=ApplyFn,
     PredicateFn=PredicateFn,
     RuleContext=RuleContext,
@@ -272,7 +277,9 @@ _register_compat_module(
     FixpointEngine=FixpointEngine,
     FixpointResult=FixpointResult,
     Metric=Metric,
+    ConvergencePredicate=ConvergencePredicate,
     fixpoint=fixpoint,
+    linf_predicate=linf_predicate,
     recursive_descent_fixpoint=recursive_descent_fixpoint,
 )
 _register_compat_module(
@@ -415,6 +422,8 @@ from .domains.anti_quantum import (
     AntiQuantumDual,
     QuantumAttackSurface,
     anti_quantum_dual,
+    anti_quantum_dual_batch,
+    anti_quantum_duality_index,
     抗量子算法,
     抗量子对偶,
     量子攻击面,
@@ -475,11 +484,13 @@ from .domains.complex_network import (
     run_complex_network,
 )
 from .domains.cooperation_evolution import (
+    COOPERATION_BATCH_KEYS,
     CooperationParameters,
     CooperationState,
     DEFAULT_COOPERATION_STATE,
     evolve_cooperation,
     run_cooperation_evolution,
+    run_cooperation_evolution_batch,
 )
 from .domains.llm_cooperation import (
     DEFAULT_LLM_COOPERATION,
@@ -517,6 +528,7 @@ from .domains.catalysis import (
     CatalysisOutcome,
     Chanzi,
     Jiuzi,
+    catalyse_batch,
     catalyse_jiuzi_and_chanzi,
 )
 from .domains.theorem import (
@@ -543,8 +555,10 @@ from .domains.adhd import (
     ADHDProfile,
     ADHDResponse,
     CoefficientOfEngagement,
+    StimulusBatch,
     StimulusProfile,
     simulate_coe,
+    simulate_coe_array,
 )
 from .domains.logic import Feizi, Ouzi, Ruofei, 非子, 欧子, 若非
 from .domains.xuyueming import (
@@ -17,14 +17,18 @@ _RAW_STATION_BLUEPRINT: tuple[StationLayout, ...] = (
             "ApplyFn",
             "PredicateFn",
             "Metric",
+            "ConvergencePredicate",
             "State",
+            "ArrayState",
             "RuleContext",
             "Rule",
             "rule",
+            "fuse_rules",
             "God",
             "Universe",
             "combine_observers",
             "fixpoint",
+            "linf_predicate",
             "FixpointEngine",
             "FixpointResult",
             "Observer",
@@ -254,6 +258,8 @@ _RAW_STATION_BLUEPRINT: tuple[StationLayout, ...] = (
             "AntiQuantumDual",
             "QuantumAttackSurface",
             "anti_quantum_dual",
+            "anti_quantum_dual_batch",
+            "anti_quantum_duality_index",
             "抗量子算法",
             "抗量子对偶",
             "量子攻击面",
@@ -430,6 +436,8 @@ _RAW_STATION_BLUEPRINT: tuple[StationLayout, ...] = (
             "DEFAULT_COOPERATION_STATE",
             "evolve_cooperation",
             "run_cooperation_evolution",
+            "run_cooperation_evolution_batch",
+            "COOPERATION_BATCH_KEYS",
         ),
     ),
     (
@@ -508,6 +516,7 @@ _RAW_STATION_BLUEPRINT: tuple[StationLayout, ...] = (
             "CatalysisOutcome",
             "Chanzi",
             "Jiuzi",
+            "catalyse_batch",
             "catalyse_jiuzi_and_chanzi",
         ),
     ),
@@ -544,10 +553,12 @@ _RAW_STATION_BLUEPRINT: tuple[StationLayout, ...] = (
         "注意力缺陷情境下的参与度模拟。",
         (
             "StimulusProfile",
+            "StimulusBatch",
             "ADHDResponse",
             "ADHDProfile",
             "CoefficientOfEngagement",
             "simulate_coe",
+            "simulate_coe_array",
         ),
     ),
     (
@@ -1,8 +1,17 @@
 """Compute-God core runtime package."""
 
-from .engine import FixpointEngine, FixpointResult, Metric, fixpoint, recursive_descent_fixpoint
+from .array_state import ArrayState
+from .engine import (
+    ConvergencePredicate,
+    FixpointEngine,
+    FixpointResult,
+    Metric,
+    fixpoint,
+    linf_predicate,
+    recursive_descent_fixpoint,
+)
 from .observer import Observer, ObserverEvent, NoopObserver, combine_observers
-from .rules import ApplyFn, PredicateFn, Rule, rule
+from .rules import ApplyFn, PredicateFn, Rule, fuse_rules, rule
 from .typeclass import (
     ClassConstraint,
     ConstraintSolver,
@@ -29,6 +38,8 @@ from .universe import God, Universe
 
 __all__ = [
     "ApplyFn",
+    "ArrayState",
+    "ConvergencePredicate",
     "FixpointEngine",
     "FixpointResult",
     "God",
@@ -43,6 +54,8 @@ __all__ = [
     "Universe",
     "combine_observers",
     "fixpoint",
+    "fuse_rules",
+    "linf_predicate",
     "recursive_descent_fixpoint",
     "rule",
 
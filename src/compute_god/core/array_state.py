@@ -0,0 +1,157 @@
+"""Fixed-layout numeric state backed by a contiguous buffer.
+
+Most universes in the lab evolve a handful of named floats.  Storing them in a
+plain :class:`dict` means every rule that wants copy-on-write semantics pays for
+a fresh hash table.  :class:`ArrayState` keeps the familiar mapping interface –
+rules, observers and metrics can still write ``state["energy"]`` – while the
+values live in a single float buffer addressed through a shared key index.
+Copying the state is therefore a flat buffer copy and rules may update the
+slots in place.
+
+The buffer is a NumPy ``float64`` array when NumPy is importable and a
+``array.array("d")`` otherwise.  Both are contiguous doubles with constant-time
+indexed access; only the NumPy buffer supports the vectorised fast paths, which
+callers should gate on :attr:`ArrayState.vectorised`.
+"""
+
+from __future__ import annotations
+
+from array import array as _DoubleArray
+from typing import Dict, Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - numpy is a declared dependency, keep the core importable
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
+
+
+class ArrayState(MutableMapping[str, float]):
+    """Mutable mapping over a fixed set of float coordinates.
+
+    The key layout is fixed at construction time: assigning to an unknown key
+    raises :class:`KeyError` and keys cannot be deleted.  The underlying buffer
+    is exposed as :attr:`array` so metrics and fused kernels can operate on all
+    coordinates at once.
+    """
+
+    __slots__ = ("_keys", "_index", "array")
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        values: Optional[Iterable[float]] = None,
+        *,
+        index: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self._keys: Tuple[str, ...] = tuple(keys)
+        self._index: Mapping[str, int] = (
+            index if index is not None else {key: i for i, key in enumerate(self._keys)}
+        )
+        size = len(self._keys)
+        if np is not None:
+            if values is None:
+                self.array = np.zeros(size, dtype=np.float64)
+            else:
+                self.array = np.fromiter(values, dtype=np.float64, count=size)
+        else:
+            self.array = _DoubleArray("d", [0.0] * size if values is None else values)
+            if len(self.array) != size:
+                raise ValueError(f"expected {size} values, got {len(self.array)}")
+
+    @classmethod
+    def from_mapping(
+        cls,
+        keys: Sequence[str],
+        mapping: Mapping[str, object],
+        *,
+        index: Optional[Mapping[str, int]] = None,
+    ) -> "ArrayState":
+        """Build a state reading every key of the layout from ``mapping``."""
+
+        return cls(keys, (float(mapping[key]) for key in keys), index=index)  # type: ignore[arg-type]
+
+    @property
+    def vectorised(self) -> bool:
+        """Return ``True`` when :attr:`array` is a NumPy array."""
+
+        return not isinstance(self.array, _DoubleArray)
+
+    @property
+    def layout(self) -> Tuple[str, ...]:
+        """Return the ordered keys addressed by :attr:`array`."""
+
+        return self._keys
+
+    def __getitem__(self, key: str) -> float:
+        return float(self.array[self._index[key]])
+
+    def get(self, key: str, default: Optional[float] = None) -> Optional[float]:  # type: ignore[override]
+        slot = self._index.get(key)
+        if slot is None:
+            return default
+        return float(self.array[slot])
+
+    def __setitem__(self, key: str, value: float) -> None:
+        try:
+            slot = self._index[key]
+        except KeyError:
+            raise KeyError(f"{key!r} is not part of the fixed state layout") from None
+        self.array[slot] = value
+
+    def update(self, other: Mapping[str, float] = (), /, **kwargs: float) -> None:  # type: ignore[override]
+        """Write several coordinates, resolving each slot once."""
+
+        index = self._index
+        values = self.array
+        items = other.items() if isinstance(other, Mapping) else other
+        for source in (items, kwargs.items()):
+            for key, value in source:
+                slot = index.get(key)
+                if slot is None:
+                    raise KeyError(f"{key!r} is not part of the fixed state layout")
+                values[slot] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("ArrayState keys cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def copy(self) -> "ArrayState":
+        """Return an independent state sharing the same key layout."""
+
+        clone = ArrayState.__new__(ArrayState)
+        clone._keys = self._keys
+        clone._index = self._index
+        clone.array = self.array.__copy__()
+        return clone
+
+    def l1_distance(self, other: "ArrayState") -> float:
+        """Return the sum of coordinate-wise distances to ``other``."""
+
+        if self.vectorised and other.vectorised:
+            return float(np.add.reduce(np.absolute(np.subtract(self.array, other.array))))
+        return sum(abs(left - right) for left, right in zip(self.array, other.array))
+
+    def max_distance(self, other: "ArrayState") -> float:
+        """Return the largest coordinate-wise distance to ``other``."""
+
+        if self.vectorised and other.vectorised:
+            difference = np.absolute(np.subtract(self.array, other.array))
+            return float(np.maximum.reduce(difference, initial=0.0))
+        return max((abs(left - right) for left, right in zip(self.array, other.array)), default=0.0)
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(self._keys, self.array.tolist()))
+
+    def __repr__(self) -> str:
+        return f"ArrayState({self.to_dict()!r})"
+
+
+__all__ = ["ArrayState"]
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence, Set, Tuple
 
-from .observer import Observer, ObserverEvent, combine_observers
+from .array_state import ArrayState
+from .observer import NoopObserver, Observer, ObserverEvent, combine_observers
+from .rules import ApplyFn
 from .types import RuleContext, State
-from .universe import God, Universe
+from .universe import DependencyRecord, God, RuleRecord, Universe
 
 Metric = Callable[[State, State], float]
+ConvergencePredicate = Callable[[State, State, float], bool]
 
 
 @dataclass(frozen=True)
@@ -27,49 +30,249 @@ class _EpochContext:
         metric: Metric,
         epsilon: float,
         initial_state: State,
+        predicate: Optional[ConvergencePredicate] = None,
     ) -> None:
         self._observer = observer
         self._metric = metric
         self._epsilon = epsilon
-        self._previous_state: State = dict(initial_state)
-
-    def record(self, state: State, *, epoch: int) -> bool:
-        delta = self._metric(self._previous_state, state)
-        self._previous_state = dict(state)
-        if delta <= self._epsilon:
-            self._observer(
+        self._predicate = predicate
+        # ``_apply_rules`` clones the state before any rule runs, so the states
+        # handed to ``record`` are never mutated afterwards and can be kept as
+        # the comparison baseline without another copy.
+        self._previous_state: State = initial_state
+
+    def record(self, state: State, *, epoch: int, dirty: Optional[Set[str]] = None) -> bool:
+        observer = self._observer
+        metric = self._metric
+        epsilon = self._epsilon
+        predicate = self._predicate
+        previous = self._previous_state
+        self._previous_state = state
+        if dirty is not None and not dirty:
+            # Worklist epochs report exactly which keys changed; an empty set
+            # is a fixpoint without walking the state through the metric.
+            observer(ObserverEvent.FIXPOINT_CONVERGED, state, epoch=epoch, delta=0.0)
+            return True
+        if predicate is not None:
+            # The predicate only answers "within epsilon?"; the exact delta is
+            # computed for the convergence event alone.
+            if not predicate(previous, state, epsilon):
+                observer(ObserverEvent.EPOCH, state, epoch=epoch)
+                return False
+            observer(
                 ObserverEvent.FIXPOINT_CONVERGED,
                 state,
                 epoch=epoch,
-                delta=delta,
+                delta=metric(previous, state),
             )
             return True
 
-        self._observer(ObserverEvent.EPOCH, state, epoch=epoch, delta=delta)
+        delta = metric(previous, state)
+        if delta <= epsilon:
+            observer(ObserverEvent.FIXPOINT_CONVERGED, state, epoch=epoch, delta=delta)
+            return True
+
+        observer(ObserverEvent.EPOCH, state, epoch=epoch, delta=delta)
         return False
 
 
+def linf_predicate(previous: State, current: State, epsilon: float) -> bool:
+    """Return ``True`` when no coordinate moved by more than ``epsilon``.
+
+    The scan stops at the first coordinate exceeding the bound, so epochs far
+    from convergence cost only as much as it takes to find one moving key.
+    Missing coordinates count as ``0``.
+    """
+
+    if (
+        isinstance(previous, ArrayState)
+        and isinstance(current, ArrayState)
+        and previous.layout == current.layout
+    ):
+        return current.max_distance(previous) <= epsilon
+    for key, value in current.items():
+        if abs(value - previous.get(key, 0)) > epsilon:
+            return False
+    for key, value in previous.items():
+        if key not in current and abs(value) > epsilon:
+            return False
+    return True
+
+
+# Coroutine rule bodies are rejected when the universe is built; the runtime
+# probe only remains for callables that hand back an awaitable, and the common
+# state types skip it.
+_SYNC_STATE_TYPES = frozenset({dict, ArrayState})
+
+
 def _clone_state(state: State) -> State:
+    # ``dict.copy`` takes CPython's direct table copy and ``ArrayState`` (or a
+    # subclass) copies its buffer; ``dict(mapping)`` goes through the mapping
+    # protocol and is kept for other mapping types.
+    if type(state) is dict or isinstance(state, ArrayState):
+        return state.copy()
     return dict(state)
 
 
-def _apply_rules(universe: Universe, ctx: RuleContext, observer: Observer) -> State:
-    state = _clone_state(universe.state)
-    for rule in universe.sorted_rules():
-        if not rule.should_fire(state, ctx):
+def _apply_rules(
+    state: State,
+    records: Sequence[RuleRecord],
+    ctx: RuleContext,
+    observer: Observer,
+) -> State:
+    state = _clone_state(state)
+    notify = not isinstance(observer, NoopObserver)
+    increment = ctx.increment
+    steps = ctx.steps
+    for name, should_fire, apply, should_stop in records:
+        if should_fire is not None and not should_fire(state, ctx):
             continue
-        new_state = rule.apply(state, ctx)
-        maybe_state = new_state
-        if hasattr(maybe_state, "__await__"):
+        new_state = apply(state, ctx)
+        if type(new_state) not in _SYNC_STATE_TYPES and hasattr(new_state, "__await__"):
             raise TypeError("Async rules are not supported in sync execution")
-        state = maybe_state
-        ctx.increment()
-        observer(ObserverEvent.STEP, state, rule=rule.name, steps=ctx.steps())
-        if rule.should_stop(state, ctx):
+        state = new_state
+        increment()
+        if notify:
+            observer(ObserverEvent.STEP, state, rule=name, steps=steps())
+        if should_stop is not None and should_stop(state, ctx):
             break
     return state
 
 
+def _apply_unconditional(state: State, applies: Sequence[ApplyFn], ctx: RuleContext) -> State:
+    """Straight-line epoch for rules without guards or stop conditions.
+
+    Used when nobody listens to ``STEP`` events, so the loop reduces to the
+    rule bodies and the step counter.
+    """
+
+    state = _clone_state(state)
+    increment = ctx.increment
+    for apply in applies:
+        new_state = apply(state, ctx)
+        if type(new_state) not in _SYNC_STATE_TYPES and hasattr(new_state, "__await__"):
+            raise TypeError("Async rules are not supported in sync execution")
+        state = new_state
+        increment()
+    return state
+
+
+_MISSING = object()
+
+
+def _apply_worklist(
+    state: State,
+    records: Sequence[DependencyRecord],
+    ctx: RuleContext,
+    observer: Observer,
+    changed_before: Optional[Set[str]],
+) -> Tuple[State, Optional[Set[str]]]:
+    """Apply one epoch skipping rules whose declared reads did not change.
+
+    ``changed_before`` holds the keys changed during the previous epoch, with
+    ``None`` meaning "unknown" (the first epoch, or a rule without declared
+    writes ran).  A rule is skipped when neither that set nor the keys changed
+    so far in this epoch intersect its reads, which covers every change since
+    its previous turn.  Returns the new state and the keys changed this epoch.
+    """
+
+    state = _clone_state(state)
+    notify = not isinstance(observer, NoopObserver)
+    increment = ctx.increment
+    steps = ctx.steps
+    changed: Optional[Set[str]] = set()
+    for name, should_fire, apply, should_stop, reads, writes in records:
+        if (
+            reads is not None
+            and changed_before is not None
+            and changed is not None
+            and reads.isdisjoint(changed_before)
+            and reads.isdisjoint(changed)
+        ):
+            continue
+        if should_fire is not None and not should_fire(state, ctx):
+            continue
+        if writes is not None:
+            before = [state.get(key, _MISSING) for key in writes]
+        new_state = apply(state, ctx)
+        if type(new_state) not in _SYNC_STATE_TYPES and hasattr(new_state, "__await__"):
+            raise TypeError("Async rules are not supported in sync execution")
+        state = new_state
+        if changed is not None:
+            if writes is None:
+                changed = None
+            else:
+                for key, old in zip(writes, before):
+                    if state.get(key, _MISSING) != old:
+                        changed.add(key)
+        increment()
+        if notify:
+            observer(ObserverEvent.STEP, state, rule=name, steps=steps())
+        if should_stop is not None and should_stop(state, ctx):
+            break
+    return state, changed
+
+
+def _run_loop(
+    universe: Universe,
+    *,
+    metric: Metric,
+    epsilon: float,
+    max_epoch: int,
+    observer: Optional[Observer],
+    predicate: Optional[ConvergencePredicate],
+) -> FixpointResult:
+    ctx = God.rule_context()
+    active_observer = observer or combine_observers(*universe.observers)
+    epoch_ctx = _EpochContext(
+        observer=active_observer,
+        metric=metric,
+        epsilon=epsilon,
+        initial_state=universe.state,
+        predicate=predicate,
+    )
+
+    # Rules and observers are invariant across epochs, so only the state is
+    # threaded through the loop and the result universe is built once.
+    # Everything the loop touches is bound to a local up front.
+    records = universe.rule_records
+    dependency_records = universe.dependency_records
+    record = epoch_ctx.record
+    apply_rules = _apply_rules
+    apply_worklist = _apply_worklist
+    apply_unconditional = _apply_unconditional
+    straight = (
+        dependency_records is None
+        and universe.unconditional
+        and isinstance(active_observer, NoopObserver)
+    )
+    applies = universe.rule_applies
+    changed: Optional[Set[str]] = None
+    state = universe.state
+    for epoch in range(1, max_epoch + 1):
+        if straight:
+            state = apply_unconditional(state, applies, ctx)
+        elif dependency_records is None:
+            state = apply_rules(state, records, ctx, active_observer)
+        else:
+            state, changed = apply_worklist(
+                state, dependency_records, ctx, active_observer, changed
+            )
+        if record(state, epoch=epoch, dirty=changed):
+            return FixpointResult(
+                universe=Universe(state, universe.rules, universe.observers),
+                converged=True,
+                epochs=epoch,
+            )
+
+    active_observer(ObserverEvent.FIXPOINT_MAXED, state, epoch=max_epoch)
+    return FixpointResult(
+        universe=Universe(state, universe.rules, universe.observers),
+        converged=False,
+        epochs=max_epoch,
+    )
+
+
 class FixpointEngine:
     """High level wrapper coordinating fixpoint execution."""
 
@@ -80,31 +283,24 @@ class FixpointEngine:
         epsilon: float,
         max_epoch: int,
         observer: Optional[Observer] = None,
+        predicate: Optional[ConvergencePredicate] = None,
     ) -> None:
         self._metric = metric
         self._epsilon = epsilon
         self._max_epoch = max_epoch
         self._observer = observer
+        self._predicate = predicate
 
     def run(self, universe: Universe) -> FixpointResult:
-        ctx = God.rule_context()
-        observer = self._observer or combine_observers(*universe.observers)
-        epoch_ctx = _EpochContext(
-            observer=observer,
+        return _run_loop(
+            universe,
             metric=self._metric,
             epsilon=self._epsilon,
-            initial_state=universe.state,
+            max_epoch=self._max_epoch,
+            observer=self._observer,
+            predicate=self._predicate,
         )
 
-        for epoch in range(1, self._max_epoch + 1):
-            new_state = _apply_rules(universe, ctx, observer)
-            universe = Universe(new_state, universe.rules, universe.observers)
-            if epoch_ctx.record(new_state, epoch=epoch):
-                return FixpointResult(universe=universe, converged=True, epochs=epoch)
-
-        observer(ObserverEvent.FIXPOINT_MAXED, universe.state, epoch=self._max_epoch)
-        return FixpointResult(universe=universe, converged=False, epochs=self._max_epoch)
-
 
 def fixpoint(
     universe: Universe,
@@ -113,8 +309,26 @@ def fixpoint(
     epsilon: float,
     max_epoch: int,
     observer: Optional[Observer] = None,
+    predicate: Optional[ConvergencePredicate] = None,
 ) -> FixpointResult:
-    engine = FixpointEngine(metric=metric, epsilon=epsilon, max_epoch=max_epoch, observer=observer)
+    """Iterate ``universe`` until ``metric`` drops to ``epsilon`` or below.
+
+    When ``predicate`` is given it decides convergence instead of comparing
+    ``metric`` against ``epsilon``; ``metric`` is then evaluated only for the
+    converging epoch and ``EPOCH`` events carry no ``delta``.
+
+    Universes whose rules declare ``reads`` and ``writes`` are scheduled from a
+    worklist.  An epoch in which no declared key changed is reported as
+    converged with ``delta=0.0`` without evaluating ``metric`` at all.
+    """
+
+    engine = FixpointEngine(
+        metric=metric,
+        epsilon=epsilon,
+        max_epoch=max_epoch,
+        observer=observer,
+        predicate=predicate,
+    )
     return engine.run(universe)
 
 
@@ -125,48 +339,34 @@ def recursive_descent_fixpoint(
     epsilon: float,
     max_epoch: int,
     observer: Optional[Observer] = None,
+    predicate: Optional[ConvergencePredicate] = None,
 ) -> FixpointResult:
     """Compute a fixpoint using a recursive descent strategy.
 
-    The recursive variant mirrors :func:`fixpoint` but expresses the epoch loop as
-    a recursive descent.  This is mostly pedagogical – some experiments in the
-    wider lab prefer the structural recursion style when reasoning about
-    backtracking universes – yet it retains feature parity with the iterative
-    engine so tests and observers behave identically.
+    The recursive variant mirrors :func:`fixpoint` and is kept for experiments
+    in the wider lab that reason about backtracking universes in the
+    structural recursion style.  Each descent step is a tail call, so it is
+    executed by the same iterative driver as :func:`fixpoint`: observers see
+    identical events and ``max_epoch`` is not capped by the interpreter's
+    recursion limit.
     """
 
-    ctx = God.rule_context()
-    active_observer = observer or combine_observers(*universe.observers)
-    epoch_ctx = _EpochContext(
-        observer=active_observer,
+    return _run_loop(
+        universe,
         metric=metric,
         epsilon=epsilon,
-        initial_state=universe.state,
+        max_epoch=max_epoch,
+        observer=observer,
+        predicate=predicate,
     )
 
-    def descend(current: Universe, epoch: int) -> FixpointResult:
-        if epoch > max_epoch:
-            active_observer(
-                ObserverEvent.FIXPOINT_MAXED,
-                current.state,
-                epoch=max_epoch,
-            )
-            return FixpointResult(universe=current, converged=False, epochs=max_epoch)
-
-        new_state = _apply_rules(current, ctx, active_observer)
-        next_universe = Universe(new_state, current.rules, current.observers)
-        if epoch_ctx.record(new_state, epoch=epoch):
-            return FixpointResult(universe=next_universe, converged=True, epochs=epoch)
-
-        return descend(next_universe, epoch + 1)
-
-    return descend(universe, 1)
-
 
 __all__ = [
+    "ConvergencePredicate",
     "FixpointEngine",
     "FixpointResult",
     "Metric",
     "fixpoint",
+    "linf_predicate",
     "recursive_descent_fixpoint",
 ]
@@ -41,11 +41,25 @@ class NoopObserver:
         return None
 
 
+_NOOP = NoopObserver()
+
+
 def combine_observers(*observers: Observer) -> Observer:
-    """Return an observer that forwards events to each provided observer."""
+    """Return an observer that forwards events to each provided observer.
+
+    :class:`NoopObserver` instances are dropped up front.  With nothing left
+    the shared no-op observer is returned, and a single remaining observer is
+    returned as is, so the common cases dispatch without a wrapper call.
+    """
+
+    active = tuple(observer for observer in observers if not isinstance(observer, NoopObserver))
+    if not active:
+        return _NOOP
+    if len(active) == 1:
+        return active[0]
 
     def _combined(event: ObserverEvent, state: State, /, **metadata: object) -> None:
-        for observer in observers:
+        for observer in active:
             observer(event, state, **metadata)
 
     return _combined
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import inspect
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
 
+from .array_state import ArrayState
 from .types import RuleContext, State
 
 ApplyFn = Callable[[State, RuleContext], State]
@@ -23,6 +24,9 @@ class Rule:
     priority: int = 0
     role: Optional[str] = None
     annotations: Dict[str, object] = field(default_factory=dict)
+    watches: Tuple[str, ...] = ()
+    reads: Optional[FrozenSet[str]] = None
+    writes: Optional[FrozenSet[str]] = None
 
     def should_fire(self, state: State, ctx: RuleContext) -> bool:
         if self.guard is None:
@@ -44,8 +48,28 @@ def rule(
     priority: int = 0,
     role: Optional[str] = None,
     annotations: Optional[Dict[str, object]] = None,
+    watches: Sequence[str] = (),
+    reads: Optional[Iterable[str]] = None,
+    writes: Optional[Iterable[str]] = None,
 ) -> Rule:
-    """Lift a simple state transformer into a :class:`Rule` instance."""
+    """Lift a simple state transformer into a :class:`Rule` instance.
+
+    ``watches`` declares the state keys the guard depends on.  The engine then
+    re-evaluates the guard only when one of those values changed since its last
+    evaluation, so the guard must be a pure function of the watched values.
+
+    The engine hands every epoch a private copy of the state, so rule bodies
+    may update it in place – ``state["key"] = value``, ``state.update(delta)``
+    or, for plain dictionaries, ``state |= delta`` – and return it, which is
+    cheaper than rebuilding ``{**state, **delta}``.
+
+    ``reads`` and ``writes`` declare the keys the rule consumes and produces.
+    Once any rule of a universe declares ``reads`` the engine switches to
+    worklist scheduling: after the first epoch a rule with declared reads only
+    runs when one of them changed since its previous turn.  Changes are
+    detected on the declared ``writes``; a rule without them is assumed to
+    touch every key.
+    """
 
     if annotations is None:
         annotations = {}
@@ -79,6 +103,7 @@ def rule(
         def wrapped(state: State, _ctx: RuleContext) -> State:
             return simple_apply(state)
 
+        wrapped.__wrapped__ = simple_apply  # type: ignore[attr-defined]
         apply_fn = wrapped
 
     return Rule(
@@ -89,7 +114,73 @@ def rule(
         priority=priority,
         role=role,
         annotations=annotations,
+        watches=tuple(watches),
+        reads=None if reads is None else frozenset(reads),
+        writes=None if writes is None else frozenset(writes),
+    )
+
+
+def _max_change(before: State, after: State) -> float:
+    if isinstance(before, ArrayState) and isinstance(after, ArrayState):
+        return after.max_distance(before)
+    return max(
+        (abs(float(after[key]) - float(value)) for key, value in before.items()),  # type: ignore[arg-type]
+        default=0.0,
+    )
+
+
+def fuse_rules(
+    name: str,
+    rules: Sequence[Rule],
+    *,
+    priority: int = 0,
+    role: Optional[str] = None,
+    settle_tolerance: Optional[float] = None,
+) -> Rule:
+    """Compose unguarded rules into a single rule applied in priority order.
+
+    The engine pays for guard checks, step accounting and observer dispatch on
+    every rule it fires.  Pipelines whose rules always fire back to back can be
+    fused so each epoch performs a single application.  The names of the fused
+    rules are recorded under the ``"fused"`` annotation.
+
+    When ``settle_tolerance`` is given the state must be numeric.  Every
+    member still runs each epoch; if the pass as a whole moves no coordinate
+    by more than the tolerance, the epoch is discarded and the incoming state
+    is returned, so the engine sees a settled epoch instead of the residual
+    drift.  Settling is decided across all members because a single member
+    standing still says nothing about the ones after it.
+    """
+
+    ordered = sorted(rules, key=lambda r: r.priority, reverse=True)
+    for member in ordered:
+        if member.guard is not None or member.until is not None:
+            raise ValueError(
+                f"rule {member.name!r} has a guard or stop condition and cannot be fused"
+            )
+    applies = tuple(member.apply for member in ordered)
+
+    def fused(state: State, ctx: RuleContext) -> State:
+        for apply in applies:
+            state = apply(state, ctx)
+        return state
+
+    def settling(state: State, ctx: RuleContext) -> State:
+        # Members may update ``state`` in place, so keep a copy to return.
+        before = state.copy() if isinstance(state, (dict, ArrayState)) else dict(state)
+        for apply in applies:
+            state = apply(state, ctx)
+        if _max_change(before, state) <= settle_tolerance:
+            return before
+        return state
+
+    return Rule(
+        name=name,
+        apply=fused if settle_tolerance is None else settling,
+        priority=priority,
+        role=role,
+        annotations={"fused": tuple(member.name for member in ordered)},
     )
 
 
-__all__ = ["ApplyFn", "PredicateFn", "Rule", "rule"]
+__all__ = ["ApplyFn", "PredicateFn", "Rule", "fuse_rules", "rule"]
@@ -26,9 +26,24 @@ metavariable resolution.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from weakref import WeakValueDictionary
 
 
 # ---------------------------------------------------------------------------
@@ -58,10 +73,19 @@ class ObservationalEquality:
         }
         if normalisers:
             self._normalisers.update(normalisers)
+        # The built-in normalisers need no calls: Ω is proof-irrelevant and 𝒰
+        # compares values as they are.  Custom normalisers disable the shortcut.
+        self._omega_irrelevant = not normalisers or Sort.OMEGA not in normalisers
+        self._universe_identity = not normalisers or Sort.UNIVERSE not in normalisers
 
     def equivalent(self, left: Any, right: Any, *, sort: Sort = Sort.UNIVERSE) -> bool:
         """Return ``True`` when *left* and *right* are observationally equal."""
 
+        if sort is Sort.OMEGA:
+            if self._omega_irrelevant:
+                return True
+        elif sort is Sort.UNIVERSE and self._universe_identity:
+            return left == right
         normalise = self._normalisers.get(sort)
         if normalise is None:
             raise ValueError(f"No observational normaliser registered for sort {sort}")
@@ -88,12 +112,28 @@ def cast(value: Any, *, source: Any, target: Any, witness: Callable[[Any, Any],
 # ---------------------------------------------------------------------------
 
 
+_INTERNED_VARS: "WeakValueDictionary[str, TypeVar]" = WeakValueDictionary()
+_INTERNED_EXPRS: "WeakValueDictionary[Tuple[str, Tuple[int, ...]], TypeExpr]" = (
+    WeakValueDictionary()
+)
+
+
 @dataclass(frozen=True)
 class TypeVar:
     """A type variable used during instance declarations."""
 
     name: str
 
+    @classmethod
+    def intern(cls, name: str) -> "TypeVar":
+        """Return the shared variable called ``name``."""
+
+        var = _INTERNED_VARS.get(name)
+        if var is None:
+            var = cls(name)
+            _INTERNED_VARS[name] = var
+        return var
+
     def __str__(self) -> str:  # pragma: no cover - debugging helper
         return self.name
 
@@ -105,8 +145,45 @@ class TypeExpr:
     head: str
     args: Tuple["TypeTerm", ...] = field(default_factory=tuple)
 
+    @classmethod
+    def intern(cls, head: str, args: Tuple["TypeTerm", ...] = ()) -> "TypeExpr":
+        """Return the shared node for ``head`` applied to ``args``.
+
+        Nodes are keyed on the identity of their arguments, so interning a term
+        bottom-up makes structurally equal terms the same object and equality
+        checks between them collapse to an identity test.  An entry lives as
+        long as its node, which in turn keeps the argument ids valid.
+        """
+
+        args = tuple(args)
+        key = (head, tuple(map(id, args)))
+        expr = _INTERNED_EXPRS.get(key)
+        if expr is None:
+            expr = cls(head, args)
+            _INTERNED_EXPRS[key] = expr
+        return expr
+
+    def __hash__(self) -> int:
+        # Cached outside the dataclass fields: child hashes are reused, so
+        # hashing a term with shared subterms costs one step per node.
+        cached = self.__dict__.get("_hash")
+        if cached is None:
+            cached = hash((self.head, self.args))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def __getstate__(self) -> Dict[str, object]:
+        # String hashes are salted per process, so a pickled or copied term
+        # must recompute its hash rather than carry the cached one along.
+        state = dict(self.__dict__)
+        state.pop("_hash", None)
+        return state
+
     def map_args(self, fn: Callable[["TypeTerm"], "TypeTerm"]) -> "TypeExpr":
-        return TypeExpr(self.head, tuple(fn(arg) for arg in self.args))
+        args = tuple(fn(arg) for arg in self.args)
+        if all(new is old for new, old in zip(args, self.args)):
+            return self
+        return TypeExpr.intern(self.head, args)
 
     def __str__(self) -> str:  # pragma: no cover - debugging helper
         if not self.args:
@@ -115,16 +192,30 @@ class TypeExpr:
 
 
 TypeTerm = Union[TypeExpr, TypeVar]
+ConstraintKey = Tuple[str, TypeTerm]
 
 
 def occurs_in(var: TypeVar, term: TypeTerm, substitution: "Substitution") -> bool:
-    """Return ``True`` if *var* occurs in *term* under *substitution*."""
+    """Return ``True`` if *var* occurs in *term* under *substitution*.
 
-    term = substitution.apply(term)
-    if isinstance(term, TypeVar):
-        return term == var
-    if isinstance(term, TypeExpr):
-        return any(occurs_in(var, arg, substitution) for arg in term.args)
+    The term is walked depth first with an explicit stack, resolving bindings
+    one node at a time; subterms shared between branches (common once terms
+    are interned) are visited only once.
+    """
+
+    stack: List[TypeTerm] = [term]
+    seen: set = set()
+    while stack:
+        current = substitution._resolve(stack.pop())
+        if isinstance(current, TypeVar):
+            if current is var or current == var:
+                return True
+            continue
+        if isinstance(current, TypeExpr) and current.args:
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            stack.extend(current.args)
     return False
 
 
@@ -148,12 +239,65 @@ class Substitution:
             raise UnificationError(f"Occurs check failed for {var} in {term}")
         self._mapping[var] = term
 
+    def _resolve(self, term: TypeTerm) -> TypeTerm:
+        """Follow variable bindings from ``term`` compressing the chain walked."""
+
+        if not isinstance(term, TypeVar):
+            return term
+        mapping = self._mapping
+        target = mapping.get(term)
+        if target is None:
+            return term
+        chain = [term]
+        while isinstance(target, TypeVar):
+            following = mapping.get(target)
+            if following is None:
+                break
+            chain.append(target)
+            target = following
+        if len(chain) > 1:
+            for var in chain:
+                mapping[var] = target
+        return target
+
     def apply(self, term: TypeTerm) -> TypeTerm:
-        if isinstance(term, TypeVar) and term in self._mapping:
-            return self.apply(self._mapping[term])
-        if isinstance(term, TypeExpr):
-            return term.map_args(self.apply)
-        return term
+        if not self._mapping:
+            return term
+        term = self._resolve(term)
+        if not isinstance(term, TypeExpr) or not term.args:
+            return term
+
+        # Post-order rebuild with an explicit stack: ``False`` marks a term whose
+        # arguments still need visiting, ``True`` one whose arguments are on
+        # ``done`` and can be reassembled.  Unchanged nodes are reused as is and
+        # shared subterms are rebuilt once.
+        done: List[TypeTerm] = []
+        rebuilt: Dict[int, TypeTerm] = {}
+        stack: List[Tuple[TypeTerm, bool]] = [(term, False)]
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                count = len(node.args)  # type: ignore[union-attr]
+                args = tuple(done[-count:])
+                del done[-count:]
+                if all(new is old for new, old in zip(args, node.args)):  # type: ignore[union-attr]
+                    result: TypeTerm = node
+                else:
+                    result = TypeExpr.intern(node.head, args)  # type: ignore[union-attr]
+                rebuilt[id(node)] = result
+                done.append(result)
+                continue
+            node = self._resolve(node)
+            if isinstance(node, TypeExpr) and node.args:
+                previous = rebuilt.get(id(node))
+                if previous is not None:
+                    done.append(previous)
+                    continue
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in reversed(node.args))
+            else:
+                done.append(node)
+        return done[0]
 
     def merged(self) -> Dict[str, TypeTerm]:  # pragma: no cover - debugging helper
         return {var.name: self.apply(term) for var, term in self._mapping.items()}
@@ -166,7 +310,7 @@ def unify(left: TypeTerm, right: TypeTerm, substitution: Optional[Substitution]
     left = subst.apply(left)
     right = subst.apply(right)
 
-    if left == right:
+    if left is right or left == right:
         return subst
 
     if isinstance(left, TypeVar):
@@ -236,11 +380,14 @@ class ClassConstraint:
     target: TypeTerm
     metavariable: MetaVar
 
-    def key(self, substitution: Substitution) -> Tuple[str, str]:
-        """Canonical key used for memoisation."""
+    def key(self, substitution: Substitution) -> ConstraintKey:
+        """Canonical key used for memoisation.
+
+        Terms are frozen and hash structurally with the hash cached per node,
+        so the resolved term itself serves as the key without stringifying it.
+        """
 
-        term = substitution.apply(self.target)
-        return (self.type_class.name, repr(term))
+        return (self.type_class.name, substitution.apply(self.target))
 
 
 @dataclass(frozen=True)
@@ -282,12 +429,28 @@ class InstanceResolutionError(Exception):
     """Raised when a class constraint cannot be resolved."""
 
 
+def _head_key(term: TypeTerm) -> Optional[Tuple[str, int]]:
+    if isinstance(term, TypeExpr):
+        return term.head, len(term.args)
+    return None
+
+
 class TypeClassEnvironment:
     """Registry storing type classes and their instances."""
 
     def __init__(self, equality: Optional[ObservationalEquality] = None) -> None:
         self._instances: Dict[str, List[TypeClassInstance]] = {}
+        # Per class, instances bucketed by the (constructor, arity) of their
+        # head, ``None`` collecting variable heads.  Entries carry their
+        # registration index so candidates keep the declaration order.
+        self._by_head: Dict[
+            str, Dict[Optional[Tuple[str, int]], List[Tuple[int, TypeClassInstance]]]
+        ] = {}
         self._equality = equality or ObservationalEquality()
+        # Resolved dictionaries shared by every solver over this environment.
+        # They only depend on the registered instances, so the cache is dropped
+        # whenever a new instance is added.
+        self._solution_cache: Dict[ConstraintKey, Mapping[str, Any]] = {}
 
     @property
     def equality(self) -> ObservationalEquality:
@@ -295,10 +458,41 @@ class TypeClassEnvironment:
 
     def add_instance(self, type_class: TypeClass, instance: TypeClassInstance) -> None:
         instances = self._instances.setdefault(type_class.name, [])
+        buckets = self._by_head.setdefault(type_class.name, {})
+        buckets.setdefault(_head_key(instance.head), []).append((len(instances), instance))
         instances.append(instance)
+        self._solution_cache.clear()
+
+    def instances_for(
+        self, type_class: TypeClass, target: Optional[TypeTerm] = None
+    ) -> Sequence[TypeClassInstance]:
+        """Return the instances of ``type_class`` in declaration order.
+
+        With a ``target`` the result is narrowed to instances whose head could
+        match it: the same constructor and arity, or a variable head.
+        """
+
+        key = None if target is None else _head_key(target)
+        if key is None:
+            return tuple(self._instances.get(type_class.name, ()))
+        buckets = self._by_head.get(type_class.name, {})
+        specific = buckets.get(key, ())
+        generic = buckets.get(None, ())
+        if not generic:
+            return tuple(instance for _, instance in specific)
+        if not specific:
+            return tuple(instance for _, instance in generic)
+        return tuple(instance for _, instance in heapq.merge(specific, generic, key=itemgetter(0)))
+
+    def cached_solution(self, key: ConstraintKey) -> Optional[Mapping[str, Any]]:
+        """Return the dictionary previously resolved for ``key``, if any."""
+
+        return self._solution_cache.get(key)
 
-    def instances_for(self, type_class: TypeClass) -> Sequence[TypeClassInstance]:
-        return tuple(self._instances.get(type_class.name, ()))
+    def cache_solution(self, key: ConstraintKey, dictionary: Mapping[str, Any]) -> None:
+        """Remember ``dictionary`` as the resolution of ``key``."""
+
+        self._solution_cache[key] = dictionary
 
 
 class ConstraintSolver:
@@ -306,26 +500,46 @@ class ConstraintSolver:
 
     def __init__(self, environment: TypeClassEnvironment) -> None:
         self._environment = environment
-        self._memo: Dict[Tuple[str, str], Mapping[str, Any]] = {}
 
     def solve_all(self, constraints: Iterable[ClassConstraint]) -> Dict[str, Mapping[str, Any]]:
+        """Resolve every constraint, keyed by the name of its metavariable.
+
+        Constraints share one empty substitution for their keys and duplicates
+        are coalesced, so each distinct (class, target) pair is resolved once
+        per batch even when the environment cache is cleared in between.
+        """
+
         solutions: Dict[str, Mapping[str, Any]] = {}
+        resolved: Dict[ConstraintKey, Mapping[str, Any]] = {}
+        substitution = Substitution()
+        active: Set[ConstraintKey] = set()
         for constraint in constraints:
-            dictionary = self._solve_constraint(constraint, active=())
+            key = constraint.key(substitution)
+            dictionary = resolved.get(key)
+            if dictionary is None:
+                dictionary = self._solve_constraint(constraint, active=active, key=key)
+                resolved[key] = dictionary
             solutions[constraint.metavariable.name] = dictionary
         return solutions
 
-    def _solve_constraint(self, constraint: ClassConstraint, *, active: Tuple[Tuple[str, str], ...]) -> Mapping[str, Any]:
-        substitution = Substitution()
-        key = constraint.key(substitution)
-        if key in self._memo:
-            return self._memo[key]
+    def _solve_constraint(
+        self,
+        constraint: ClassConstraint,
+        *,
+        active: Set[ConstraintKey],
+        key: Optional[ConstraintKey] = None,
+    ) -> Mapping[str, Any]:
+        if key is None:
+            key = constraint.key(Substitution())
+        cached = self._environment.cached_solution(key)
+        if cached is not None:
+            return cached
         if key in active:
             raise InstanceResolutionError(
                 f"Cycle detected while resolving {constraint.type_class.name} for {constraint.target}"
             )
 
-        candidates = self._environment.instances_for(constraint.type_class)
+        candidates = self._environment.instances_for(constraint.type_class, constraint.target)
         for instance in candidates:
             try:
                 substitution, prerequisites = instance.instantiate(constraint)
@@ -333,16 +547,18 @@ class ConstraintSolver:
                 continue
 
             prereq_solutions: Dict[str, Mapping[str, Any]] = {}
-            for prereq_constraint, hint in prerequisites:
-                solution = self._solve_constraint(
-                    prereq_constraint,
-                    active=active + (key,),
-                )
-                prereq_solutions[hint] = solution
+            active.add(key)
+            try:
+                for prereq_constraint, hint in prerequisites:
+                    prereq_solutions[hint] = self._solve_constraint(
+                        prereq_constraint, active=active
+                    )
+            finally:
+                active.discard(key)
 
             dictionary = instance.builder(prereq_solutions, substitution, self._environment.equality)
             constraint.type_class.validate_dictionary(dictionary, self._environment.equality)
-            self._memo[key] = dictionary
+            self._environment.cache_solution(key, dictionary)
             return dictionary
 
         raise InstanceResolutionError(
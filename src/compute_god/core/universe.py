@@ -2,13 +2,59 @@
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass, field
-from typing import Iterable, List, MutableMapping, Optional, Sequence
+from typing import Dict, FrozenSet, Iterable, List, MutableMapping, Optional, Sequence, Tuple
 
 from .observer import NoopObserver, Observer
-from .rules import Rule
+from .rules import ApplyFn, PredicateFn, Rule
 from .types import RuleContext, State
 
+RuleRecord = Tuple[str, Optional[PredicateFn], ApplyFn, Optional[PredicateFn]]
+DependencyRecord = Tuple[
+    str,
+    Optional[PredicateFn],
+    ApplyFn,
+    Optional[PredicateFn],
+    Optional[FrozenSet[str]],
+    Optional[Tuple[str, ...]],
+]
+
+
+def _guard_for(rule: Rule) -> Optional[PredicateFn]:
+    """Return ``rule.should_fire``, memoised on the watched values if declared.
+
+    ``None`` stands for a rule that always fires, letting the engine skip the
+    call entirely.
+    """
+
+    if rule.guard is None:
+        return None if type(rule).should_fire is Rule.should_fire else rule.should_fire
+    if not rule.watches:
+        return rule.should_fire
+
+    watches = rule.watches
+    should_fire = rule.should_fire
+    missing = object()
+    last: List[object] = [missing, False]
+
+    def memoised(state: State, ctx: RuleContext) -> bool:
+        fingerprint = tuple([state.get(key) for key in watches])
+        if fingerprint != last[0]:
+            last[0] = fingerprint
+            last[1] = should_fire(state, ctx)
+        return last[1]
+
+    return memoised
+
+
+def _stop_for(rule: Rule) -> Optional[PredicateFn]:
+    """Return ``rule.should_stop`` or ``None`` for a rule that never stops."""
+
+    if rule.until is None and type(rule).should_stop is Rule.should_stop:
+        return None
+    return rule.should_stop
+
 
 @dataclass(frozen=True)
 class Universe:
@@ -17,14 +63,74 @@ class Universe:
     state: State
     rules: Sequence[Rule]
     observers: Sequence[Observer] = field(default_factory=lambda: (NoopObserver(),))
+    ordered_rules: Tuple[Rule, ...] = field(init=False, repr=False, compare=False)
+    rule_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    rule_priorities: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    rule_guards: Tuple[Optional[PredicateFn], ...] = field(init=False, repr=False, compare=False)
+    rule_applies: Tuple[ApplyFn, ...] = field(init=False, repr=False, compare=False)
+    rule_stops: Tuple[Optional[PredicateFn], ...] = field(init=False, repr=False, compare=False)
+    rule_reads: Tuple[Optional[FrozenSet[str]], ...] = field(init=False, repr=False, compare=False)
+    rule_writes: Tuple[Optional[Tuple[str, ...]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    rule_records: Tuple[RuleRecord, ...] = field(init=False, repr=False, compare=False)
+    dependency_records: Optional[Tuple[DependencyRecord, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    unconditional: bool = field(init=False, repr=False, compare=False)
+    _by_role: Dict[Optional[str], Tuple[Rule, ...]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        for rule in self.rules:
+            body = getattr(rule.apply, "__wrapped__", rule.apply)
+            if inspect.iscoroutinefunction(rule.apply) or inspect.iscoroutinefunction(body):
+                raise TypeError(f"Async rules are not supported in sync execution: {rule.name!r}")
+        # ``rules`` never changes for a given universe, so the priority order is
+        # resolved once here instead of on every epoch of the engine loop.
+        ordered = tuple(sorted(self.rules, key=lambda r: r.priority, reverse=True))
+        object.__setattr__(self, "ordered_rules", ordered)
+        # One column per rule attribute, with bound methods resolved up front
+        # and trivial guards/stops left as ``None``, so the engine's inner loop
+        # performs neither attribute lookups nor no-op predicate calls.
+        names = tuple(rule.name for rule in ordered)
+        guards = tuple(_guard_for(rule) for rule in ordered)
+        applies = tuple(rule.apply for rule in ordered)
+        stops = tuple(_stop_for(rule) for rule in ordered)
+        object.__setattr__(self, "rule_names", names)
+        object.__setattr__(self, "rule_priorities", tuple(rule.priority for rule in ordered))
+        object.__setattr__(self, "rule_guards", guards)
+        object.__setattr__(self, "rule_applies", applies)
+        object.__setattr__(self, "rule_stops", stops)
+        object.__setattr__(self, "rule_records", tuple(zip(names, guards, applies, stops)))
+        unconditional = all(guard is None for guard in guards) and all(
+            stop is None for stop in stops
+        )
+        object.__setattr__(self, "unconditional", unconditional)
+        reads = tuple(rule.reads for rule in ordered)
+        writes = tuple(
+            None if rule.writes is None else tuple(sorted(rule.writes)) for rule in ordered
+        )
+        object.__setattr__(self, "rule_reads", reads)
+        object.__setattr__(self, "rule_writes", writes)
+        # Worklist scheduling only pays off once some rule declares its inputs.
+        dependency_records = None
+        if any(read is not None for read in reads):
+            dependency_records = tuple(zip(names, guards, applies, stops, reads, writes))
+        object.__setattr__(self, "dependency_records", dependency_records)
 
     def sorted_rules(self) -> List[Rule]:
-        return sorted(self.rules, key=lambda r: r.priority, reverse=True)
+        return list(self.ordered_rules)
 
     def rules_by_role(self, role: Optional[str]) -> List[Rule]:
         if role is None:
             return self.sorted_rules()
-        return [rule for rule in self.sorted_rules() if rule.role == role]
+        selected = self._by_role.get(role)
+        if selected is None:
+            selected = tuple(rule for rule in self.ordered_rules if rule.role == role)
+            self._by_role[role] = selected
+        return list(selected)
 
 
 class _RuleContextImpl:
@@ -23,21 +23,34 @@ used in both tests and playful exploratory notebooks.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional, Tuple
+from itertools import islice
+from typing import Dict, Iterable, List, MutableSequence, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
 
 __all__ = [
     "StimulusProfile",
+    "StimulusBatch",
     "ADHDResponse",
     "ADHDProfile",
     "CoefficientOfEngagement",
     "simulate_coe",
+    "simulate_coe_array",
 ]
 
+ArrayLike = Union[Sequence[float], "np.ndarray"]
+
 
 def _clamp(value: float, /, lower: float = 0.0, upper: float = 1.0) -> float:
     """Return ``value`` forced to lie inside ``[lower, upper]``."""
 
+    # Explicit comparisons beat ``min(upper, max(lower, value))`` by a wide
+    # margin on CPython: the builtins pay for two calls and argument parsing.
     if value < lower:
         return lower
     if value > upper:
@@ -80,8 +93,62 @@ class StimulusProfile:
             duration = 0.0
         object.__setattr__(self, "duration", duration)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        novelty: ArrayLike,
+        structure: ArrayLike,
+        reward: ArrayLike,
+        duration: Optional[ArrayLike] = None,
+    ) -> "StimulusBatch":
+        """Build a :class:`StimulusBatch` from one array per field.
+
+        The clamping of ``__post_init__`` is applied to whole columns instead
+        of per instance: novelty, structure and reward share a single
+        ``np.clip`` and durations are floored at zero.  ``duration`` defaults
+        to ones.
+        """
+
+        if np is None:  # pragma: no cover - exercised only without numpy
+            raise ImportError("StimulusProfile.from_arrays requires numpy")
+
+        novelty = np.asarray(novelty, dtype=np.float64)
+        structure = np.asarray(structure, dtype=np.float64)
+        reward = np.asarray(reward, dtype=np.float64)
+        if duration is None:
+            duration = np.ones_like(novelty)
+        else:
+            duration = np.maximum(np.asarray(duration, dtype=np.float64), 0.0)
+        if novelty.ndim != 1 or not (
+            novelty.shape == structure.shape == reward.shape == duration.shape
+        ):
+            raise ValueError("stimulus arrays must be one-dimensional and of equal length")
+
+        columns = np.stack((novelty, structure, reward))
+        np.clip(columns, 0.0, 1.0, out=columns)
+        return StimulusBatch(
+            novelty=columns[0], structure=columns[1], reward=columns[2], duration=duration
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class StimulusBatch:
+    """Column-wise batch of stimuli, one ``float64`` array per field.
+
+    Created through :meth:`StimulusProfile.from_arrays`, which performs the
+    clamping; the constructor itself does not validate.
+    """
+
+    novelty: "np.ndarray"
+    structure: "np.ndarray"
+    reward: "np.ndarray"
+    duration: "np.ndarray"
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self.novelty)
+
+
+@dataclass(slots=True)
 class ADHDResponse:
     """Outcome of a single :meth:`ADHDProfile.respond` invocation."""
 
@@ -97,7 +164,10 @@ class ADHDResponse:
         return self.focus, self.regulation, self.energy, self.engagement, self.duration
 
 
-@dataclass
+_RESPONSE_FIELDS = ("focus", "regulation", "energy", "engagement", "duration")
+
+
+@dataclass(slots=True)
 class ADHDProfile:
     """Simple attention profile reacting deterministically to stimuli.
 
@@ -121,33 +191,25 @@ class ADHDProfile:
         novelty_delta = stimulus.novelty - 0.5
         structure_delta = stimulus.structure - 0.5
         reward_delta = stimulus.reward - 0.5
+        # Each weighted delta feeds two of the metrics; computing it once keeps
+        # the same products (and so the same rounding) as the batched path.
+        novelty_term = self.novelty_bias * novelty_delta
+        structure_term = self.structure_bias * structure_delta
+        reward_term = self.reward_bias * reward_delta
+        variability = self.variability
 
-        target_focus = _clamp(
-            self.baseline_focus
-            + self.novelty_bias * novelty_delta
-            + self.structure_bias * structure_delta
-            + self.reward_bias * reward_delta
-        )
+        target_focus = _clamp(self.baseline_focus + novelty_term + structure_term + reward_term)
 
-        if self._last_focus is None:
+        last_focus = self._last_focus
+        if last_focus is None:
             focus = target_focus
         else:
-            focus = _clamp(
-                self._last_focus + self.variability * (target_focus - self._last_focus)
-            )
+            focus = _clamp(last_focus + variability * (target_focus - last_focus))
 
         self._last_focus = focus
 
-        regulation = _clamp(
-            0.5
-            + self.structure_bias * structure_delta
-            - self.variability * novelty_delta
-        )
-        energy = _clamp(
-            0.5
-            + self.novelty_bias * novelty_delta
-            + self.reward_bias * reward_delta
-        )
+        regulation = _clamp(0.5 + structure_term - variability * novelty_delta)
+        energy = _clamp(0.5 + novelty_term + reward_term)
         engagement = _clamp((focus + regulation + energy) / 3)
 
         return ADHDResponse(
@@ -158,25 +220,98 @@ class ADHDProfile:
             duration=stimulus.duration,
         )
 
+    def respond_many(self, stimuli: Iterable[StimulusProfile], /) -> List[ADHDResponse]:
+        """Respond to each of ``stimuli`` in order, as repeated :meth:`respond`.
+
+        With NumPy available the stateless metrics of the whole batch are
+        computed and clamped together; only the focus inertia runs step by
+        step.  The responses and the stored focus match the one-by-one calls.
+        """
+
+        stimuli = list(stimuli)
+        if np is None:
+            return [self.respond(stimulus) for stimulus in stimuli]
+
+        novelty = np.array([stimulus.novelty for stimulus in stimuli], dtype=np.float64)
+        structure = np.array([stimulus.structure for stimulus in stimuli], dtype=np.float64)
+        reward = np.array([stimulus.reward for stimulus in stimuli], dtype=np.float64)
+        target, regulation, energy = _bias_metrics(self, novelty, structure, reward)
+        focus, self._last_focus = _focus_kernel(target.tolist(), self.variability, self._last_focus)
+        engagement = _engagement(np.array(focus, dtype=np.float64), regulation, energy)
+
+        return [
+            ADHDResponse(
+                focus=focus_value,
+                regulation=regulation_value,
+                energy=energy_value,
+                engagement=engagement_value,
+                duration=stimulus.duration,
+            )
+            for focus_value, regulation_value, energy_value, engagement_value, stimulus in zip(
+                focus, regulation.tolist(), energy.tolist(), engagement.tolist(), stimuli
+            )
+        ]
+
+    def respond_batch(
+        self, batch: StimulusBatch, /
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Respond to every stimulus of ``batch`` without building objects.
+
+        Returns the ``focus``, ``regulation``, ``energy`` and ``engagement``
+        arrays; the stored focus ends up as after the equivalent sequence of
+        :meth:`respond` calls.
+        """
+
+        target, regulation, energy = _bias_metrics(
+            self, batch.novelty, batch.structure, batch.reward
+        )
+        focus_values, self._last_focus = _focus_kernel(
+            target.tolist(), self.variability, self._last_focus
+        )
+        focus = np.array(focus_values, dtype=np.float64)
+        engagement = _engagement(focus, regulation, energy)
+        return focus, regulation, energy, engagement
+
     def reset(self) -> None:
         """Forget the stored focus level so the next response starts fresh."""
 
         self._last_focus = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CoefficientOfEngagement:
-    """Track a smoothed engagement score over successive responses."""
+    """Track a smoothed engagement score over successive responses.
+
+    By default every coefficient value and response is retained.  A positive
+    ``window_capacity`` switches to streaming mode: ``history`` and
+    ``responses`` become bounded deques holding only the latest
+    ``window_capacity`` entries, so memory stays constant over arbitrarily
+    long runs while :meth:`trend` and :meth:`is_stable` keep working for
+    windows up to that size.
+    """
 
     smoothing: float = 0.25
+    window_capacity: int = 0
     value: Optional[float] = field(default=None, init=False)
-    history: List[float] = field(default_factory=list, init=False)
-    responses: List[ADHDResponse] = field(default_factory=list, init=False)
+    history: MutableSequence[float] = field(default_factory=list, init=False)
+    responses: MutableSequence[ADHDResponse] = field(default_factory=list, init=False)
+
+    def __post_init__(self) -> None:
+        if self.window_capacity < 0:
+            raise ValueError("window_capacity must be non-negative")
+        if self.window_capacity:
+            self.history = deque(maxlen=self.window_capacity)
+            self.responses = deque(maxlen=self.window_capacity)
 
     def observe(self, response: ADHDResponse, /) -> float:
-        """Ingest ``response`` and update the coefficient value."""
+        """Ingest ``response`` and update the coefficient value.
 
-        alpha = _clamp(self.smoothing * max(response.duration, 0.0))
+        ``response.duration`` is expected to be non-negative, as guaranteed by
+        :class:`StimulusProfile`; the clamped weight already maps a negative
+        product to ``0`` for a non-negative ``smoothing``.
+        """
+
+        alpha = _clamp(self.smoothing * response.duration)
 
         if self.value is None:
             self.value = response.engagement
@@ -187,15 +322,46 @@ class CoefficientOfEngagement:
         self.responses.append(response)
         return self.value
 
+    def observe_many(self, responses: Iterable[ADHDResponse], /) -> List[float]:
+        """Ingest ``responses`` in order, as repeated :meth:`observe`.
+
+        The moving average runs in one tight loop and the history and
+        responses are extended once.  Returns the coefficient after
+        each response.
+        """
+
+        responses = list(responses)
+        values = self._ingest(
+            [response.engagement for response in responses],
+            [response.duration for response in responses],
+        )
+        self.responses.extend(responses)
+        return values
+
+    def _ingest(self, engagement: List[float], durations: List[float]) -> List[float]:
+        """Advance the average over raw engagement values; ``responses`` is untouched."""
+
+        smoothing = self.smoothing
+        alphas = [_clamp(smoothing * duration) for duration in durations]
+        values = _ema_kernel(engagement, alphas, self.value)
+        if values:
+            self.value = values[-1]
+            self.history.extend(values)
+        return values
+
     def trend(self, window: int = 3) -> float:
         """Return the average of the last ``window`` observations."""
 
         if window <= 0:
             raise ValueError("window must be positive")
-        if len(self.history) < window:
+        history = self.history
+        if len(history) < window:
             raise ValueError("not enough observations to compute trend")
-        recent = self.history[-window:]
-        return sum(recent) / len(recent)
+        # Read the window from the end, which deques support in O(window)
+        # too, and sum it oldest first.
+        recent = list(islice(reversed(history), window))
+        recent.reverse()
+        return sum(recent) / window
 
     def is_stable(self, *, epsilon: float = 0.05, window: int = 3) -> bool:
         """Check if the coefficient has stabilised within ``epsilon``."""
@@ -204,9 +370,25 @@ class CoefficientOfEngagement:
             raise ValueError("window must be greater than one")
         if len(self.history) < window:
             return False
-        segment = self.history[-window:]
+        segment = list(islice(reversed(self.history), window))
         return max(segment) - min(segment) <= epsilon
 
+    def as_soa(self) -> Dict[str, "np.ndarray"]:
+        """Return the observed responses as one ``float64`` array per field.
+
+        The keys follow :meth:`ADHDResponse.as_tuple`.  Aggregates over many
+        responses (mean focus, engagement spread, …) then run as single NumPy
+        reductions over contiguous columns.
+        """
+
+        if np is None:  # pragma: no cover - exercised only without numpy
+            raise ImportError("CoefficientOfEngagement.as_soa requires numpy")
+
+        table = np.array(
+            [response.as_tuple() for response in self.responses], dtype=np.float64
+        ).reshape(-1, len(_RESPONSE_FIELDS))
+        return {name: table[:, column].copy() for column, name in enumerate(_RESPONSE_FIELDS)}
+
     def reset(self) -> None:
         """Clear stored observations and the current value."""
 
@@ -220,6 +402,7 @@ def simulate_coe(
     stimuli: Iterable[StimulusProfile],
     *,
     smoothing: float = 0.25,
+    return_responses: bool = True,
 ) -> Tuple[CoefficientOfEngagement, List[ADHDResponse]]:
     """Convenience helper to run ``profile`` over ``stimuli``.
 
@@ -233,6 +416,10 @@ def simulate_coe(
     smoothing:
         Initial smoothing factor for the created
         :class:`CoefficientOfEngagement`.
+    return_responses:
+        When ``False`` no :class:`ADHDResponse` objects are built: the
+        engagement scores go straight into the tracker, whose ``responses``
+        stay empty, and an empty list is returned in their place.
 
     Returns
     -------
@@ -242,12 +429,181 @@ def simulate_coe(
     """
 
     tracker = CoefficientOfEngagement(smoothing=smoothing)
-    responses: List[ADHDResponse] = []
+    if return_responses:
+        responses = profile.respond_many(stimuli)
+        tracker.observe_many(responses)
+        return tracker, responses
+
+    stimuli = list(stimuli)
+    durations = [stimulus.duration for stimulus in stimuli]
+    if np is None:  # pragma: no cover - exercised only without numpy
+        engagement = [profile.respond(stimulus).engagement for stimulus in stimuli]
+    else:
+        batch = StimulusBatch(
+            novelty=np.array([stimulus.novelty for stimulus in stimuli], dtype=np.float64),
+            structure=np.array([stimulus.structure for stimulus in stimuli], dtype=np.float64),
+            reward=np.array([stimulus.reward for stimulus in stimuli], dtype=np.float64),
+            duration=np.array(durations, dtype=np.float64),
+        )
+        engagement = profile.respond_batch(batch)[3].tolist()
+    tracker._ingest(engagement, durations)
+    return tracker, []
+
+
+def _bias_metrics(
+    profile: ADHDProfile,
+    novelty: "np.ndarray",
+    structure: "np.ndarray",
+    reward: "np.ndarray",
+) -> "np.ndarray":
+    """Return target focus, regulation and energy as the rows of one array.
+
+    The three raw metrics of :meth:`ADHDProfile.respond` are affine in the
+    stimulus deltas, so they are evaluated together as ``offsets + weights @
+    deltas`` into a single ``(3, n)`` buffer and clamped with one in-place
+    ``np.clip``.  The product is accumulated term by term following
+    :data:`_BIAS_TERMS`, so every row adds its terms in the order of the
+    scalar expressions (zero weights add exactly nothing), rather than
+    through BLAS, whose fused multiply-adds would drift from
+    :meth:`~ADHDProfile.respond` in the last bit.
+    """
+
+    deltas = np.stack((novelty, structure, reward))
+    deltas -= 0.5
+    offsets, weights = _bias_coefficients(profile)
+
+    metrics = np.empty_like(deltas)
+    scratch = np.empty_like(deltas)
+    metrics[...] = offsets
+    for term, column in enumerate(_BIAS_TERMS):
+        np.multiply(weights[:, term, None], deltas[column], out=scratch)
+        metrics += scratch
+    np.clip(metrics, 0.0, 1.0, out=metrics)
+    return metrics
+
+
+def _engagement(
+    focus: "np.ndarray", regulation: "np.ndarray", energy: "np.ndarray"
+) -> "np.ndarray":
+    """Return the clamped mean of the three metrics, reusing one buffer."""
+
+    engagement = np.add(focus, regulation)
+    engagement += energy
+    engagement /= 3
+    np.clip(engagement, 0.0, 1.0, out=engagement)
+    return engagement
+
+
+# Delta (novelty, structure, reward) multiplied by each weight column.
+# Regulation adds its structure term before its novelty term while the other
+# rows go novelty first, hence novelty appears twice with one zero per row.
+_BIAS_TERMS = (0, 1, 0, 2)
+
+
+def _bias_coefficients(profile: ADHDProfile) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the ``(3, 1)`` offsets and ``(3, 4)`` weights of the metrics.
+
+    Rows are target focus, regulation and energy; columns are the terms of
+    :data:`_BIAS_TERMS`.  Built per call since profiles are mutable.
+    """
+
+    novelty_bias = profile.novelty_bias
+    structure_bias = profile.structure_bias
+    reward_bias = profile.reward_bias
+    offsets = np.array([[profile.baseline_focus], [0.5], [0.5]], dtype=np.float64)
+    weights = np.array(
+        [
+            [novelty_bias, structure_bias, 0.0, reward_bias],
+            [0.0, structure_bias, -profile.variability, 0.0],
+            [novelty_bias, 0.0, 0.0, reward_bias],
+        ],
+        dtype=np.float64,
+    )
+    return offsets, weights
+
+
+def _focus_kernel(
+    targets: List[float], variability: float, last: Optional[float]
+) -> Tuple[List[float], Optional[float]]:
+    """Run the focus inertia of :meth:`ADHDProfile.respond` over ``targets``.
+
+    Returns the focus levels and the final stored focus.  The clamp is
+    inlined and a fresh profile's first step is peeled off the loop, so the
+    body left for the interpreter is plain float arithmetic and two
+    comparisons.
+    """
+
+    focus: List[float] = []
+    append = focus.append
+    remaining = iter(targets)
+    if last is None:
+        last = next(remaining, None)
+        if last is None:
+            return focus, None
+        append(last)
+    for target in remaining:
+        last = last + variability * (target - last)
+        if last < 0.0:
+            last = 0.0
+        elif last > 1.0:
+            last = 1.0
+        append(last)
+    return focus, last
+
+
+def _ema_kernel(
+    engagement: List[float], alphas: List[float], value: Optional[float]
+) -> List[float]:
+    """Run the :meth:`CoefficientOfEngagement.observe` average from ``value``.
+
+    ``alphas`` holds the already clamped per-step smoothing weights; the
+    coefficient after every step is returned.
+    """
+
+    history: List[float] = []
+    append = history.append
+    for current, alpha in zip(engagement, alphas):
+        if value is None:
+            value = current
+        else:
+            value = (1 - alpha) * value + alpha * current
+        append(value)
+    return history
+
+
+def simulate_coe_array(
+    profile: ADHDProfile,
+    novelty: ArrayLike,
+    structure: ArrayLike,
+    reward: ArrayLike,
+    duration: Optional[ArrayLike] = None,
+    *,
+    smoothing: float = 0.25,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Array counterpart of :func:`simulate_coe` for large stimulus batches.
+
+    The stimuli are given column-wise as one array per
+    :class:`StimulusProfile` field (``duration`` defaults to ones) and are
+    clamped the same way.  Every metric except focus is computed with
+    vectorised NumPy operations; the focus inertia and the engagement moving
+    average are recurrences and run as plain scalar loops, without building
+    any response objects.  ``profile`` carries its focus over exactly as after
+    the equivalent sequence of :meth:`ADHDProfile.respond` calls.
+
+    Returns
+    -------
+    tuple
+        The ``focus``, ``regulation``, ``energy`` and ``engagement`` arrays
+        followed by the coefficient history.
+    """
 
-    for stimulus in stimuli:
-        response = profile.respond(stimulus)
-        responses.append(response)
-        tracker.observe(response)
+    if np is None:  # pragma: no cover - exercised only without numpy
+        raise ImportError("simulate_coe_array requires numpy")
 
-    return tracker, responses
+    batch = StimulusProfile.from_arrays(novelty, structure, reward, duration)
+    focus, regulation, energy, engagement = profile.respond_batch(batch)
+    alphas = np.multiply(batch.duration, smoothing)
+    np.clip(alphas, 0.0, 1.0, out=alphas)
+    history = _ema_kernel(engagement.tolist(), alphas.tolist(), None)
 
+    return focus, regulation, energy, engagement, np.array(history, dtype=np.float64)
@@ -37,8 +37,16 @@ scaffolding rather than a cryptographically accurate model.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
+
+ArrayLike = Union[float, Sequence[float], "np.ndarray"]
 
 
 @dataclass(frozen=True)
@@ -81,6 +89,9 @@ class QuantumAttackSurface:
     quantum_speedup: float
     required_security_bits: float
     decoherence_rate: float
+    # ``log2(quantum_speedup)``: the security bits the speedup removes,
+    # resolved once since every evaluation against this surface needs it.
+    _speedup_bits: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.quantum_speedup <= 0:
@@ -89,6 +100,7 @@ class QuantumAttackSurface:
             raise ValueError("required_security_bits must be strictly positive")
         if self.decoherence_rate <= 0:
             raise ValueError("decoherence_rate must be strictly positive")
+        object.__setattr__(self, "_speedup_bits", math.log2(self.quantum_speedup))
 
 
 @dataclass(frozen=True)
@@ -105,8 +117,7 @@ class AntiQuantumDual:
 def _effective_security(algorithm: AntiQuantumAlgorithm, attack: QuantumAttackSurface) -> float:
     """Return the remaining security bits after accounting for the speedup."""
 
-    speedup_bits = math.log2(attack.quantum_speedup)
-    return algorithm.security_bits - speedup_bits
+    return algorithm.security_bits - attack._speedup_bits
 
 
 def _decoherence_margin(algorithm: AntiQuantumAlgorithm, attack: QuantumAttackSurface) -> float:
@@ -115,6 +126,7 @@ def _decoherence_margin(algorithm: AntiQuantumAlgorithm, attack: QuantumAttackSu
     return algorithm.noise_budget - attack.decoherence_rate
 
 
+@lru_cache(maxsize=4096)
 def anti_quantum_dual(
     algorithm: AntiQuantumAlgorithm, attack: QuantumAttackSurface
 ) -> Optional[AntiQuantumDual]:
@@ -123,15 +135,20 @@ def anti_quantum_dual(
     The dual is only returned when both the effective security bits and the
     decoherence margin remain above the requirements posed by the attacker.
     ``None`` is used to signal that the scheme falls short.
+
+    Both arguments are frozen dataclasses, so results are memoised on their
+    field values: sweeps revisiting a pair get the same (immutable) dual back.
+    ``anti_quantum_dual.cache_clear()`` empties the cache.
     """
 
-    effective_security_bits = _effective_security(algorithm, attack)
+    # The decoherence margin is the cheaper test, so it rejects first and the
+    # security bits are only derived for schemes that survive it.
     decoherence_margin = _decoherence_margin(algorithm, attack)
-
-    if effective_security_bits < attack.required_security_bits:
-        return None
     if decoherence_margin < 0:
         return None
+    effective_security_bits = _effective_security(algorithm, attack)
+    if effective_security_bits < attack.required_security_bits:
+        return None
 
     # ``duality_index`` provides a compact indicator balancing the security and
     # decoherence margins.  Values close to ``1`` mean the scheme sits right at
@@ -149,6 +166,101 @@ def anti_quantum_dual(
     )
 
 
+def anti_quantum_dual_batch(
+    security_bits: ArrayLike,
+    noise_budget: ArrayLike,
+    quantum_speedup: ArrayLike,
+    required_security_bits: ArrayLike,
+    decoherence_rate: ArrayLike,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Evaluate :func:`anti_quantum_dual` over arrays of parameters.
+
+    The arguments are the numeric fields of :class:`AntiQuantumAlgorithm` and
+    :class:`QuantumAttackSurface` given column-wise; they broadcast against
+    each other, so algorithm columns of shape ``(n, 1)`` and attack columns of
+    shape ``(m,)`` evaluate the whole ``n × m`` grid in one pass.
+
+    Returns ``(withstands, effective_security_bits, decoherence_margin,
+    duality_index)``.  ``withstands`` marks the entries for which
+    :func:`anti_quantum_dual` returns a dual rather than ``None``; the other
+    arrays are filled for every entry so callers can inspect near misses and
+    build :class:`AntiQuantumDual` instances only for the passing ones.
+    """
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        raise ImportError("anti_quantum_dual_batch requires numpy")
+
+    security_bits, noise_budget, quantum_speedup, required_security_bits, decoherence_rate = (
+        _batch_columns(
+            security_bits, noise_budget, quantum_speedup, required_security_bits, decoherence_rate
+        )
+    )
+    effective_security_bits = security_bits - np.log2(quantum_speedup)
+    decoherence_margin = noise_budget - decoherence_rate
+    withstands = (effective_security_bits >= required_security_bits) & (decoherence_margin >= 0)
+    duality_index = np.minimum(
+        effective_security_bits / required_security_bits, decoherence_margin / noise_budget
+    )
+    shape = withstands.shape
+    return (
+        withstands,
+        np.broadcast_to(effective_security_bits, shape).copy(),
+        np.broadcast_to(decoherence_margin, shape).copy(),
+        duality_index,
+    )
+
+
+def anti_quantum_duality_index(
+    security_bits: ArrayLike,
+    noise_budget: ArrayLike,
+    quantum_speedup: ArrayLike,
+    required_security_bits: ArrayLike,
+    decoherence_rate: ArrayLike,
+) -> "np.ndarray":
+    """Return only the duality index of :func:`anti_quantum_dual_batch`.
+
+    Entries for which :func:`anti_quantum_dual` would return ``None`` hold
+    ``-1.0``; a passing scheme always has a non-negative index, so the
+    sentinel is unambiguous.  Parameter sweeps that rank schemes by their
+    index get a single array back instead of four.
+    """
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        raise ImportError("anti_quantum_duality_index requires numpy")
+
+    security_bits, noise_budget, quantum_speedup, required_security_bits, decoherence_rate = (
+        _batch_columns(
+            security_bits, noise_budget, quantum_speedup, required_security_bits, decoherence_rate
+        )
+    )
+    effective_security_bits = security_bits - np.log2(quantum_speedup)
+    decoherence_margin = noise_budget - decoherence_rate
+    duality_index = np.minimum(
+        effective_security_bits / required_security_bits, decoherence_margin / noise_budget
+    )
+    # ``np.where`` rather than a masked assignment: scalar inputs give a
+    # NumPy scalar, which cannot be assigned into.
+    fails = (effective_security_bits < required_security_bits) | (decoherence_margin < 0)
+    return np.where(fails, -1.0, duality_index)
+
+
+def _batch_columns(*columns: ArrayLike) -> Tuple["np.ndarray", ...]:
+    """Return the batch parameters as ``float64`` arrays, checking positivity."""
+
+    names = (
+        "security_bits",
+        "noise_budget",
+        "quantum_speedup",
+        "required_security_bits",
+        "decoherence_rate",
+    )
+    arrays = tuple(np.asarray(column, dtype=np.float64) for column in columns)
+    for name, values in zip(names, arrays):
+        if np.any(values <= 0):
+            raise ValueError(f"{name} must be strictly positive")
+    return arrays
+
+
 # Playful Chinese aliases matching the tone of the project.
 抗量子算法 = AntiQuantumAlgorithm
 量子攻击面 = QuantumAttackSurface
@@ -160,6 +272,8 @@ __all__ = [
     "QuantumAttackSurface",
     "AntiQuantumDual",
     "anti_quantum_dual",
+    "anti_quantum_dual_batch",
+    "anti_quantum_duality_index",
     "抗量子算法",
     "量子攻击面",
     "抗量子对偶",
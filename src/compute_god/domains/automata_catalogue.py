@@ -17,18 +17,50 @@ callers can run quick experiments without pulling in third-party packages.
 
 from __future__ import annotations
 
+from array import array
 from collections import deque
-from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, MutableMapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
 
 
 Symbol = Optional[str]
+# A DFA state compiled to the mapping from each symbol to its successor's row.
+_Row = Dict[str, "_Row"]
+# Dense per-symbol transition matrices with the initial and final weight
+# vectors, plus ``(rows, columns, weights)`` triplets for the sparse symbols;
+# every symbol is in exactly one of the two mappings.
+_SparseSteps = Dict[str, Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]
+_MatrixForm = Tuple[Dict[str, "np.ndarray"], "np.ndarray", "np.ndarray", _SparseSteps]
+# A matrix with at least this many states and at most one entry in
+# ``_SPARSE_DENSITY`` non-zero is kept in sparse form only.
+_SPARSE_MIN_STATES = 128
+_SPARSE_DENSITY = 32
 
 
 class AutomatonError(ValueError):
     """Raised when an automaton is constructed with inconsistent data."""
 
 
+# Bound on the subset transitions an NFA remembers per symbol.
+_SUBSET_CACHE_LIMIT = 1 << 16
+
+
+def _successors(moves: Sequence[int], mask: int) -> int:
+    """Return the union of ``moves[i]`` over the set bits ``i`` of ``mask``."""
+
+    successors = 0
+    while mask:
+        lowest = mask & -mask
+        successors |= moves[lowest.bit_length() - 1]
+        mask ^= lowest
+    return successors
+
+
 @dataclass(frozen=True)
 class DeterministicFiniteAutomaton:
     """Minimal DFA simulator for educational experiments."""
@@ -38,6 +70,13 @@ class DeterministicFiniteAutomaton:
     transitions: Mapping[Tuple[str, str], str]
     initial_state: str
     accepting_states: frozenset[str]
+    _symbol_ids: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _rows: Tuple[_Row, ...] = field(init=False, repr=False, compare=False)
+    _initial_row: _Row = field(init=False, repr=False, compare=False)
+    _accepting_rows: frozenset[int] = field(init=False, repr=False, compare=False)
+    _accepting: Tuple[bool, ...] = field(init=False, repr=False, compare=False)
+    _initial_id: int = field(init=False, repr=False, compare=False)
+    _table: Optional["np.ndarray"] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - trivial validation
         if self.initial_state not in self.states:
@@ -49,17 +88,89 @@ class DeterministicFiniteAutomaton:
                 raise AutomatonError("transition references unknown state")
             if symbol not in self.alphabet:
                 raise AutomatonError("transition references unknown symbol")
+        self._compile()
+
+    def _compile(self) -> None:
+        """Number states and symbols and tabulate the transition function.
+
+        States and symbols get dense ids in sorted order.  For :meth:`accepts`
+        every state becomes a row mapping each symbol straight to the row of
+        its successor, so a step is a single dict probe: no ``(state,
+        symbol)`` tuple is hashed and no state id is looked up in between.
+        Rows are told apart by identity when checking acceptance (``_rows``
+        keeps every one of them alive, so ids stay unique).  With NumPy
+        available the function is also kept as an ``int32`` table with ``-1``
+        for missing transitions and one extra column mapping every state to
+        itself, used to pad words in :meth:`accepts_many`.
+        """
+
+        state_ids = {state: index for index, state in enumerate(sorted(self.states))}
+        symbol_ids = {symbol: index for index, symbol in enumerate(sorted(self.alphabet))}
+        successors: List[Dict[str, int]] = [{} for _ in state_ids]
+        linked: List[_Row] = [{} for _ in state_ids]
+        for (state, symbol), target in self.transitions.items():
+            successors[state_ids[state]][symbol] = state_ids[target]
+            linked[state_ids[state]][symbol] = linked[state_ids[target]]
+        accepting = tuple(state in self.accepting_states for state in sorted(self.states))
+        accepting_rows = frozenset(id(row) for row, flag in zip(linked, accepting) if flag)
+        object.__setattr__(self, "_symbol_ids", symbol_ids)
+        object.__setattr__(self, "_rows", tuple(linked))
+        object.__setattr__(self, "_initial_row", linked[state_ids[self.initial_state]])
+        object.__setattr__(self, "_accepting_rows", accepting_rows)
+        object.__setattr__(self, "_accepting", accepting)
+        object.__setattr__(self, "_initial_id", state_ids[self.initial_state])
+
+        table = None
+        if np is not None:
+            table = np.full((len(state_ids), len(symbol_ids) + 1), -1, dtype=np.int32)
+            table[:, -1] = np.arange(len(state_ids), dtype=np.int32)
+            for state, row in enumerate(successors):
+                for symbol, target in row.items():
+                    table[state, symbol_ids[symbol]] = target
+        object.__setattr__(self, "_table", table)
+
+    def _step_error(self, symbol: str) -> AutomatonError:
+        if symbol not in self.alphabet:
+            return AutomatonError(f"symbol {symbol!r} not in alphabet")
+        return AutomatonError("missing deterministic transition")
 
     def accepts(self, word: Sequence[str]) -> bool:
-        state = self.initial_state
-        for symbol in word:
-            if symbol not in self.alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not in alphabet")
+        row = self._initial_row
+        try:
+            for symbol in word:
+                row = row[symbol]
+        except KeyError:
+            raise self._step_error(symbol) from None
+        return id(row) in self._accepting_rows
+
+    def accepts_many(self, words: Iterable[Sequence[str]]) -> List[bool]:
+        """Return :meth:`accepts` for each of ``words``.
+
+        With NumPy the words are encoded as rows of symbol ids, padded with
+        the identity column, and all of them advance together: each position
+        is a single gather from the transition table.
+        """
+
+        words = list(words)
+        table = self._table
+        if table is None or not words:
+            return [self.accepts(word) for word in words]
+
+        symbol_ids = self._symbol_ids
+        ids = np.full((len(words), max(map(len, words))), table.shape[1] - 1, dtype=np.int32)
+        for row, word in enumerate(words):
             try:
-                state = self.transitions[(state, symbol)]
-            except KeyError:  # pragma: no cover - guard rail
-                raise AutomatonError("missing deterministic transition") from None
-        return state in self.accepting_states
+                ids[row, : len(word)] = [symbol_ids[symbol] for symbol in word]
+            except KeyError as error:
+                raise self._step_error(error.args[0]) from None
+
+        states = np.full(len(words), self._initial_id, dtype=np.int32)
+        for column in ids.T:
+            states = table[states, column]
+            if (states < 0).any():
+                raise AutomatonError("missing deterministic transition")
+        accepting = self._accepting
+        return [accepting[state] for state in states.tolist()]
 
 
 @dataclass(frozen=True)
@@ -71,6 +182,14 @@ class NondeterministicFiniteAutomaton:
     transitions: Mapping[Tuple[str, str], frozenset[str]]
     initial_states: frozenset[str]
     accepting_states: frozenset[str]
+    _state_bits: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _moves: Dict[str, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    _initial_mask: int = field(init=False, repr=False, compare=False)
+    _accepting_mask: int = field(init=False, repr=False, compare=False)
+    _subset_moves: Dict[str, Dict[int, int]] = field(init=False, repr=False, compare=False)
+    _dfa: Optional[DeterministicFiniteAutomaton] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:  # pragma: no cover - trivial validation
         if not self.initial_states <= self.states:
@@ -82,19 +201,108 @@ class NondeterministicFiniteAutomaton:
                 raise AutomatonError("transition references unknown state")
             if symbol not in self.alphabet:
                 raise AutomatonError("transition references unknown symbol")
+        self._compile()
+
+    def _mask(self, states: Iterable[str]) -> int:
+        bits = self._state_bits
+        mask = 0
+        for state in states:
+            mask |= 1 << bits[state]
+        return mask
+
+    def _compile(self) -> None:
+        """Encode state sets as integer bitmasks.
+
+        State ``i`` (in sorted order) is bit ``i``.  ``_moves[symbol][i]`` is
+        the mask of successors of state ``i`` on ``symbol``, with an entry for
+        every symbol of the alphabet so a failed lookup means an unknown
+        symbol.
+        """
+
+        object.__setattr__(
+            self, "_state_bits", {state: index for index, state in enumerate(sorted(self.states))}
+        )
+        bits = self._state_bits
+        moves = {symbol: [0] * len(bits) for symbol in self.alphabet}
+        for (state, symbol), targets in self.transitions.items():
+            moves[symbol][bits[state]] = self._mask(targets)
+        object.__setattr__(self, "_moves", {symbol: tuple(row) for symbol, row in moves.items()})
+        object.__setattr__(self, "_initial_mask", self._mask(self.initial_states))
+        object.__setattr__(self, "_accepting_mask", self._mask(self.accepting_states))
+        object.__setattr__(self, "_subset_moves", {symbol: {} for symbol in self.alphabet})
 
     def accepts(self, word: Sequence[str]) -> bool:
-        current_states = set(self.initial_states)
+        # The subset construction is carried out lazily: every state set met
+        # while reading remembers its successor on each symbol, so repeated
+        # queries walk a partial DFA instead of re-expanding the same sets.
+        all_moves = self._moves
+        subset_moves = self._subset_moves
+        mask = self._initial_mask
         for symbol in word:
-            if symbol not in self.alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not in alphabet")
-            next_states: set[str] = set()
-            for state in current_states:
-                next_states.update(self.transitions.get((state, symbol), ()))
-            current_states = next_states
-            if not current_states:
+            try:
+                successors = subset_moves[symbol]
+            except KeyError:
+                raise AutomatonError(f"symbol {symbol!r} not in alphabet") from None
+            target = successors.get(mask)
+            if target is None:
+                target = _successors(all_moves[symbol], mask)
+                if len(successors) < _SUBSET_CACHE_LIMIT:
+                    successors[mask] = target
+            mask = target
+            if not mask:
                 return False
-        return any(state in self.accepting_states for state in current_states)
+        return bool(mask & self._accepting_mask)
+
+    def to_dfa(self, *, max_states: int = 4096) -> DeterministicFiniteAutomaton:
+        """Return the equivalent DFA built by the subset construction.
+
+        Only state sets reachable from the initial set are explored, breadth
+        first.  Each DFA state is named after its set, e.g. ``"{'q0', 'q1'}"``,
+        and the empty set ``"{}"`` appears as a dead state when reachable, so
+        the result is total.  The DFA is built once, and the subset
+        transitions it explores also fill the cache :meth:`accepts` reads.
+        :meth:`accepts` keeps NFA semantics, so a run that has died rejects
+        before reaching an unknown symbol, where the DFA raises.
+        :class:`AutomatonError` is raised when more than ``max_states`` sets
+        are reachable.
+        """
+
+        if self._dfa is not None:
+            return self._dfa
+        order = sorted(self._state_bits, key=self._state_bits.__getitem__)
+
+        def name(mask: int) -> str:
+            members = [repr(state) for index, state in enumerate(order) if mask >> index & 1]
+            return "{" + ", ".join(members) + "}"
+
+        initial = self._initial_mask
+        names = {initial: name(initial)}
+        transitions: Dict[Tuple[str, str], str] = {}
+        queue = deque([initial])
+        while queue:
+            mask = queue.popleft()
+            for symbol in sorted(self._moves):
+                target = _successors(self._moves[symbol], mask)
+                successors = self._subset_moves[symbol]
+                if len(successors) < _SUBSET_CACHE_LIMIT:
+                    successors[mask] = target
+                if target not in names:
+                    if len(names) == max_states:
+                        raise AutomatonError(f"subset construction exceeds {max_states} states")
+                    names[target] = name(target)
+                    queue.append(target)
+                transitions[(names[mask], symbol)] = names[target]
+        dfa = DeterministicFiniteAutomaton(
+            states=frozenset(names.values()),
+            alphabet=self.alphabet,
+            transitions=transitions,
+            initial_state=names[initial],
+            accepting_states=frozenset(
+                label for mask, label in names.items() if mask & self._accepting_mask
+            ),
+        )
+        object.__setattr__(self, "_dfa", dfa)
+        return dfa
 
 
 @dataclass(frozen=True)
@@ -102,40 +310,53 @@ class EpsilonNFA(NondeterministicFiniteAutomaton):
     """NFA variant that supports ε-transitions via ``None`` symbols."""
 
     epsilon_transitions: Mapping[str, frozenset[str]]
+    _closures: Tuple[int, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
-        super().__post_init__()
+        # The ε-relation is checked first because compiling depends on it.
         if not set(self.epsilon_transitions).issubset(self.states):
             raise AutomatonError("ε-transition references unknown state")
         for targets in self.epsilon_transitions.values():
             if not targets <= self.states:
                 raise AutomatonError("ε-transition targets must be known states")
+        super().__post_init__()
 
-    def _epsilon_closure(self, states: Iterable[str]) -> frozenset[str]:
-        closure = set(states)
-        stack = list(states)
-        while stack:
-            state = stack.pop()
-            for target in self.epsilon_transitions.get(state, ()):  # type: ignore[arg-type]
-                if target not in closure:
-                    closure.add(target)
-                    stack.append(target)
-        return frozenset(closure)
-
-    def accepts(self, word: Sequence[str]) -> bool:
-        current_states = set(self._epsilon_closure(self.initial_states))
-        for symbol in word:
-            if symbol not in self.alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not in alphabet")
-            next_states: set[str] = set()
-            for state in current_states:
-                targets = self.transitions.get((state, symbol), ())
-                if targets:
-                    next_states.update(self._epsilon_closure(targets))
-            current_states = next_states
-            if not current_states:
-                return False
-        return any(state in self.accepting_states for state in current_states)
+    def _compile(self) -> None:
+        """Project the ε-transitions out of the compiled automaton.
+
+        ``_closures[i]`` is the reflexive-transitive ε-closure of state
+        ``i``, found once by a bitmask search.  The initial mask and every
+        successor mask are then replaced by their closures.  State sets
+        reached during a run are therefore always ε-closed, which makes
+        closing on the left as well (``E · M_a · E``) redundant, and the
+        inherited :meth:`accepts` loop runs unchanged, as for an ε-free NFA.
+        """
+
+        super()._compile()
+        bits = self._state_bits
+        direct = [0] * len(bits)
+        for state, targets in self.epsilon_transitions.items():
+            direct[bits[state]] = self._mask(targets)
+        closures = []
+        for index in range(len(bits)):
+            closure = frontier = 1 << index
+            while frontier:
+                lowest = frontier & -frontier
+                frontier ^= lowest
+                reached = direct[lowest.bit_length() - 1] & ~closure
+                closure |= reached
+                frontier |= reached
+            closures.append(closure)
+        object.__setattr__(self, "_closures", tuple(closures))
+        closed_moves = {
+            symbol: tuple(self._epsilon_closure(targets) for targets in moves)
+            for symbol, moves in self._moves.items()
+        }
+        object.__setattr__(self, "_moves", closed_moves)
+        object.__setattr__(self, "_initial_mask", self._epsilon_closure(self._initial_mask))
+
+    def _epsilon_closure(self, mask: int) -> int:
+        return _successors(self._closures, mask)
 
 
 @dataclass(frozen=True)
@@ -147,6 +368,8 @@ class ProbabilisticFiniteAutomaton:
     transitions: Mapping[Tuple[str, str], Mapping[str, float]]
     initial_state: str
     accepting_states: frozenset[str]
+    _matrix_form: Optional[_MatrixForm] = field(init=False, repr=False, compare=False)
+    _rows: Dict[str, Dict[str, Mapping[str, float]]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         if self.initial_state not in self.states:
@@ -163,21 +386,37 @@ class ProbabilisticFiniteAutomaton:
                     raise AutomatonError("transition targets unknown state")
                 if probability < 0:
                     raise AutomatonError("probabilities must be non-negative")
+        matrix_form = _matrix_form(
+            self.states,
+            self.alphabet,
+            self.transitions,
+            {self.initial_state: 1.0},
+            dict.fromkeys(self.accepting_states, 1.0),
+        )
+        object.__setattr__(self, "_matrix_form", matrix_form)
+        object.__setattr__(self, "_rows", _rows_by_symbol(self.alphabet, self.transitions))
 
     def acceptance_probability(self, word: Sequence[str]) -> float:
-        distribution: Dict[str, float] = {self.initial_state: 1.0}
-        for symbol in word:
-            if symbol not in self.alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not in alphabet")
-            next_distribution: Dict[str, float] = {}
-            for state, prob in distribution.items():
-                for target, weight in self.transitions.get((state, symbol), {}).items():
-                    next_distribution[target] = next_distribution.get(target, 0.0) + prob * weight
-            distribution = next_distribution
-            if not distribution:
-                return 0.0
+        if self._matrix_form is not None and all(symbol in self._rows for symbol in word):
+            return _matrix_form_weight(self._matrix_form, word)
+        initial = {self.initial_state: 1.0}
+        distribution = _walk_weights(self._rows, initial, word)
+        if distribution is None:
+            return 0.0
         return sum(prob for state, prob in distribution.items() if state in self.accepting_states)
 
+    def acceptance_probability_many(self, words: Iterable[Sequence[str]]) -> List[float]:
+        """Return :meth:`acceptance_probability` for each of ``words``.
+
+        Words sharing a prefix share its distribution; see
+        :func:`_matrix_form_weights`.
+        """
+
+        words = list(words)
+        if self._matrix_form is None:
+            return [self.acceptance_probability(word) for word in words]
+        return _matrix_form_weights(self._matrix_form, words, self.acceptance_probability)
+
 
 @dataclass(frozen=True)
 class WeightedFiniteAutomaton:
@@ -188,6 +427,8 @@ class WeightedFiniteAutomaton:
     transitions: Mapping[Tuple[str, str], Mapping[str, float]]
     initial_states: Mapping[str, float]
     accepting_states: Mapping[str, float]
+    _matrix_form: Optional[_MatrixForm] = field(init=False, repr=False, compare=False)
+    _rows: Dict[str, Dict[str, Mapping[str, float]]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         if not set(self.initial_states).issubset(self.states):
@@ -201,23 +442,243 @@ class WeightedFiniteAutomaton:
                 raise AutomatonError("transition references unknown symbol")
             if not set(mapping).issubset(self.states):
                 raise AutomatonError("transition targets must be known states")
+        matrix_form = _matrix_form(
+            self.states, self.alphabet, self.transitions, self.initial_states, self.accepting_states
+        )
+        object.__setattr__(self, "_matrix_form", matrix_form)
+        object.__setattr__(self, "_rows", _rows_by_symbol(self.alphabet, self.transitions))
 
     def weight_of(self, word: Sequence[str]) -> float:
-        weights: Dict[str, float] = dict(self.initial_states)
-        for symbol in word:
-            if symbol not in self.alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not in alphabet")
-            next_weights: Dict[str, float] = {}
-            for state, weight in weights.items():
-                for target, transition_weight in self.transitions.get((state, symbol), {}).items():
-                    next_weights[target] = next_weights.get(target, 0.0) + weight * transition_weight
-            weights = next_weights
-            if not weights:
-                return 0.0
+        if self._matrix_form is not None and all(symbol in self._rows for symbol in word):
+            return _matrix_form_weight(self._matrix_form, word)
+        weights = _walk_weights(self._rows, dict(self.initial_states), word)
+        if weights is None:
+            return 0.0
         return sum(weight * self.accepting_states[state] for state, weight in weights.items() if state in self.accepting_states)
 
+    def weight_many(self, words: Iterable[Sequence[str]]) -> List[float]:
+        """Return :meth:`weight_of` for each of ``words``.
+
+        Words sharing a prefix share its weight vector; see
+        :func:`_matrix_form_weights`.
+        """
+
+        words = list(words)
+        if self._matrix_form is None:
+            return [self.weight_of(word) for word in words]
+        return _matrix_form_weights(self._matrix_form, words, self.weight_of)
+
+
+def _rows_by_symbol(
+    alphabet: frozenset[str], transitions: Mapping[Tuple[str, str], Mapping[str, float]]
+) -> Dict[str, Dict[str, Mapping[str, float]]]:
+    """Regroup ``transitions`` as ``rows[symbol][state] -> {target: weight}``.
+
+    Every alphabet symbol gets an entry, so the keys double as the alphabet.
+    """
+
+    rows: Dict[str, Dict[str, Mapping[str, float]]] = {symbol: {} for symbol in alphabet}
+    for (state, symbol), mapping in transitions.items():
+        rows[symbol][state] = mapping
+    return rows
+
+
+def _walk_weights(
+    rows: Mapping[str, Mapping[str, Mapping[str, float]]],
+    weights: Dict[str, float],
+    word: Sequence[str],
+) -> Optional[Dict[str, float]]:
+    """Push ``weights`` along ``word`` through the regrouped transitions.
+
+    This is the fallback used without NumPy.  The word is checked against
+    the alphabet in one pass before the walk, which then runs unchecked up
+    to the first unknown symbol; reaching it raises, unless no state is
+    reachable any more, in which case ``None`` is returned as for any run
+    that runs out of transitions.  States count as reachable even when
+    their weight is zero.
+    """
+
+    stop = next((index for index, symbol in enumerate(word) if symbol not in rows), None)
+    for symbol in word if stop is None else word[:stop]:
+        row = rows[symbol]
+        next_weights: Dict[str, float] = {}
+        for state, weight in weights.items():
+            mapping = row.get(state)
+            if mapping is None:
+                continue
+            for target, transition_weight in mapping.items():
+                next_weights[target] = next_weights.get(target, 0.0) + weight * transition_weight
+        weights = next_weights
+        if not weights:
+            return None
+    if stop is not None:
+        raise AutomatonError(f"symbol {word[stop]!r} not in alphabet")
+    return weights
+
+
+def _matrix_form(
+    states: frozenset[str],
+    alphabet: frozenset[str],
+    transitions: Mapping[Tuple[str, str], Mapping[str, float]],
+    initial: Mapping[str, float],
+    final: Mapping[str, float],
+) -> Optional[_MatrixForm]:
+    """Return the ``({M_a}, i, f)`` matrix form of a weighted automaton.
+
+    States are numbered in sorted order; ``M_a[p, q]`` is the weight of the
+    ``a``-transition from ``p`` to ``q``, and every alphabet symbol gets a
+    matrix.  Large, sparse matrices are listed as row-major triplets instead
+    of being stored densely, so memory and the cost of a step stay
+    proportional to the transitions rather than ``|states|²``.  Without
+    NumPy ``None`` is returned and callers keep walking the transition
+    mappings, which they also do for words with a symbol outside the
+    alphabet: whether such a word raises depends on which states are still
+    reachable, not on their weights.
+    """
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        return None
+
+    index = {state: position for position, state in enumerate(sorted(states))}
+    size = len(index)
+    entries: Dict[str, Tuple[List[int], List[int], List[float]]] = {
+        symbol: ([], [], []) for symbol in alphabet
+    }
+    for (state, symbol), mapping in transitions.items():
+        rows, columns, weights = entries[symbol]
+        row = index[state]
+        for target, weight in mapping.items():
+            if weight:
+                rows.append(row)
+                columns.append(index[target])
+                weights.append(weight)
+    initial_vector = np.zeros(size)
+    for state, weight in initial.items():
+        initial_vector[index[state]] = weight
+    final_vector = np.zeros(size)
+    for state, weight in final.items():
+        final_vector[index[state]] = weight
+    matrices: Dict[str, "np.ndarray"] = {}
+    sparse: _SparseSteps = {}
+    for symbol, (rows, columns, weights) in entries.items():
+        row_array = np.array(rows, dtype=np.intp)
+        column_array = np.array(columns, dtype=np.intp)
+        weight_array = np.array(weights, dtype=np.float64)
+        if size >= _SPARSE_MIN_STATES and len(rows) * _SPARSE_DENSITY <= size * size:
+            order = np.lexsort((column_array, row_array))
+            sparse[symbol] = (row_array[order], column_array[order], weight_array[order])
+        else:
+            matrix = matrices[symbol] = np.zeros((size, size))
+            matrix[row_array, column_array] = weight_array
+    return matrices, initial_vector, final_vector, sparse
+
+
+def _matrix_form_weight(matrix_form: _MatrixForm, word: Sequence[str]) -> float:
+    """Evaluate ``i · M_{w1} · … · M_{wn} · f`` left to right.
+
+    Every symbol of ``word`` must belong to the alphabet.
+    """
+
+    matrices, initial_vector, final_vector, sparse = matrix_form
+    vector = initial_vector
+    size = len(vector)
+    for symbol in word:
+        step = sparse.get(symbol)
+        if step is None:
+            vector = vector @ matrices[symbol]
+        else:
+            rows, columns, weights = step
+            vector = np.bincount(columns, weights=vector[rows] * weights, minlength=size)
+    return float(vector @ final_vector)
+
+
+def _matrix_form_weights(
+    matrix_form: _MatrixForm,
+    words: Sequence[Sequence[str]],
+    fallback: Callable[[Sequence[str]], float],
+) -> List[float]:
+    """Evaluate many words at once over the prefix trie of ``words``.
+
+    The trie is walked one level at a time.  Level ``t`` holds one weight
+    vector per distinct prefix of length ``t``, stacked into a matrix, so a
+    shared prefix is evaluated once and each level costs a single matrix
+    product per distinct symbol.  Words containing a symbol outside the
+    alphabet are left to ``fallback``, which decides between raising and an
+    early ``0.0``.
+    """
+
+    matrices, initial_vector, final_vector, sparse = matrix_form
+    size = len(initial_vector)
+    results: List[float] = [0.0] * len(words)
+    active: List[int] = []
+    for position, word in enumerate(words):
+        if all(symbol in matrices or symbol in sparse for symbol in word):
+            active.append(position)
+        else:
+            results[position] = fallback(word)
+
+    vectors = initial_vector[None, :]
+    finals = vectors @ final_vector
+    nodes = [0] * len(words)
+    depth = 0
+    while True:
+        still_active = []
+        for position in active:
+            if len(words[position]) == depth:
+                results[position] = float(finals[nodes[position]])
+            else:
+                still_active.append(position)
+        active = still_active
+        if not active:
+            return results
+
+        children: Dict[Tuple[int, str], int] = {}
+        rows_by_symbol: Dict[str, List[int]] = {}
+        parents_by_symbol: Dict[str, List[int]] = {}
+        for position in active:
+            key = (nodes[position], words[position][depth])
+            child = children.get(key)
+            if child is None:
+                child = children[key] = len(children)
+                rows_by_symbol.setdefault(key[1], []).append(child)
+                parents_by_symbol.setdefault(key[1], []).append(key[0])
+            nodes[position] = child
+        next_vectors = np.empty((len(children), vectors.shape[1]))
+        for symbol, rows in rows_by_symbol.items():
+            parents = vectors[parents_by_symbol[symbol]]
+            step = sparse.get(symbol)
+            if step is None:
+                next_vectors[rows] = parents @ matrices[symbol]
+            else:
+                next_vectors[rows] = _sparse_steps(parents, step, size)
+        vectors = next_vectors
+        finals = vectors @ final_vector
+        depth += 1
+
+
+def _sparse_steps(
+    vectors: "np.ndarray",
+    step: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    size: int,
+) -> "np.ndarray":
+    """Advance each row of ``vectors`` by the sparse triplets of ``step``.
+
+    One ``np.bincount`` over the flattened ``(vector, column)`` bins does the
+    work of the matrix product in time proportional to the transitions.
+    """
+
+    rows, columns, weights = step
+    count = len(vectors)
+    bins = (np.arange(count)[:, None] * size + columns).ravel()
+    contributions = (vectors[:, rows] * weights).ravel()
+    return np.bincount(bins, weights=contributions, minlength=count * size).reshape(count, size)
+
 
 StackSymbol = str
+# PDA transitions nested as ``moves[state][stack_top][input_symbol] -> targets``.
+_PushdownMoves = Dict[
+    str, Dict[StackSymbol, Dict[Symbol, Tuple[Tuple[str, Tuple[StackSymbol, ...]], ...]]]
+]
 
 
 @dataclass
@@ -231,6 +692,7 @@ class PushdownAutomaton:
     initial_state: str
     initial_stack_symbol: StackSymbol
     accepting_states: frozenset[str]
+    _moves: _PushdownMoves = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         if self.initial_state not in self.states:
@@ -251,47 +713,72 @@ class PushdownAutomaton:
                     raise AutomatonError("transition target must be known state")
                 if not set(push_symbols).issubset(self.stack_alphabet):
                     raise AutomatonError("push string must use stack alphabet symbols")
+        # Nested by state, stack top and input symbol so a step looks up
+        # plain string keys instead of hashing a fresh 3-tuple.  Targets keep
+        # the iteration order of their frozensets.
+        moves: _PushdownMoves = {state: {} for state in self.states}
+        for (state, symbol, stack_symbol), targets in self.transitions.items():
+            moves[state].setdefault(stack_symbol, {})[symbol] = tuple(targets)
+        self._moves = moves
 
     def accepts(self, word: Sequence[str], *, max_steps: int = 1024) -> bool:
-        queue: deque[Tuple[str, int, Tuple[StackSymbol, ...]]] = deque()
-        queue.append((self.initial_state, 0, (self.initial_stack_symbol,)))
-        visited: set[Tuple[str, int, Tuple[StackSymbol, ...]]] = set()
+        # Stacks are interned as a persistent linked list: id ``0`` is the
+        # empty stack and ``nodes[i]`` holds the top symbol and the id of the
+        # stack below it.  Configurations that share a tail share its nodes,
+        # so pushes and pops are O(1) and configurations compare as ints.
+        nodes: List[Tuple[StackSymbol, int]] = [("", 0)]
+        interned: Dict[Tuple[StackSymbol, int], int] = {}
+
+        def push(stack: int, symbols: Tuple[StackSymbol, ...]) -> int:
+            for symbol in symbols:
+                key = (symbol, stack)
+                node = interned.get(key)
+                if node is None:
+                    node = interned[key] = len(nodes)
+                    nodes.append(key)
+                stack = node
+            return stack
+
+        moves_by_state = self._moves
+        accepting_states = self.accepting_states
+        length = len(word)
+        queue: deque[Tuple[str, int, int]] = deque()
+        queue.append((self.initial_state, 0, push(0, (self.initial_stack_symbol,))))
+        visited: set[Tuple[str, int, int]] = set()
         steps = 0
 
         while queue and steps < max_steps:
-            state, index, stack = queue.popleft()
+            configuration = queue.popleft()
             steps += 1
-            configuration = (state, index, stack)
             if configuration in visited:
                 continue
             visited.add(configuration)
+            state, index, stack = configuration
 
-            if index == len(word) and state in self.accepting_states:
+            if index == length and state in accepting_states:
                 return True
 
-            stack_top = stack[-1] if stack else None
-            if stack_top is None:
+            if not stack:
+                continue
+            stack_top, below = nodes[stack]
+            moves = moves_by_state[state].get(stack_top)
+            if moves is None:
                 continue
 
-            for input_symbol in (None, word[index] if index < len(word) else None):
-                if input_symbol is None:
-                    next_index = index
-                else:
-                    if input_symbol not in self.input_alphabet or index >= len(word):
-                        continue
-                    if word[index] != input_symbol:
-                        continue
-                    next_index = index + 1
-                for next_state, push_symbols in self.transitions.get((state, input_symbol, stack_top), ()):  # type: ignore[arg-type]
-                    next_stack = list(stack[:-1])
-                    next_stack.extend(push_symbols)
-                    queue.append((next_state, next_index, tuple(next_stack)))
+            # A symbol outside the input alphabet has no transitions, so it
+            # blocks the configuration without a membership test.
+            for input_symbol in (None, word[index] if index < length else None):
+                next_index = index if input_symbol is None else index + 1
+                for next_state, push_symbols in moves.get(input_symbol, ()):
+                    queue.append((next_state, next_index, push(below, push_symbols)))
         return False
 
 
 class DeterministicPushdownAutomaton(PushdownAutomaton):
     """Pushdown automaton that ensures determinism at construction time."""
 
+    _single_path: bool
+
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         super().__post_init__()
         seen: set[Tuple[str, Optional[str], StackSymbol]] = set()
@@ -301,6 +788,58 @@ class DeterministicPushdownAutomaton(PushdownAutomaton):
             if key in seen:
                 raise AutomatonError("duplicate transition in deterministic PDA")
             seen.add(key)
+        # Construction still allows an ε-move next to input moves for the same
+        # state and stack top; only without such pairs is there a single run.
+        self._single_path = not any(
+            moves.get(None) and any(targets for symbol, targets in moves.items() if symbol)
+            for by_top in self._moves.values()
+            for moves in by_top.values()
+        )
+
+    def accepts(self, word: Sequence[str], *, max_steps: int = 1024) -> bool:
+        if not self._single_path:
+            return super().accepts(word, max_steps=max_steps)
+        # Follow the single run on a list stack (top last).  ``turn`` counts
+        # the configurations the breadth-first search would dequeue: once the
+        # input is consumed it enqueues each ε-successor twice, and the
+        # stale copy is dequeued between two configurations of the run, so
+        # those successors cost two turns.  A repeated configuration means
+        # the run loops and is rejected when the turns run out, as the
+        # search rejects once everything it queued was visited.
+        moves_by_state = self._moves
+        accepting_states = self.accepting_states
+        length = len(word)
+        stack = [self.initial_stack_symbol]
+        state = self.initial_state
+        index = 0
+        turn = 1
+        doubled = False
+
+        while turn <= max_steps:
+            if index == length and state in accepting_states:
+                return True
+            if not stack:
+                return False
+            moves = moves_by_state[state].get(stack[-1])
+            if moves is None:
+                return False
+            targets = moves.get(None)
+            if targets:
+                turn += 2 if doubled else 1
+                doubled = index == length
+            elif index < length:
+                targets = moves.get(word[index])
+                if not targets:
+                    return False
+                turn += 1
+                index += 1
+            else:
+                return False
+            # Determinism leaves exactly one target per move.
+            state, push_symbols = targets[0]
+            stack.pop()
+            stack.extend(push_symbols)
+        return False
 
 
 class LinearBoundedAutomatonError(RuntimeError):
@@ -308,6 +847,23 @@ class LinearBoundedAutomatonError(RuntimeError):
 
 
 Move = str  # 'L', 'R', or 'S'
+_MOVE_OFFSETS = {"L": -1, "R": 1, "S": 0}
+_MOVE_CODES = {"L": 0, "R": 1, "S": 2}
+_MOVE_STEPS = (-1, 1, 0)
+# Sentinel entries of ``TuringMachine._table``; transitions are non-negative.
+_ACCEPT = -1
+_REJECT = -2
+_HALT = -3
+
+
+def _tape_codes(alphabet: frozenset[str]) -> Tuple[Dict[str, int], str]:
+    """Return integer codes for ``alphabet`` and the ``array`` typecode of a tape.
+
+    Tapes are bytes unless the alphabet has more than 256 symbols.
+    """
+
+    codes = {symbol: index for index, symbol in enumerate(sorted(alphabet))}
+    return codes, "B" if len(codes) <= 256 else "I"
 
 
 @dataclass
@@ -321,6 +877,11 @@ class TuringMachine:
     initial_state: str
     accepting_states: frozenset[str]
     rejecting_states: frozenset[str]
+    _codes: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _typecode: str = field(init=False, repr=False, compare=False)
+    _table: List[int] = field(init=False, repr=False, compare=False)
+    _shift: int = field(init=False, repr=False, compare=False)
+    _initial_row: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         if self.blank_symbol not in self.tape_alphabet:
@@ -338,39 +899,74 @@ class TuringMachine:
                 raise AutomatonError("transition uses unknown tape symbol")
             if result[2] not in {"L", "R", "S"}:
                 raise AutomatonError("move must be 'L', 'R', or 'S'")
-
-    def _initial_tape(self, word: Sequence[str]) -> MutableMapping[int, str]:
-        tape: MutableMapping[int, str] = {}
-        for index, symbol in enumerate(word):
-            if symbol not in self.tape_alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not on tape alphabet")
-            tape[index] = symbol
-        return tape
+        self._compile()
+
+    def _compile(self) -> None:
+        """Flatten the transition function into one list of packed integers.
+
+        Row ``q * |alphabet|`` holds state ``q``; entry ``row + code`` packs
+        ``(next_row << shift) | (write_code << 2) | move_code`` with moves
+        coded as in ``_MOVE_CODES``.  Accepting and rejecting states fill
+        their rows with ``_ACCEPT``/``_REJECT`` and missing transitions are
+        ``_HALT``, so a single negative test ends the run.
+        """
+
+        codes, typecode = _tape_codes(self.tape_alphabet)
+        width = len(codes)
+        shift = max(width - 1, 1).bit_length() + 2
+        rows = {state: index * width for index, state in enumerate(sorted(self.states))}
+        table = [_HALT] * (len(rows) * width)
+        for (state, symbol), (next_state, write, move) in self.transitions.items():
+            table[rows[state] + codes[symbol]] = (
+                rows[next_state] << shift | codes[write] << 2 | _MOVE_CODES[move]
+            )
+        for state in self.rejecting_states:
+            table[rows[state] : rows[state] + width] = [_REJECT] * width
+        for state in self.accepting_states:
+            table[rows[state] : rows[state] + width] = [_ACCEPT] * width
+        self._codes = codes
+        self._typecode = typecode
+        self._table = table
+        self._shift = shift
+        self._initial_row = rows[self.initial_state]
+
+    def _initial_tape(self, word: Sequence[str], padding: int) -> "array[int]":
+        """Encode ``word`` with ``padding`` blank cells on either side."""
+
+        codes = self._codes
+        try:
+            cells = [codes[symbol] for symbol in word]
+        except KeyError as error:
+            raise AutomatonError(f"symbol {error.args[0]!r} not on tape alphabet") from None
+        blanks = array(self._typecode, [codes[self.blank_symbol]]) * padding
+        return blanks + array(self._typecode, cells) + blanks
 
     def run(self, word: Sequence[str], *, max_steps: int = 2048) -> bool:
-        tape = self._initial_tape(word)
-        head = 0
-        state = self.initial_state
+        padding = max(len(word), 16)
+        tape = self._initial_tape(word, padding)
+        blank = array(self._typecode, [self._codes[self.blank_symbol]])
+        table = self._table
+        shift = self._shift
+        mask = (1 << (shift - 2)) - 1
+        head = padding
+        end = len(tape)
+        row = self._initial_row
         steps = 0
 
         while steps < max_steps:
-            if state in self.accepting_states:
-                return True
-            if state in self.rejecting_states:
-                return False
-
-            symbol = tape.get(head, self.blank_symbol)
-            try:
-                next_state, write_symbol, move = self.transitions[(state, symbol)]
-            except KeyError:
-                return False
-
-            tape[head] = write_symbol
-            if move == "L":
-                head -= 1
-            elif move == "R":
-                head += 1
-            state = next_state
+            packed = table[row + tape[head]]
+            if packed < 0:
+                return packed == _ACCEPT
+            tape[head] = packed >> 2 & mask
+            head += _MOVE_STEPS[packed & 3]
+            if head < 0:
+                tape[0:0] = blank * end
+                head += end
+                end *= 2
+            elif head == end:
+                tape.extend(blank * end)
+                end *= 2
+            row = packed >> shift
             steps += 1
         raise RuntimeError("maximum number of steps exceeded")
 
@@ -380,35 +976,34 @@ class LinearBoundedAutomaton(TuringMachine):
     """Turing machine constrained to the input's length."""
 
     def run(self, word: Sequence[str], *, max_steps: int = 2048) -> bool:
-        tape = self._initial_tape(word)
+        # Without input there is no right boundary, so the tape still grows.
+        tape = self._initial_tape(word, 0) if word else self._initial_tape((), 1)
+        blank = array(self._typecode, [self._codes[self.blank_symbol]])
+        table = self._table
+        shift = self._shift
+        mask = (1 << (shift - 2)) - 1
         head = 0
-        state = self.initial_state
-        left_boundary = 0
         right_boundary = len(word) - 1 if word else -1
+        row = self._initial_row
         steps = 0
 
         while steps < max_steps:
-            if state in self.accepting_states:
-                return True
-            if state in self.rejecting_states:
-                return False
-
-            symbol = tape.get(head, self.blank_symbol)
-            try:
-                next_state, write_symbol, move = self.transitions[(state, symbol)]
-            except KeyError:
-                return False
-
-            tape[head] = write_symbol
-            if move == "L":
-                if head == left_boundary:
+            packed = table[row + tape[head]]
+            if packed < 0:
+                return packed == _ACCEPT
+            tape[head] = packed >> 2 & mask
+            move = packed & 3
+            if move == 0:
+                if head == 0:
                     raise LinearBoundedAutomatonError("attempted to move beyond left boundary")
                 head -= 1
-            elif move == "R":
+            elif move == 1:
                 if head == right_boundary:
                     raise LinearBoundedAutomatonError("attempted to move beyond right boundary")
                 head += 1
-            state = next_state
+                if head == len(tape):
+                    tape.extend(blank * len(tape))
+            row = packed >> shift
             steps += 1
         raise RuntimeError("maximum number of steps exceeded")
 
@@ -425,6 +1020,13 @@ class MultiTapeTuringMachine:
     accepting_states: frozenset[str]
     rejecting_states: frozenset[str]
     tapes: int
+    _codes: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _typecode: str = field(init=False, repr=False, compare=False)
+    _program: Dict[int, Tuple[int, Tuple[int, ...], Tuple[int, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
+    _halting: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _initial_id: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - validation guard
         if self.tapes < 1:
@@ -447,37 +1049,87 @@ class MultiTapeTuringMachine:
             for move in result[2]:
                 if move not in {"L", "R", "S"}:
                     raise AutomatonError("move must be 'L', 'R', or 'S'")
+        self._compile()
+
+    def _compile(self) -> None:
+        """Encode the machine with integer states, symbols and moves.
+
+        Tape symbols become codes (sorted order) so every tape can be a flat
+        ``array`` band of bytes, or of wider ints for alphabets beyond 256
+        symbols.  A transition is keyed by its state id followed by the
+        scanned codes as the digits of one integer in base ``|alphabet|``,
+        and maps to the next state id, the codes to write and the head
+        offsets.  ``_halting[q]`` is ``1`` for accepting, ``2`` for rejecting
+        and ``0`` for running states.
+        """
+
+        state_ids = {state: index for index, state in enumerate(sorted(self.states))}
+        codes, typecode = _tape_codes(self.tape_alphabet)
+        base = len(codes)
+        program = {}
+        for (state, symbols), (next_state, writes, moves) in self.transitions.items():
+            key = state_ids[state]
+            for symbol in symbols:
+                key = key * base + codes[symbol]
+            program[key] = (
+                state_ids[next_state],
+                tuple(codes[symbol] for symbol in writes),
+                tuple(_MOVE_OFFSETS[move] for move in moves),
+            )
+        self._codes = codes
+        self._typecode = typecode
+        self._program = program
+        self._halting = tuple(
+            1 if state in self.accepting_states else 2 if state in self.rejecting_states else 0
+            for state in sorted(self.states)
+        )
+        self._initial_id = state_ids[self.initial_state]
 
     def run(self, word: Sequence[str], *, max_steps: int = 2048) -> bool:
-        tapes: list[MutableMapping[int, str]] = [{} for _ in range(self.tapes)]
-        for index, symbol in enumerate(word):
-            if symbol not in self.tape_alphabet:
-                raise AutomatonError(f"symbol {symbol!r} not on tape alphabet")
-            tapes[0][index] = symbol
-        heads = [0 for _ in range(self.tapes)]
-        state = self.initial_state
+        codes = self._codes
+        base = len(codes)
+        typecode = self._typecode
+        blank = codes[self.blank_symbol]
+        try:
+            first = array(typecode, [codes[symbol] for symbol in word])
+        except KeyError as error:
+            raise AutomatonError(f"symbol {error.args[0]!r} not on tape alphabet") from None
+        # Each band covers the cells visited so far on its tape and doubles
+        # when a head walks off either end; heads index into their band.
+        bands = [first or array(typecode, [blank])]
+        bands.extend(array(typecode, [blank]) for _ in range(self.tapes - 1))
+        heads = [0] * self.tapes
+        tapes = range(self.tapes)
+        program = self._program
+        halting = self._halting
+        state = self._initial_id
         steps = 0
 
         while steps < max_steps:
-            if state in self.accepting_states:
-                return True
-            if state in self.rejecting_states:
-                return False
-
-            symbols = tuple(tape.get(head, self.blank_symbol) for tape, head in zip(tapes, heads))
-            try:
-                next_state, write_symbols, moves = self.transitions[(state, symbols)]
-            except KeyError:
+            status = halting[state]
+            if status:
+                return status == 1
+
+            key = state
+            for band, head in zip(bands, heads):
+                key = key * base + band[head]
+            entry = program.get(key)
+            if entry is None:
                 return False
 
-            for tape, head, symbol in zip(tapes, heads, write_symbols):
-                tape[head] = symbol
-            for index, move in enumerate(moves):
-                if move == "L":
-                    heads[index] -= 1
-                elif move == "R":
-                    heads[index] += 1
-            state = next_state
+            state, writes, moves = entry
+            for tape in tapes:
+                band = bands[tape]
+                head = heads[tape]
+                band[head] = writes[tape]
+                head += moves[tape]
+                if head < 0:
+                    grown = len(band)
+                    band[0:0] = array(typecode, [blank]) * grown
+                    head += grown
+                elif head == len(band):
+                    band.extend(array(typecode, [blank]) * len(band))
+                heads[tape] = head
             steps += 1
         raise RuntimeError("maximum number of steps exceeded")
 
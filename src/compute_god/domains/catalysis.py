@@ -15,16 +15,26 @@ numerically light.  The reaction score is derived from three intuitive factors:
 * the drive created by the external catalyst/agitation parameters.
 
 This simple model is sufficient for the unit tests and showcases how playful
-concepts can be translated into small, well documented utilities.
+concepts can be translated into small, well documented utilities.  Parameter
+sweeps over many pairs can use :func:`catalyse_batch`, which evaluates the
+same model column-wise with NumPy.
 """
 
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple, Union
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
 
-@dataclass
+ArrayLike = Union[float, Sequence[float], "np.ndarray"]
+
+
+@dataclass(frozen=True)
 class Jiuzi:
     """Representation of a 纠子 (knot-like agent).
 
@@ -37,11 +47,15 @@ class Jiuzi:
     coherence:
         Additional multiplicative factor describing how tightly the knot keeps
         itself together.  Must be positive.
+
+    The energetic ``intensity`` stored within the knot, ``loops × twist ×
+    coherence``, is computed once at construction.
     """
 
     loops: int
     twist: float
     coherence: float = 1.0
+    intensity: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.loops <= 0:
@@ -50,15 +64,10 @@ class Jiuzi:
             raise ValueError("twist must be positive for a Jiuzi")
         if self.coherence <= 0:
             raise ValueError("coherence must be positive for a Jiuzi")
+        object.__setattr__(self, "intensity", float(self.loops) * self.twist * self.coherence)
 
-    @property
-    def intensity(self) -> float:
-        """Return the energetic intensity stored within the knot."""
-
-        return float(self.loops) * self.twist * self.coherence
 
-
-@dataclass
+@dataclass(frozen=True)
 class Chanzi:
     """Representation of a 缠子 (entanglement coil).
 
@@ -71,11 +80,15 @@ class Chanzi:
     resonance:
         Multiplicative factor describing how well the coil can resonate with a
         partner.  Must be positive.
+
+    The energetic ``intensity`` stored within the coil, ``strands × torsion ×
+    resonance``, is computed once at construction.
     """
 
     strands: int
     torsion: float
     resonance: float = 1.0
+    intensity: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.strands <= 0:
@@ -84,12 +97,7 @@ class Chanzi:
             raise ValueError("torsion must be positive for a Chanzi")
         if self.resonance <= 0:
             raise ValueError("resonance must be positive for a Chanzi")
-
-    @property
-    def intensity(self) -> float:
-        """Return the energetic intensity stored within the entanglement coil."""
-
-        return float(self.strands) * self.torsion * self.resonance
+        object.__setattr__(self, "intensity", float(self.strands) * self.torsion * self.resonance)
 
 
 @dataclass
@@ -139,14 +147,16 @@ def catalyse_jiuzi_and_chanzi(
     if agitation <= 0:
         raise ValueError("agitation must be positive to trigger the reaction")
 
+    loops = jiuzi.loops
+    strands = chanzi.strands
     base_intensity = math.sqrt(jiuzi.intensity * chanzi.intensity)
-    alignment = 1.0 / (1.0 + abs(jiuzi.loops - chanzi.strands))
+    alignment = 1.0 / (1.0 + abs(loops - strands))
     coherence = (jiuzi.coherence + chanzi.resonance) / 2.0
     drive = math.log1p(catalyst * agitation)
 
     entanglement = base_intensity * alignment * drive
     stability = coherence * drive
-    total_windings = float(jiuzi.loops + chanzi.strands)
+    total_windings = float(loops + strands)
     yield_strength = entanglement / total_windings
 
     return CatalysisOutcome(
@@ -155,3 +165,67 @@ def catalyse_jiuzi_and_chanzi(
         stability=stability,
         yield_strength=yield_strength,
     )
+
+
+def catalyse_batch(
+    loops: ArrayLike,
+    twist: ArrayLike,
+    coherence: ArrayLike,
+    strands: ArrayLike,
+    torsion: ArrayLike,
+    resonance: ArrayLike,
+    *,
+    catalyst: ArrayLike = 1.0,
+    agitation: ArrayLike = 1.0,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Evaluate :func:`catalyse_jiuzi_and_chanzi` over arrays of parameters.
+
+    The arguments are the fields of :class:`Jiuzi` and :class:`Chanzi` given
+    column-wise, plus the catalytic drivers; all of them broadcast against
+    each other, so knot columns of shape ``(n, 1)`` and coil columns of shape
+    ``(m,)`` evaluate the whole ``n × m`` grid in one pass.
+
+    Returns ``(entanglement, alignment, stability, yield_strength)``, the
+    fields of :class:`CatalysisOutcome` as arrays.  Every parameter must be
+    strictly positive, as for the scalar participants.
+    """
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        raise ImportError("catalyse_batch requires numpy")
+
+    columns = {
+        "loops": loops,
+        "twist": twist,
+        "coherence": coherence,
+        "strands": strands,
+        "torsion": torsion,
+        "resonance": resonance,
+        "catalyst": catalyst,
+        "agitation": agitation,
+    }
+    arrays = {name: np.asarray(column, dtype=np.float64) for name, column in columns.items()}
+    for name, values in arrays.items():
+        if np.any(values <= 0):
+            raise ValueError(f"{name} must be positive")
+
+    loops_, strands_ = arrays["loops"], arrays["strands"]
+    # The operations follow the scalar path's order so results agree to the
+    # last bit.  NumPy's ``log1p`` may differ from ``math.log1p`` in the last
+    # place, so scalar drivers, the usual case, go through ``math``.
+    jiuzi_intensity = loops_ * arrays["twist"] * arrays["coherence"]
+    chanzi_intensity = strands_ * arrays["torsion"] * arrays["resonance"]
+    base_intensity = np.sqrt(jiuzi_intensity * chanzi_intensity)
+    alignment = 1.0 / (1.0 + np.abs(loops_ - strands_))
+    agitated = arrays["catalyst"] * arrays["agitation"]
+    drive = math.log1p(float(agitated)) if agitated.ndim == 0 else np.log1p(agitated)
+
+    entanglement = base_intensity * alignment * drive
+    stability = (arrays["coherence"] + arrays["resonance"]) / 2.0 * drive
+    yield_strength = entanglement / (loops_ + strands_)
+    shape = entanglement.shape
+    return (
+        entanglement,
+        np.broadcast_to(alignment, shape).copy(),
+        np.broadcast_to(stability, shape).copy(),
+        yield_strength,
+    )
@@ -17,9 +17,22 @@ low turbulence) but users may provide their own equilibrium description.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, MutableMapping, Optional, Sequence
-
-from compute_god.core import FixpointResult, God, Observer, Rule, State, Universe, fixpoint, rule
+from functools import cached_property, lru_cache, partial
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+from compute_god.core import (
+    ArrayState,
+    FixpointResult,
+    God,
+    Observer,
+    Rule,
+    State,
+    Universe,
+    fixpoint,
+    fuse_rules,
+    rule,
+)
 
 ComplexDynamicsState = MutableMapping[str, float]
 
@@ -37,6 +50,8 @@ _DYNAMICS_KEYS: Sequence[str] = (
     "exploration",
     "safety",
 )
+_DYNAMICS_INDEX = {key: index for index, key in enumerate(_DYNAMICS_KEYS)}
+_ONE_THIRD = 1.0 / 3.0
 
 
 def _ensure_float(state: MutableMapping[str, object], key: str, default: float = 0.0) -> float:
@@ -47,12 +62,25 @@ def _ensure_float(state: MutableMapping[str, object], key: str, default: float =
         raise TypeError(f"state[{key!r}] must be numeric, got {value!r}") from None
 
 
+def _reader(state: State) -> Callable[..., float]:
+    """Return a float accessor for ``state``.
+
+    ``ArrayState`` slots always hold floats, so only plain mappings go through
+    the validating :func:`_ensure_float`.
+    """
+
+    if isinstance(state, ArrayState):
+        return state.get
+    return partial(_ensure_float, state)
+
+
 def _towards(value: float, target: float, rate: float) -> float:
     return value + (target - value) * rate
 
 
 def _bounded(value: float) -> float:
-    return max(0.0, min(1.0, value))
+    # Comparisons avoid two builtin calls on every coordinate write.
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
 
 
 DEFAULT_COMPLEX_DYNAMICS: ComplexDynamicsState = {
@@ -71,7 +99,14 @@ DEFAULT_COMPLEX_DYNAMICS: ComplexDynamicsState = {
 }
 
 
-@dataclass
+# Defaults in layout order; designing a universe fills the buffer straight from
+# this tuple instead of rebuilding a dictionary entry by entry.
+_DEFAULT_DYNAMICS_VALUES: Tuple[float, ...] = tuple(
+    DEFAULT_COMPLEX_DYNAMICS[key] for key in _DYNAMICS_KEYS
+)
+
+
+@dataclass(frozen=True)
 class ComplexDynamicsBlueprint:
     """Blueprint describing the desired equilibrium of the dynamical system."""
 
@@ -89,35 +124,57 @@ class ComplexDynamicsBlueprint:
     safety: float = 0.975
 
     def as_state(self) -> Mapping[str, float]:
-        return {
-            "energy": self.energy,
-            "entropy": self.entropy,
-            "cohesion": self.cohesion,
-            "innovation": self.innovation,
-            "adaptation": self.adaptation,
-            "stability": self.stability,
-            "turbulence": self.turbulence,
-            "resonance": self.resonance,
-            "feedback": self.feedback,
-            "memory": self.memory,
-            "exploration": self.exploration,
-            "safety": self.safety,
-        }
+        """Return the blueprint as a read-only mapping, built once per blueprint."""
+
+        return self._state
+
+    def __getstate__(self) -> Dict[str, object]:
+        # The cached read-only view cannot be pickled; copies rebuild it.
+        state = dict(self.__dict__)
+        state.pop("_state", None)
+        return state
+
+    @cached_property
+    def _state(self) -> Mapping[str, float]:
+        # ``cached_property`` stores into the instance ``__dict__`` directly,
+        # which the frozen dataclass ``__setattr__`` guard does not intercept.
+        return MappingProxyType(
+            {
+                "energy": self.energy,
+                "entropy": self.entropy,
+                "cohesion": self.cohesion,
+                "innovation": self.innovation,
+                "adaptation": self.adaptation,
+                "stability": self.stability,
+                "turbulence": self.turbulence,
+                "resonance": self.resonance,
+                "feedback": self.feedback,
+                "memory": self.memory,
+                "exploration": self.exploration,
+                "safety": self.safety,
+            }
+        )
 
 
 def _stabilise_energy_flow(target: Mapping[str, float]):
+    target_energy = target["energy"]
+    target_entropy = target["entropy"]
+    target_turbulence = target["turbulence"]
+    target_stability = target["stability"]
+
     def apply(state: State, _ctx: object) -> State:
-        updated = dict(state)
+        updated = state
+        read = _reader(updated)
 
-        energy = _towards(_ensure_float(updated, "energy"), target["energy"], 0.33)
-        entropy = _towards(_ensure_float(updated, "entropy"), target["entropy"], 0.38)
-        turbulence = _towards(_ensure_float(updated, "turbulence"), target["turbulence"], 0.35)
+        energy = _towards(read("energy"), target_energy, 0.33)
+        entropy = _towards(read("entropy"), target_entropy, 0.38)
+        turbulence = _towards(read("turbulence"), target_turbulence, 0.35)
 
         stability_delta = 0.5 * (
-            (energy - target["energy"]) - (entropy - target["entropy"]) - (turbulence - target["turbulence"])
+            (energy - target_energy) - (entropy - target_entropy) - (turbulence - target_turbulence)
         )
-        stability_target = target["stability"] + stability_delta
-        stability = _towards(_ensure_float(updated, "stability"), stability_target, 0.3)
+        stability_target = target_stability + stability_delta
+        stability = _towards(read("stability"), stability_target, 0.3)
 
         updated.update(
             {
@@ -133,28 +190,35 @@ def _stabilise_energy_flow(target: Mapping[str, float]):
 
 
 def _harmonise_feedback_loops(target: Mapping[str, float]):
+    target_cohesion = target["cohesion"]
+    target_energy = target["energy"]
+    target_stability = target["stability"]
+    target_resonance = target["resonance"]
+    target_memory = target["memory"]
+    target_feedback = target["feedback"]
+    target_entropy = target["entropy"]
+    resonance_reference = target_energy + target_cohesion + target_stability
+    feedback_reference = target_resonance + target_cohesion + target_memory
+
     def apply(state: State, _ctx: object) -> State:
-        updated = dict(state)
+        updated = state
+        read = _reader(updated)
 
-        cohesion = _towards(_ensure_float(updated, "cohesion"), target["cohesion"], 0.3)
-        energy = _ensure_float(updated, "energy")
-        stability = _ensure_float(updated, "stability")
+        cohesion = _towards(read("cohesion"), target_cohesion, 0.3)
+        energy = read("energy")
+        stability = read("stability")
 
-        resonance_delta = (
-            (energy - target["energy"]) + (cohesion - target["cohesion"]) + (stability - target["stability"])
-        ) / 3.0
-        resonance_target = target["resonance"] + 0.6 * resonance_delta
-        resonance = _towards(_ensure_float(updated, "resonance"), resonance_target, 0.28)
+        resonance_delta = (energy + cohesion + stability - resonance_reference) * _ONE_THIRD
+        resonance_target = target_resonance + 0.6 * resonance_delta
+        resonance = _towards(read("resonance"), resonance_target, 0.28)
 
-        memory = _towards(_ensure_float(updated, "memory"), target["memory"], 0.27)
+        memory = _towards(read("memory"), target_memory, 0.27)
 
-        feedback_delta = (
-            (resonance - target["resonance"]) + (cohesion - target["cohesion"]) + (memory - target["memory"])
-        ) / 3.0
-        feedback_target = target["feedback"] + 0.55 * feedback_delta
-        feedback = _towards(_ensure_float(updated, "feedback"), feedback_target, 0.3)
+        feedback_delta = (resonance + cohesion + memory - feedback_reference) * _ONE_THIRD
+        feedback_target = target_feedback + 0.55 * feedback_delta
+        feedback = _towards(read("feedback"), feedback_target, 0.3)
 
-        entropy = _towards(_ensure_float(updated, "entropy"), target["entropy"], 0.12)
+        entropy = _towards(read("entropy"), target_entropy, 0.12)
 
         updated.update(
             {
@@ -171,30 +235,39 @@ def _harmonise_feedback_loops(target: Mapping[str, float]):
 
 
 def _diffuse_innovation_cycles(target: Mapping[str, float]):
+    target_innovation = target["innovation"]
+    target_feedback = target["feedback"]
+    target_cohesion = target["cohesion"]
+    target_adaptation = target["adaptation"]
+    target_exploration = target["exploration"]
+    target_stability = target["stability"]
+    target_memory = target["memory"]
+    target_safety = target["safety"]
+    target_turbulence = target["turbulence"]
+    adaptation_reference = target_innovation + target_feedback + target_cohesion
+    safety_reference = target_stability + target_memory + target_adaptation
+
     def apply(state: State, _ctx: object) -> State:
-        updated = dict(state)
+        updated = state
+        read = _reader(updated)
 
-        innovation = _towards(_ensure_float(updated, "innovation"), target["innovation"], 0.31)
-        cohesion = _ensure_float(updated, "cohesion")
-        feedback = _ensure_float(updated, "feedback")
+        innovation = _towards(read("innovation"), target_innovation, 0.31)
+        cohesion = read("cohesion")
+        feedback = read("feedback")
 
-        adaptation_delta = (
-            (innovation - target["innovation"]) + (feedback - target["feedback"]) + (cohesion - target["cohesion"])
-        ) / 3.0
-        adaptation_target = target["adaptation"] + 0.58 * adaptation_delta
-        adaptation = _towards(_ensure_float(updated, "adaptation"), adaptation_target, 0.3)
+        adaptation_delta = (innovation + feedback + cohesion - adaptation_reference) * _ONE_THIRD
+        adaptation_target = target_adaptation + 0.58 * adaptation_delta
+        adaptation = _towards(read("adaptation"), adaptation_target, 0.3)
 
-        exploration = _towards(_ensure_float(updated, "exploration"), target["exploration"], 0.29)
+        exploration = _towards(read("exploration"), target_exploration, 0.29)
 
-        stability = _ensure_float(updated, "stability")
-        memory = _ensure_float(updated, "memory")
-        safety_delta = (
-            (stability - target["stability"]) + (memory - target["memory"]) + (adaptation - target["adaptation"])
-        ) / 3.0
-        safety_target = target["safety"] + 0.54 * safety_delta
-        safety = _towards(_ensure_float(updated, "safety"), safety_target, 0.28)
+        stability = read("stability")
+        memory = read("memory")
+        safety_delta = (stability + memory + adaptation - safety_reference) * _ONE_THIRD
+        safety_target = target_safety + 0.54 * safety_delta
+        safety = _towards(read("safety"), safety_target, 0.28)
 
-        turbulence = _towards(_ensure_float(updated, "turbulence"), target["turbulence"], 0.17)
+        turbulence = _towards(read("turbulence"), target_turbulence, 0.17)
 
         updated.update(
             {
@@ -211,38 +284,54 @@ def _diffuse_innovation_cycles(target: Mapping[str, float]):
 
 
 def _synchronise_temporal_layers(target: Mapping[str, float]):
+    target_energy = target["energy"]
+    target_innovation = target["innovation"]
+    target_exploration = target["exploration"]
+    target_stability = target["stability"]
+    target_safety = target["safety"]
+    target_feedback = target["feedback"]
+    target_resonance = target["resonance"]
+    target_adaptation = target["adaptation"]
+    target_memory = target["memory"]
+    target_entropy = target["entropy"]
+    target_turbulence = target["turbulence"]
+    horizon_reference = target_energy + target_innovation + target_exploration
+    anchor_reference = target_stability + target_safety + target_feedback
+
     def apply(state: State, _ctx: object) -> State:
-        updated = dict(state)
-
-        energy = _ensure_float(updated, "energy")
-        innovation = _ensure_float(updated, "innovation")
-        exploration = _ensure_float(updated, "exploration")
-        stability = _ensure_float(updated, "stability")
-        safety = _ensure_float(updated, "safety")
-        feedback = _ensure_float(updated, "feedback")
-
-        horizon_delta = (
-            (energy - target["energy"]) + (innovation - target["innovation"]) + (exploration - target["exploration"])
-        ) / 3.0
-        anchor_delta = (
-            (stability - target["stability"]) + (safety - target["safety"]) + (feedback - target["feedback"])
-        ) / 3.0
+        updated = state
+        read = _reader(updated)
+
+        energy = read("energy")
+        innovation = read("innovation")
+        exploration = read("exploration")
+        stability = read("stability")
+        safety = read("safety")
+        feedback = read("feedback")
+        resonance = read("resonance")
+        adaptation = read("adaptation")
+        memory = read("memory")
+        entropy = read("entropy")
+        turbulence = read("turbulence")
+
+        horizon_delta = (energy + innovation + exploration - horizon_reference) * _ONE_THIRD
+        anchor_delta = (stability + safety + feedback - anchor_reference) * _ONE_THIRD
         equilibrium_delta = 0.5 * (horizon_delta + anchor_delta)
 
-        energy_target = target["energy"] + 0.6 * equilibrium_delta
-        stability_target = target["stability"] + 0.6 * equilibrium_delta
-        resonance_target = target["resonance"] + 0.55 * equilibrium_delta
-        adaptation_target = target["adaptation"] + 0.55 * equilibrium_delta
-        memory_target = target["memory"] + 0.5 * equilibrium_delta
+        energy_target = target_energy + 0.6 * equilibrium_delta
+        stability_target = target_stability + 0.6 * equilibrium_delta
+        resonance_target = target_resonance + 0.55 * equilibrium_delta
+        adaptation_target = target_adaptation + 0.55 * equilibrium_delta
+        memory_target = target_memory + 0.5 * equilibrium_delta
 
         energy = _towards(energy, energy_target, 0.24)
         stability = _towards(stability, stability_target, 0.24)
-        resonance = _towards(_ensure_float(updated, "resonance"), resonance_target, 0.24)
-        adaptation = _towards(_ensure_float(updated, "adaptation"), adaptation_target, 0.24)
-        memory = _towards(_ensure_float(updated, "memory"), memory_target, 0.22)
+        resonance = _towards(resonance, resonance_target, 0.24)
+        adaptation = _towards(adaptation, adaptation_target, 0.24)
+        memory = _towards(memory, memory_target, 0.22)
 
-        entropy = _towards(_ensure_float(updated, "entropy"), target["entropy"], 0.18)
-        turbulence = _towards(_ensure_float(updated, "turbulence"), target["turbulence"], 0.18)
+        entropy = _towards(entropy, target_entropy, 0.18)
+        turbulence = _towards(turbulence, target_turbulence, 0.18)
 
         updated.update(
             {
@@ -260,18 +349,50 @@ def _synchronise_temporal_layers(target: Mapping[str, float]):
     return apply
 
 
-def _build_dynamics_rules(target: Mapping[str, float]) -> Sequence[Rule]:
-    return (
+def _build_dynamics_rules(
+    target: Mapping[str, float],
+    *,
+    fused: bool = True,
+    settle_tolerance: Optional[float] = None,
+) -> Sequence[Rule]:
+    rules = (
         rule("stabilise-energy-flow", _stabilise_energy_flow(target)),
         rule("harmonise-feedback-loops", _harmonise_feedback_loops(target)),
         rule("diffuse-innovation-cycles", _diffuse_innovation_cycles(target)),
         rule("synchronise-temporal-layers", _synchronise_temporal_layers(target), priority=-1),
     )
+    if fused:
+        return (fuse_rules("complex-dynamics-epoch", rules, settle_tolerance=settle_tolerance),)
+    return rules
+
+
+@lru_cache(maxsize=32)
+def _rules_for_blueprint(
+    blueprint: ComplexDynamicsBlueprint,
+    fused: bool,
+    settle_tolerance: Optional[float],
+) -> Tuple[Mapping[str, float], Sequence[Rule]]:
+    """Return the bounded target and rules for ``blueprint``.
+
+    The rules only close over the target floats, so universes designed from
+    equal blueprints can share them.
+    """
+
+    target = {key: _bounded(float(value)) for key, value in blueprint.as_state().items()}
+    rules = _build_dynamics_rules(target, fused=fused, settle_tolerance=settle_tolerance)
+    return MappingProxyType(target), rules
 
 
 def complex_dynamics_metric(previous: State, current: State) -> float:
     """Sum of coordinate-wise distances across the dynamical state."""
 
+    if (
+        isinstance(previous, ArrayState)
+        and isinstance(current, ArrayState)
+        and previous.layout == current.layout == _DYNAMICS_KEYS
+    ):
+        return current.l1_distance(previous)
+
     delta = 0.0
     for key in _DYNAMICS_KEYS:
         delta += abs(_ensure_float(current, key) - _ensure_float(previous, key))
@@ -283,25 +404,40 @@ def design_complex_dynamics_universe(
     *,
     blueprint: Optional[ComplexDynamicsBlueprint] = None,
     observers: Optional[Sequence[Observer]] = None,
+    fused: bool = True,
+    settle_tolerance: Optional[float] = None,
 ) -> Universe:
-    """Instantiate a universe that realises the supplied complex dynamics blueprint."""
+    """Instantiate a universe that realises the supplied complex dynamics blueprint.
+
+    The four dynamics rules are fused into a single rule per epoch.  Pass
+    ``fused=False`` to register them individually, e.g. to observe a ``STEP``
+    event after each rule.  ``settle_tolerance`` lets the fused rule discard an
+    epoch whose rules together move no coordinate beyond the tolerance.
+    """
 
     if blueprint is None:
         blueprint = ComplexDynamicsBlueprint()
-    target = {key: _bounded(float(value)) for key, value in blueprint.as_state().items()}
-
-    if initial_state is None:
-        state = dict(DEFAULT_COMPLEX_DYNAMICS)
+    target, rules = _rules_for_blueprint(blueprint, fused, settle_tolerance)
+
+    state: ComplexDynamicsState
+    if initial_state is None or all(key in _DYNAMICS_INDEX for key in initial_state):
+        # The rules update their coordinates in place, so a fixed-layout buffer
+        # lets the engine copy the whole state with a single flat copy.  The
+        # defaults already lie in [0, 1]; only the supplied overrides need
+        # bounding.
+        state = ArrayState(_DYNAMICS_KEYS, _DEFAULT_DYNAMICS_VALUES, index=_DYNAMICS_INDEX)
+        if initial_state is not None:
+            state.update({key: _bounded(float(value)) for key, value in initial_state.items()})
     else:
         state = dict(DEFAULT_COMPLEX_DYNAMICS)
         for key, value in initial_state.items():
             state[key] = float(value)
 
-    for key, target_value in target.items():
-        state.setdefault(key, float(target_value))
-        state[key] = _bounded(float(state[key]))
+        for key, target_value in target.items():
+            state.setdefault(key, float(target_value))
+            state[key] = _bounded(float(state[key]))
 
-    return God.universe(state=state, rules=_build_dynamics_rules(target), observers=observers)
+    return God.universe(state=state, rules=rules, observers=observers)
 
 
 def run_complex_dynamics(
@@ -311,6 +447,7 @@ def run_complex_dynamics(
     epsilon: float = 1e-4,
     max_epoch: int = 192,
     observers: Optional[Sequence[Observer]] = None,
+    fused: bool = True,
 ) -> FixpointResult:
     """Run the complex dynamical system until it matches the blueprint."""
 
@@ -318,6 +455,7 @@ def run_complex_dynamics(
         initial_state,
         blueprint=blueprint,
         observers=observers,
+        fused=fused,
     )
     return fixpoint(universe, metric=complex_dynamics_metric, epsilon=epsilon, max_epoch=max_epoch)
 
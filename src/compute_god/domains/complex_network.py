@@ -19,9 +19,21 @@ one-liner to evolve an initial state until the layers lock into synchrony.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, MutableMapping, Optional, Sequence
-
-from compute_god.core import FixpointResult, God, Observer, Rule, State, Universe, fixpoint, rule
+from functools import lru_cache, partial
+from typing import Callable, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+from compute_god.core import (
+    ArrayState,
+    FixpointResult,
+    God,
+    Observer,
+    Rule,
+    State,
+    Universe,
+    fixpoint,
+    fuse_rules,
+    rule,
+)
 
 ComplexNetworkState = MutableMapping[str, float]
 
@@ -43,6 +55,14 @@ _COMPLEX_KEYS: Sequence[str] = (
     "turbulence",
     "entropy",
 )
+_COMPLEX_INDEX = {key: index for index, key in enumerate(_COMPLEX_KEYS)}
+# ``_COMPLEX_KEYS`` lists the fourteen positive layers first so the array
+# representation can address them as one contiguous slice.
+_POSITIVE_SLICE = slice(0, _COMPLEX_INDEX["turbulence"])
+_POSITIVE_KEYS: Sequence[str] = _COMPLEX_KEYS[_POSITIVE_SLICE]
+_DAMPED_SLICE = slice(_COMPLEX_INDEX["turbulence"], _COMPLEX_INDEX["entropy"] + 1)
+# Turbulence and entropy reductions applied when the feedback loops close.
+_FEEDBACK_DAMPING = (0.07, 0.05)
 
 
 def _ensure_float(state: MutableMapping[str, object], key: str, default: float = 0.0) -> float:
@@ -53,199 +73,33 @@ def _ensure_float(state: MutableMapping[str, object], key: str, default: float =
         raise TypeError(f"state[{key!r}] must be numeric, got {value!r}") from None
 
 
-def _towards(value: float, target: float, rate: float) -> float:
-    return value + (target - value) * rate
-
-
-def _bounded(value: float) -> float:
-    return max(0.0, min(1.0, value))
-
-
-def _dampen(value: float, reduction: float) -> float:
-    value -= reduction
-    return max(0.0, value)
-
-
-def _stitch_structural_layers(state: State, _ctx: object) -> State:
-    updated = dict(state)
-
-    structure = _towards(_ensure_float(updated, "structure"), 1.0, 0.32)
-    modularity = _towards(_ensure_float(updated, "modularity", structure), structure, 0.35)
-    redundancy = _towards(_ensure_float(updated, "redundancy", modularity), (structure + modularity) / 2.0, 0.3)
-    coherence = _towards(
-        _ensure_float(updated, "coherence", (structure + modularity) / 2.0),
-        (structure + modularity + redundancy) / 3.0,
-        0.34,
-    )
-
-    turbulence = _dampen(_ensure_float(updated, "turbulence", 0.2), 0.06)
-    entropy = _dampen(_ensure_float(updated, "entropy", 0.18), 0.04)
-
-    updated.update(
-        {
-            "structure": _bounded(structure),
-            "modularity": _bounded(modularity),
-            "redundancy": _bounded(redundancy),
-            "coherence": _bounded(coherence),
-            "turbulence": _bounded(turbulence),
-            "entropy": _bounded(entropy),
-        }
-    )
-    return updated
-
-
-def _evolve_ecological_dynamics(state: State, _ctx: object) -> State:
-    updated = dict(state)
-
-    structure = _ensure_float(updated, "structure")
-    function = _towards(_ensure_float(updated, "function"), 1.0, 0.28)
-    diversity = _towards(_ensure_float(updated, "diversity"), 1.0, 0.26)
-    flow = _towards(_ensure_float(updated, "flow", function), (structure + function + diversity) / 3.0, 0.33)
-    ecology = _towards(
-        _ensure_float(updated, "ecology", flow),
-        (function + diversity + flow) / 3.0,
-        0.3,
-    )
-    adaptation = _towards(
-        _ensure_float(updated, "adaptation"),
-        (diversity + flow + ecology) / 3.0,
-        0.32,
-    )
-    redundancy = _ensure_float(updated, "redundancy")
-    resilience = _towards(
-        _ensure_float(updated, "resilience"),
-        (redundancy + adaptation + ecology) / 3.0,
-        0.31,
-    )
-
-    turbulence = _dampen(_ensure_float(updated, "turbulence"), 0.05)
-    entropy = _dampen(_ensure_float(updated, "entropy"), 0.03)
-
-    updated.update(
-        {
-            "function": _bounded(function),
-            "diversity": _bounded(diversity),
-            "flow": _bounded(flow),
-            "ecology": _bounded(ecology),
-            "adaptation": _bounded(adaptation),
-            "resilience": _bounded(resilience),
-            "turbulence": _bounded(turbulence),
-            "entropy": _bounded(entropy),
-        }
-    )
-    return updated
-
-
-def _align_cognitive_social(state: State, _ctx: object) -> State:
-    updated = dict(state)
-
-    cognition = _towards(_ensure_float(updated, "cognition"), 1.0, 0.29)
-    governance = _towards(_ensure_float(updated, "governance"), 1.0, 0.27)
-    trust = _towards(
-        _ensure_float(updated, "trust", (cognition + governance) / 2.0),
-        (cognition + governance) / 2.0,
-        0.34,
-    )
-
-    flow = _ensure_float(updated, "flow")
-    ecology = _ensure_float(updated, "ecology")
-    synchrony = _towards(
-        _ensure_float(updated, "synchrony", (flow + trust) / 2.0),
-        (flow + trust + cognition + governance + ecology) / 5.0,
-        0.36,
-    )
-    coherence = _towards(
-        _ensure_float(updated, "coherence"),
-        (cognition + trust + governance + synchrony) / 4.0,
-        0.33,
-    )
-
-    entropy = _dampen(_ensure_float(updated, "entropy"), 0.02)
-
-    updated.update(
-        {
-            "cognition": _bounded(cognition),
-            "governance": _bounded(governance),
-            "trust": _bounded(trust),
-            "synchrony": _bounded(synchrony),
-            "coherence": _bounded(coherence),
-            "entropy": _bounded(entropy),
-        }
-    )
-    return updated
-
+def _reader(state: State) -> Callable[..., float]:
+    """Return a float accessor for ``state``.
 
-def _close_feedback_loops(state: State, _ctx: object) -> State:
-    updated = dict(state)
+    ``ArrayState`` slots always hold floats, so only plain mappings go through
+    the validating :func:`_ensure_float`.
+    """
 
-    positive_keys = [
-        "structure",
-        "function",
-        "cognition",
-        "ecology",
-        "resilience",
-        "adaptation",
-        "governance",
-        "trust",
-        "flow",
-        "synchrony",
-        "coherence",
-        "modularity",
-        "diversity",
-        "redundancy",
-    ]
-    average = sum(_ensure_float(updated, key) for key in positive_keys) / len(positive_keys)
+    if isinstance(state, ArrayState):
+        return state.get
+    return partial(_ensure_float, state)
 
-    for key in positive_keys:
-        value = _towards(_ensure_float(updated, key), (average + 1.0) / 2.0, 0.24)
-        updated[key] = _bounded(value)
-
-    turbulence = _dampen(_ensure_float(updated, "turbulence"), 0.07)
-    entropy = _dampen(_ensure_float(updated, "entropy"), 0.05)
-
-    updated.update({"turbulence": _bounded(turbulence), "entropy": _bounded(entropy)})
-    return updated
-
-
-DEFAULT_COMPLEX_NETWORK: ComplexNetworkState = {
-    "structure": 0.48,
-    "function": 0.46,
-    "cognition": 0.44,
-    "ecology": 0.45,
-    "resilience": 0.42,
-    "adaptation": 0.43,
-    "governance": 0.41,
-    "trust": 0.4,
-    "flow": 0.47,
-    "synchrony": 0.39,
-    "coherence": 0.43,
-    "modularity": 0.45,
-    "diversity": 0.44,
-    "redundancy": 0.42,
-    "turbulence": 0.28,
-    "entropy": 0.24,
-}
 
+def _towards(value: float, target: float, rate: float) -> float:
+    return value + (target - value) * rate
 
-def _build_complex_rules() -> Sequence[Rule]:
-    return (
-        rule("stitch-structural-layers", _stitch_structural_layers),
-        rule("evolve-ecological-dynamics", _evolve_ecological_dynamics),
-        rule("align-cognitive-social", _align_cognitive_social),
-        rule("close-feedback-loops", _close_feedback_loops, priority=-1),
-    )
 
+def _bounded(value: float) -> float:
+    # Comparisons avoid two builtin calls on every coordinate write.
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
 
-def complex_network_metric(previous: State, current: State) -> float:
-    """Measure coordinate-wise differences across the complex network state."""
 
-    delta = 0.0
-    for key in _COMPLEX_KEYS:
-        delta += abs(_ensure_float(current, key) - _ensure_float(previous, key))
-    return delta
+def _dampen(value: float, reduction: float, floor: float = 0.0) -> float:
+    value -= reduction
+    return floor if value < floor else value
 
 
-@dataclass
+@dataclass(frozen=True)
 class ComplexNetworkBlueprint:
     """Target configuration for the multilayer complex network."""
 
@@ -287,29 +141,303 @@ class ComplexNetworkBlueprint:
         }
 
 
+def _stitch_structural_layers(target: Mapping[str, float]):
+    target_structure = target["structure"]
+    floor_turbulence = target["turbulence"]
+    floor_entropy = target["entropy"]
+
+    def apply(state: State, _ctx: object) -> State:
+        updated = state
+        read = _reader(updated)
+
+        structure = _towards(read("structure"), target_structure, 0.32)
+        modularity = _towards(read("modularity", structure), structure, 0.35)
+        redundancy = _towards(read("redundancy", modularity), (structure + modularity) / 2.0, 0.3)
+        coherence = _towards(
+            read("coherence", (structure + modularity) / 2.0),
+            (structure + modularity + redundancy) / 3.0,
+            0.34,
+        )
+
+        turbulence = _dampen(read("turbulence", 0.2), 0.06, floor_turbulence)
+        entropy = _dampen(read("entropy", 0.18), 0.04, floor_entropy)
+
+        updated.update(
+            {
+                "structure": _bounded(structure),
+                "modularity": _bounded(modularity),
+                "redundancy": _bounded(redundancy),
+                "coherence": _bounded(coherence),
+                "turbulence": _bounded(turbulence),
+                "entropy": _bounded(entropy),
+            }
+        )
+        return updated
+
+    return apply
+
+
+def _evolve_ecological_dynamics(target: Mapping[str, float]):
+    target_function = target["function"]
+    target_diversity = target["diversity"]
+    floor_turbulence = target["turbulence"]
+    floor_entropy = target["entropy"]
+
+    def apply(state: State, _ctx: object) -> State:
+        updated = state
+        read = _reader(updated)
+
+        structure = read("structure")
+        function = _towards(read("function"), target_function, 0.28)
+        diversity = _towards(read("diversity"), target_diversity, 0.26)
+        flow = _towards(read("flow", function), (structure + function + diversity) / 3.0, 0.33)
+        ecology = _towards(
+            read("ecology", flow),
+            (function + diversity + flow) / 3.0,
+            0.3,
+        )
+        adaptation = _towards(
+            read("adaptation"),
+            (diversity + flow + ecology) / 3.0,
+            0.32,
+        )
+        redundancy = read("redundancy")
+        resilience = _towards(
+            read("resilience"),
+            (redundancy + adaptation + ecology) / 3.0,
+            0.31,
+        )
+
+        turbulence = _dampen(read("turbulence"), 0.05, floor_turbulence)
+        entropy = _dampen(read("entropy"), 0.03, floor_entropy)
+
+        updated.update(
+            {
+                "function": _bounded(function),
+                "diversity": _bounded(diversity),
+                "flow": _bounded(flow),
+                "ecology": _bounded(ecology),
+                "adaptation": _bounded(adaptation),
+                "resilience": _bounded(resilience),
+                "turbulence": _bounded(turbulence),
+                "entropy": _bounded(entropy),
+            }
+        )
+        return updated
+
+    return apply
+
+
+def _align_cognitive_social(target: Mapping[str, float]):
+    target_cognition = target["cognition"]
+    target_governance = target["governance"]
+    floor_entropy = target["entropy"]
+
+    def apply(state: State, _ctx: object) -> State:
+        updated = state
+        read = _reader(updated)
+
+        cognition = _towards(read("cognition"), target_cognition, 0.29)
+        governance = _towards(read("governance"), target_governance, 0.27)
+        trust = _towards(
+            read("trust", (cognition + governance) / 2.0),
+            (cognition + governance) / 2.0,
+            0.34,
+        )
+
+        flow = read("flow")
+        ecology = read("ecology")
+        synchrony = _towards(
+            read("synchrony", (flow + trust) / 2.0),
+            (flow + trust + cognition + governance + ecology) / 5.0,
+            0.36,
+        )
+        coherence = _towards(
+            read("coherence"),
+            (cognition + trust + governance + synchrony) / 4.0,
+            0.33,
+        )
+
+        entropy = _dampen(read("entropy"), 0.02, floor_entropy)
+
+        updated.update(
+            {
+                "cognition": _bounded(cognition),
+                "governance": _bounded(governance),
+                "trust": _bounded(trust),
+                "synchrony": _bounded(synchrony),
+                "coherence": _bounded(coherence),
+                "entropy": _bounded(entropy),
+            }
+        )
+        return updated
+
+    return apply
+
+
+def _close_feedback_loops(target: Mapping[str, float]):
+    positive_targets = tuple((key, target[key]) for key in _POSITIVE_KEYS)
+    floor_turbulence = target["turbulence"]
+    floor_entropy = target["entropy"]
+    # Target buffers aligned with the state slices used by the vectorised path.
+    vector_targets = ArrayState(_POSITIVE_KEYS, (value for _, value in positive_targets))
+    vector_floors = ArrayState(("turbulence", "entropy"), (floor_turbulence, floor_entropy))
+
+    def apply(state: State, _ctx: object) -> State:
+        if isinstance(state, ArrayState) and state.vectorised and vector_targets.vectorised:
+            values = state.array
+            positive = values[_POSITIVE_SLICE]
+            average = positive.mean()
+            positive += ((average + vector_targets.array) / 2.0 - positive) * 0.24
+            positive.clip(0.0, 1.0, out=positive)
+            damped = values[_DAMPED_SLICE]
+            damped -= _FEEDBACK_DAMPING
+            damped.clip(vector_floors.array, 1.0, out=damped)
+            return state
+
+        updated = state
+        read = _reader(updated)
+
+        average = sum(read(key) for key in _POSITIVE_KEYS) / len(_POSITIVE_KEYS)
+
+        for key, key_target in positive_targets:
+            value = _towards(read(key), (average + key_target) / 2.0, 0.24)
+            updated[key] = _bounded(value)
+
+        turbulence = _dampen(read("turbulence"), 0.07, floor_turbulence)
+        entropy = _dampen(read("entropy"), 0.05, floor_entropy)
+
+        updated.update({"turbulence": _bounded(turbulence), "entropy": _bounded(entropy)})
+        return updated
+
+    return apply
+
+
+DEFAULT_COMPLEX_NETWORK: ComplexNetworkState = {
+    "structure": 0.48,
+    "function": 0.46,
+    "cognition": 0.44,
+    "ecology": 0.45,
+    "resilience": 0.42,
+    "adaptation": 0.43,
+    "governance": 0.41,
+    "trust": 0.4,
+    "flow": 0.47,
+    "synchrony": 0.39,
+    "coherence": 0.43,
+    "modularity": 0.45,
+    "diversity": 0.44,
+    "redundancy": 0.42,
+    "turbulence": 0.28,
+    "entropy": 0.24,
+}
+# Defaults in layout order; the canonical universe fills its buffer straight
+# from this tuple instead of rebuilding a dictionary entry by entry.
+_DEFAULT_NETWORK_VALUES: Tuple[float, ...] = tuple(
+    DEFAULT_COMPLEX_NETWORK[key] for key in _COMPLEX_KEYS
+)
+
+
+@lru_cache(maxsize=32)
+def _layer_rules(blueprint: ComplexNetworkBlueprint) -> Sequence[Rule]:
+    """Return the layer rules steering towards ``blueprint``.
+
+    The rules only close over the blueprint targets, so universes built from
+    equal blueprints share them.
+    """
+
+    target = {key: _bounded(float(value)) for key, value in blueprint.as_state().items()}
+    return (
+        rule("stitch-structural-layers", _stitch_structural_layers(target)),
+        rule("evolve-ecological-dynamics", _evolve_ecological_dynamics(target)),
+        rule("align-cognitive-social", _align_cognitive_social(target)),
+        rule("close-feedback-loops", _close_feedback_loops(target), priority=-1),
+    )
+
+
+# Lift the canonical blueprint's rules into ``Rule`` objects (including the
+# signature inspection done by ``rule``) once at import time instead of on the
+# first universe construction.
+_layer_rules(ComplexNetworkBlueprint())
+
+
+@lru_cache(maxsize=32)
+def _build_complex_rules(
+    blueprint: ComplexNetworkBlueprint,
+    *,
+    fused: bool = True,
+    settle_tolerance: Optional[float] = None,
+) -> Sequence[Rule]:
+    rules = _layer_rules(blueprint)
+    if fused:
+        return (fuse_rules("complex-network-epoch", rules, settle_tolerance=settle_tolerance),)
+    return rules
+
+
+def complex_network_metric(previous: State, current: State) -> float:
+    """Measure coordinate-wise differences across the complex network state."""
+
+    if (
+        isinstance(previous, ArrayState)
+        and isinstance(current, ArrayState)
+        and previous.layout == current.layout == _COMPLEX_KEYS
+    ):
+        return current.l1_distance(previous)
+
+    delta = 0.0
+    for key in _COMPLEX_KEYS:
+        delta += abs(_ensure_float(current, key) - _ensure_float(previous, key))
+    return delta
+
+
 def ideal_complex_network_universe(
     initial_state: Optional[Mapping[str, float]] = None,
     *,
+    blueprint: Optional[ComplexNetworkBlueprint] = None,
     observers: Optional[Sequence[Observer]] = None,
+    fused: bool = True,
+    settle_tolerance: Optional[float] = None,
 ) -> Universe:
-    """Build the canonical complex network universe."""
+    """Build the canonical complex network universe.
+
+    The layers are pulled towards ``blueprint`` (the fully synchronised
+    :class:`ComplexNetworkBlueprint` by default).  The layer rules run as one
+    fused rule per epoch unless ``fused=False``.  ``settle_tolerance`` lets the
+    fused rule discard an epoch whose layers together move no coordinate
+    beyond the tolerance.
+    """
+
+    if blueprint is None:
+        blueprint = ComplexNetworkBlueprint()
 
     state: ComplexNetworkState
     if initial_state is None:
-        state = dict(DEFAULT_COMPLEX_NETWORK)
+        state = ArrayState(_COMPLEX_KEYS, _DEFAULT_NETWORK_VALUES, index=_COMPLEX_INDEX)
     else:
         state = {key: float(value) for key, value in initial_state.items()}
-    return God.universe(state=state, rules=_build_complex_rules(), observers=observers)
+        if len(state) == len(_COMPLEX_KEYS) and all(key in state for key in _COMPLEX_KEYS):
+            # Partial or extended states keep the dictionary representation so
+            # the rules can fall back to their per-key defaults.
+            state = ArrayState.from_mapping(_COMPLEX_KEYS, state, index=_COMPLEX_INDEX)
+    rules = _build_complex_rules(blueprint, fused=fused, settle_tolerance=settle_tolerance)
+    return God.universe(state=state, rules=rules, observers=observers)
 
 
 def run_complex_network(
     initial_state: Optional[Mapping[str, float]] = None,
     *,
+    blueprint: Optional[ComplexNetworkBlueprint] = None,
     epsilon: float = 1e-3,
     max_epoch: int = 128,
     observers: Optional[Sequence[Observer]] = None,
+    fused: bool = True,
 ) -> FixpointResult:
     """Run the complex network universe until the layers synchronise."""
 
-    universe = ideal_complex_network_universe(initial_state, observers=observers)
+    universe = ideal_complex_network_universe(
+        initial_state,
+        blueprint=blueprint,
+        observers=observers,
+        fused=fused,
+    )
     return fixpoint(universe, metric=complex_network_metric, epsilon=epsilon, max_epoch=max_epoch)
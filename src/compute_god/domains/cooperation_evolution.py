@@ -15,9 +15,14 @@ community rewards consistent cooperative behaviour.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from typing import Mapping, MutableMapping, Sequence
 
+try:  # pragma: no cover - numpy only backs the batched sweep helper
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
+
 
 def _bounded(value: float) -> float:
     """Clamp ``value`` to the inclusive ``[0.0, 1.0]`` range."""
@@ -127,10 +132,122 @@ def run_cooperation_evolution(
     return history
 
 
+COOPERATION_BATCH_KEYS: Sequence[str] = (
+    "cooperation",
+    "defection",
+    "trust",
+    "reputation",
+    "stability",
+    "avg_payoff",
+)
+
+
+def run_cooperation_evolution_batch(
+    params_batch: Sequence[CooperationParameters],
+    *,
+    initial_states: Mapping[str, float] | Sequence[Mapping[str, float]] | None = None,
+    epochs: int = 96,
+) -> np.ndarray:
+    """Evolve one population per parameter set in lock-step.
+
+    The update mirrors :func:`evolve_cooperation` with every scalar replaced by
+    a length-``N`` array, so parameter sweeps run through NumPy's elementwise
+    loops instead of ``N`` Python trajectories.  ``initial_states`` may be a
+    single mapping shared by every population or one mapping per parameter
+    set; as in :func:`run_cooperation_evolution`, an empty mapping stands for
+    :data:`DEFAULT_COOPERATION_STATE`.  The result has shape
+    ``(epochs + 1, N, 6)`` with the last axis ordered as
+    :data:`COOPERATION_BATCH_KEYS`; the payoff of the initial row is ``nan``
+    because no update has been played yet.
+    """
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        raise ImportError("run_cooperation_evolution_batch requires numpy")
+
+    count = len(params_batch)
+    if initial_states is None or isinstance(initial_states, Mapping):
+        initial_states = [initial_states] * count
+    if len(initial_states) != count:
+        raise ValueError("initial_states must match the number of parameter sets")
+    # Like ``run_cooperation_evolution``, an empty state means the default.
+    initial_states = [state or DEFAULT_COOPERATION_STATE for state in initial_states]
+
+    (
+        reward,
+        temptation,
+        punishment,
+        sucker,
+        learning_rate,
+        mutation_rate,
+        trust_feedback,
+        reputation_feedback,
+    ) = np.array([astuple(params) for params in params_batch], dtype=np.float64).reshape(count, 8).T
+
+    cooperation = np.array([float(state.get("cooperation", 0.5)) for state in initial_states])
+    defection = np.array(
+        [
+            float(state.get("defection", 1.0 - _bounded(float(state.get("cooperation", 0.5)))))
+            for state in initial_states
+        ]
+    )
+    trust = np.array([float(state.get("trust", 0.4)) for state in initial_states])
+    reputation = np.array([float(state.get("reputation", 0.4)) for state in initial_states])
+    stability = np.array([float(state.get("stability", 0.4)) for state in initial_states])
+
+    epochs = max(0, epochs)
+    history = np.empty((epochs + 1, count, len(COOPERATION_BATCH_KEYS)), dtype=np.float64)
+    history[0] = np.stack(
+        (cooperation, defection, trust, reputation, stability, np.full(count, np.nan)),
+        axis=-1,
+    )
+
+    for epoch in range(1, epochs + 1):
+        cooperation = np.clip(cooperation, 0.0, 1.0)
+        defection = np.clip(defection, 0.0, 1.0)
+        total = cooperation + defection
+        occupied = total > 0
+        cooperation = np.where(occupied, cooperation / np.where(occupied, total, 1.0), 0.5)
+        defection = np.where(occupied, 1.0 - cooperation, 0.5)
+
+        payoff_coop = reward * cooperation + sucker * defection
+        payoff_defect = temptation * cooperation + punishment * defection
+        avg_payoff = cooperation * payoff_coop + defection * payoff_defect
+
+        base_cooperation = cooperation + learning_rate * cooperation * (payoff_coop - avg_payoff)
+        base_cooperation = (1.0 - mutation_rate) * base_cooperation + mutation_rate * 0.5
+        base_cooperation = np.clip(base_cooperation, 0.0, 1.0)
+
+        trust = np.clip(trust, 0.0, 1.0)
+        reputation = np.clip(reputation, 0.0, 1.0)
+        stability = np.clip(stability, 0.0, 1.0)
+
+        trust = trust + (base_cooperation - trust) * trust_feedback
+        reputation = reputation + (trust - reputation) * reputation_feedback
+
+        social_target = np.clip(0.55 * trust + 0.45 * base_cooperation, 0.0, 1.0)
+        cooperation = np.clip(base_cooperation + (social_target - base_cooperation) * 0.5, 0.0, 1.0)
+        defection = np.clip(1.0 - cooperation, 0.0, 1.0)
+
+        stability_target = (cooperation + trust + reputation) / 3.0
+        stability = stability + (stability_target - stability) * 0.3
+
+        row = history[epoch]
+        row[:, 0] = cooperation
+        row[:, 1] = defection
+        row[:, 2] = trust
+        row[:, 3] = reputation
+        row[:, 4] = stability
+        row[:, 5] = avg_payoff
+
+    return history
+
+
 __all__ = [
+    "COOPERATION_BATCH_KEYS",
     "CooperationParameters",
     "CooperationState",
     "DEFAULT_COOPERATION_STATE",
     "evolve_cooperation",
     "run_cooperation_evolution",
+    "run_cooperation_evolution_batch",
 ]
@@ -17,28 +17,78 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Dict, Iterable, List, Mapping, Tuple
+from math import gcd, isqrt, lcm, prod
+from operator import mul
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
 
 
 FractionalMatrix = Tuple[Tuple[Fraction, ...], ...]
+# Flat row-major integer entries with the number of rows and columns.
+IntegerMatrix = Tuple[Tuple[int, ...], int, int]
+
+
+def _fraction_raw(numerator: int, denominator: int) -> Fraction:
+    """Build a :class:`Fraction` without re-normalising it.
+
+    The caller guarantees ``denominator > 0`` and ``gcd(numerator,
+    denominator) == 1``; skipping the checks in ``Fraction.__new__`` matters
+    in the inner loops of the matrix helpers below.
+    """
+
+    result = object.__new__(Fraction)
+    result._numerator = numerator
+    result._denominator = denominator
+    return result
+
+
+def _reduced(numerator: int, denominator: int) -> Fraction:
+    """Return ``numerator / denominator`` for a non-zero ``denominator``."""
+
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    divisor = gcd(numerator, denominator)
+    if divisor != 1:
+        numerator //= divisor
+        denominator //= divisor
+    return _fraction_raw(numerator, denominator)
 
 
-def _to_fraction(value: float | int | Fraction) -> Fraction:
+# Floats whose binary denominator has at most this many bits are taken
+# exactly.  ``limit_denominator`` leaves any denominator up to 10**6 unchanged,
+# so the default of 20 bits (2**19 <= 10**6) skips the continued fraction walk
+# without changing any result; larger values trade decimal readability for
+# speed.
+_DENOM_THRESHOLD = 20
+
+
+def _to_fraction(value: float | int | Fraction, *, exact: bool = False) -> Fraction:
     """Return ``value`` as a :class:`Fraction`.
 
     The helper accepts ``int`` and ``float`` inputs in addition to an existing
     :class:`Fraction`.  Floats are converted via ``Fraction(value).limit_denominator``
-    so examples written with decimal coefficients remain readable yet exact.
+    so examples written with decimal coefficients remain readable yet exact;
+    floats with a short binary denominator such as ``1.5`` are already exact
+    and skip the approximation.  With ``exact=True`` every float keeps its
+    binary value through ``float.as_integer_ratio``.
     """
 
     if isinstance(value, Fraction):
         return value
     if isinstance(value, int):
         return Fraction(value)
-    return Fraction(value).limit_denominator()
+    numerator, denominator = value.as_integer_ratio()
+    if exact or denominator.bit_length() <= _DENOM_THRESHOLD:
+        # ``as_integer_ratio`` is already in lowest terms.
+        return _fraction_raw(numerator, denominator)
+    return Fraction(numerator, denominator).limit_denominator()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CochainSpace:
     """A space of qualities that appear in a courtship story."""
 
@@ -53,7 +103,7 @@ class CochainSpace:
         return len(self.basis)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CourtshipDifferential:
     """A linear map between two cochain spaces."""
 
@@ -104,7 +154,12 @@ def _row_reduce(matrix: FractionalMatrix) -> Tuple[FractionalMatrix, int]:
         pivot_value = rows[pivot_row][pivot_col]
 
         # Normalise pivot row.
-        rows[pivot_row] = [value / pivot_value for value in rows[pivot_row]]
+        scale_num = pivot_value.denominator
+        scale_den = pivot_value.numerator
+        rows[pivot_row] = [
+            _reduced(value.numerator * scale_num, value.denominator * scale_den)
+            for value in rows[pivot_row]
+        ]
 
         # Eliminate other rows.
         for r in range(num_rows):
@@ -122,24 +177,238 @@ def _row_reduce(matrix: FractionalMatrix) -> Tuple[FractionalMatrix, int]:
     return tuple(tuple(entry for entry in row) for row in rows), rank
 
 
+def _integer_matrix(matrix: FractionalMatrix) -> IntegerMatrix:
+    """Return ``matrix`` scaled to integers as flat row-major entries and shape.
+
+    Every entry is brought over the lcm of all denominators.  A non-zero
+    scalar changes neither the rank nor whether a product vanishes, so the
+    flat integer form stands in for ``matrix`` in both checks, and it can be
+    handed to NumPy as one contiguous buffer.
+    """
+
+    scale = lcm(*(value.denominator for row in matrix for value in row))
+    entries = tuple(
+        value.numerator * (scale // value.denominator) for row in matrix for value in row
+    )
+    return entries, len(matrix), len(matrix[0])
+
+
+def _bareiss_rank(rows: List[List[int]]) -> int:
+    """Return the rank of the integer ``rows`` using fraction-free Bareiss elimination.
+
+    Every elimination step works on plain integers and divides exactly by the
+    previous pivot, which keeps the entries bounded by the minors of the
+    matrix instead of letting rational intermediates grow.  ``rows`` is
+    modified in place.
+    """
+
+    num_rows = len(rows)
+    num_cols = len(rows[0]) if rows else 0
+
+    rank = 0
+    previous = 1
+    pivot_col = 0
+    while rank < num_rows and pivot_col < num_cols:
+        pivot = None
+        for r in range(rank, num_rows):
+            if rows[r][pivot_col] != 0:
+                pivot = r
+                break
+
+        if pivot is None:
+            pivot_col += 1
+            continue
+
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_row = rows[rank]
+        pivot_value = pivot_row[pivot_col]
+        for r in range(rank + 1, num_rows):
+            row = rows[r]
+            factor = row[pivot_col]
+            # Entries left of the pivot column are already zero.
+            for c in range(pivot_col, num_cols):
+                row[c] = (pivot_value * row[c] - factor * pivot_row[c]) // previous
+
+        previous = pivot_value
+        rank += 1
+        pivot_col += 1
+
+    return rank
+
+
+_INT64_MAX = 2**63 - 1
+# Primes below 2**31: residues multiply without overflowing ``int64``.
+_RANK_PRIMES = (2147483647, 2147483629, 2147483587)
+_RANK_MODULUS = prod(_RANK_PRIMES)
+# Below this many entries NumPy's per-call overhead outweighs the Python loop.
+_MODULAR_RANK_MIN_ENTRIES = 64
+
+
+def _rank_mod_p(rows: "np.ndarray", p: int) -> int:
+    """Return the rank over GF(``p``) of the ``int64`` residue matrix ``rows``.
+
+    ``rows`` is reduced in place.  Each step only touches the trailing block
+    below and right of the pivot, since everything left of the pivot column
+    is already zero, so the work shrinks as the elimination proceeds.
+    """
+
+    num_rows, num_cols = rows.shape
+    rank = 0
+    for col in range(num_cols):
+        if rank == num_rows:
+            break
+        nonzero = np.flatnonzero(rows[rank:, col])
+        if not nonzero.size:
+            continue
+        pivot = rank + int(nonzero[0])
+        if pivot != rank:
+            rows[[rank, pivot], col:] = rows[[pivot, rank], col:]
+        pivot_row = rows[rank, col:]
+        pivot_row *= pow(int(pivot_row[0]), -1, p)
+        pivot_row %= p
+        below = rows[rank + 1 :, col:]
+        factors = below[:, 0].copy()
+        active = np.flatnonzero(factors)
+        if active.size:
+            block = below[active]
+            block -= factors[active, None] * pivot_row % p
+            block %= p
+            below[active] = block
+        rank += 1
+    return rank
+
+
+def _modular_rank(matrix: IntegerMatrix) -> Optional[int]:
+    """Return the rank of ``matrix`` from elimination modulo ``_RANK_PRIMES``.
+
+    The rank modulo ``p`` never exceeds the rational rank and only falls short
+    when ``p`` divides every maximal non-zero minor.  Hadamard's inequality
+    bounds those minors by the product of the row norms, so whenever that bound
+    stays below the product of the primes the largest modular rank is exact.
+    ``None`` is returned when the bound is too large to certify the result.
+    """
+
+    entries, num_rows, num_cols = matrix
+    if num_rows == 0 or num_cols == 0:
+        return 0
+    bound = 1
+    for start in range(0, len(entries), num_cols):
+        norm_squared = sum(value * value for value in entries[start : start + num_cols])
+        if norm_squared:
+            bound *= isqrt(norm_squared) + 1
+            if bound >= _RANK_MODULUS:
+                return None
+
+    # The bound caps every entry, but not below ``int64``; only entries that
+    # fit are reduced with a single vectorised ``%``.
+    fits = max(map(abs, entries)) <= _INT64_MAX
+    values = np.array(entries, dtype=np.int64).reshape(num_rows, num_cols) if fits else None
+    full_rank = min(num_rows, num_cols)
+    best = 0
+    for p in _RANK_PRIMES:
+        if values is not None:
+            residues = values % p
+        else:
+            residues = np.array([value % p for value in entries], dtype=np.int64)
+            residues = residues.reshape(num_rows, num_cols)
+        best = max(best, _rank_mod_p(residues, p))
+        if best == full_rank:
+            break
+    return best
+
+
+def _rank(matrix: IntegerMatrix) -> int:
+    """Return the exact rank of the integer ``matrix``.
+
+    Larger matrices are reduced modulo a few word-sized primes with vectorised
+    NumPy row operations when the result can be certified exact; everything
+    else goes through Bareiss elimination.
+    """
+
+    entries, num_rows, num_cols = matrix
+    if num_rows == 0 or num_cols == 0:
+        return 0
+    if np is not None and len(entries) >= _MODULAR_RANK_MIN_ENTRIES:
+        rank = _modular_rank(matrix)
+        if rank is not None:
+            return rank
+    return _bareiss_rank(
+        [list(entries[start : start + num_cols]) for start in range(0, len(entries), num_cols)]
+    )
+
+
 class CourtshipCochainComplex:
-    """Finite cochain complex capturing a whimsical courtship dynamic."""
+    """Finite cochain complex capturing a whimsical courtship dynamic.
+
+    Float coefficients are read as the nearest simple fraction (``0.1`` becomes
+    ``1/10``); pass ``exact_floats=True`` to keep their exact binary values
+    instead, which is cheaper for large float-valued differentials.
+    """
 
     def __init__(
         self,
         spaces: Mapping[int, CochainSpace],
         differentials: Iterable[CourtshipDifferential],
+        *,
+        exact_floats: bool = False,
     ) -> None:
         self._spaces: Dict[int, CochainSpace] = dict(spaces)
         self._differentials: Dict[int, CourtshipDifferential] = {}
 
+        fraction = Fraction
+        to_fraction = _to_fraction
+        only_fractions = {fraction}
+
+        def coerce(value: float | int | Fraction) -> Fraction:
+            # Existing fractions and integers are the common entries; only
+            # the remaining values go through the general coercion.
+            if type(value) is fraction:
+                return value
+            if type(value) is int:
+                return fraction(value)
+            return to_fraction(value, exact=exact_floats)
+
         for diff in differentials:
-            matrix = tuple(tuple(_to_fraction(value) for value in row) for row in diff.matrix)
-            diff = CourtshipDifferential(diff.domain, diff.codomain, matrix)
+            matrix = diff.matrix
+            # Differentials built from Fractions (for example, taken from
+            # another complex) are reused as they are, with no rebuild or
+            # second round of shape validation.
+            reusable = type(diff) is CourtshipDifferential and type(matrix) is tuple
+            if reusable:
+                reusable = all(
+                    type(row) is tuple and set(map(type, row)) <= only_fractions for row in matrix
+                )
+            if not reusable:
+                matrix = tuple(tuple(map(coerce, row)) for row in matrix)
+                diff = CourtshipDifferential(diff.domain, diff.codomain, matrix)
             self._validate_dimensions(diff)
             self._differentials[diff.domain] = diff
 
+        # The flat integer form serves both the d^2 = 0 check and the ranks.
+        self._integer_matrices: Dict[int, IntegerMatrix] = {
+            degree: _integer_matrix(diff.matrix) for degree, diff in self._differentials.items()
+        }
         self._validate_complex()
+        # Each differential feeds two cohomology degrees, so its rank is
+        # computed once here rather than on every query.
+        self._ranks: Dict[int, int] = {
+            degree: _rank(matrix) for degree, matrix in self._integer_matrices.items()
+        }
+
+        # Degrees form a short contiguous range in practice, so the lookups
+        # behind the public queries index lists offset by the lowest degree.
+        # ``_rank_slots`` is shifted by one more so ``degree - 1`` stays in range.
+        first = min(self._spaces, default=0)
+        span = max(self._spaces, default=-1) - first + 1
+        self._first_degree = first
+        self._space_slots: List[CochainSpace | None] = [None] * span
+        self._differential_slots: List[CourtshipDifferential | None] = [None] * span
+        self._rank_slots: List[int] = [0] * (span + 1)
+        for degree, space in self._spaces.items():
+            self._space_slots[degree - first] = space
+        for degree, diff in self._differentials.items():
+            self._differential_slots[degree - first] = diff
+            self._rank_slots[degree - first + 1] = self._ranks[degree]
 
     def _validate_dimensions(self, diff: CourtshipDifferential) -> None:
         domain_dim = self._spaces[diff.domain].dimension
@@ -156,39 +425,39 @@ class CourtshipCochainComplex:
             )
 
     def _validate_complex(self) -> None:
+        integer_matrices = self._integer_matrices
         for degree, diff in self._differentials.items():
-            next_diff = self._differentials.get(diff.codomain)
-            if next_diff is None:
+            next_matrix = integer_matrices.get(diff.codomain)
+            if next_matrix is None:
                 continue
             # Check that d_{k+1} ∘ d_k = 0 by verifying matrix multiplication is zero.
-            composition = _matrix_multiply(next_diff.matrix, diff.matrix)
-            if any(entry != 0 for row in composition for entry in row):
+            if not _composes_to_zero(next_matrix, integer_matrices[degree]):
                 raise ValueError(
                     f"d_{degree+1} ∘ d_{degree} is not zero; invalid cochain complex"
                 )
 
+    def _slot(self, degree: int) -> int:
+        index = degree - self._first_degree
+        if 0 <= index < len(self._space_slots) and self._space_slots[index] is not None:
+            return index
+        raise KeyError(degree)
+
     def space(self, degree: int) -> CochainSpace:
-        return self._spaces[degree]
+        return self._space_slots[self._slot(degree)]  # type: ignore[return-value]
 
     def differential(self, degree: int) -> CourtshipDifferential | None:
-        return self._differentials.get(degree)
+        index = degree - self._first_degree
+        if 0 <= index < len(self._differential_slots):
+            return self._differential_slots[index]
+        return None
 
     def cohomology_dimension(self, degree: int) -> int:
         """Return dim ker d_k − dim im d_{k-1}."""
 
-        space = self._spaces[degree]
-        d_k = self._differentials.get(degree)
-        d_prev = self._differentials.get(degree - 1)
-
-        kernel_dim = space.dimension
-        if d_k is not None:
-            _, rank = _row_reduce(d_k.matrix)
-            kernel_dim -= rank
-
-        image_dim = 0
-        if d_prev is not None:
-            _, image_rank = _row_reduce(d_prev.matrix)
-            image_dim = image_rank
+        index = self._slot(degree)
+        space = self._space_slots[index]
+        kernel_dim = space.dimension - self._rank_slots[index + 1]  # type: ignore[union-attr]
+        image_dim = self._rank_slots[index]
 
         result = kernel_dim - image_dim
         return max(result, 0)
@@ -205,14 +474,78 @@ def _matrix_multiply(a: FractionalMatrix, b: FractionalMatrix) -> FractionalMatr
     if len(b) != len(a[0]):
         raise ValueError("incompatible matrix dimensions for multiplication")
 
-    result: List[List[Fraction]] = []
+    # Each inner product accumulates a single numerator/denominator pair and
+    # reduces it once at the end instead of normalising every partial sum.
+    columns = [
+        tuple((value.numerator, value.denominator) for value in column) for column in zip(*b)
+    ]
+    result: List[Tuple[Fraction, ...]] = []
     for row_a in a:
+        pairs = [(value.numerator, value.denominator) for value in row_a]
         new_row: List[Fraction] = []
-        for col in range(len(b[0])):
-            entry = sum(row_a[k] * b[k][col] for k in range(len(b)))
-            new_row.append(entry)
-        result.append(new_row)
-    return tuple(tuple(value for value in row) for row in result)
+        for column in columns:
+            numerator, denominator = 0, 1
+            for (a_num, a_den), (b_num, b_den) in zip(pairs, column):
+                if a_num and b_num:
+                    term_den = a_den * b_den
+                    if term_den == denominator:
+                        numerator += a_num * b_num
+                    else:
+                        numerator = numerator * term_den + a_num * b_num * denominator
+                        denominator *= term_den
+            new_row.append(_reduced(numerator, denominator))
+        result.append(tuple(new_row))
+    return tuple(result)
+
+
+# Multiply-adds below which the pure Python product is cheaper than NumPy.
+_NUMPY_PRODUCT_MIN_WORK = 128
+
+
+def _composes_to_zero(a: IntegerMatrix, b: IntegerMatrix) -> bool:
+    """Return whether the product ``a · b`` is the zero matrix.
+
+    Only the non-zero rows of ``a``, the non-zero columns of ``b`` and the
+    inner indices where both factors have support can contribute, so the
+    product is restricted to that block first; sparse differentials often
+    leave nothing to multiply.  When ``k · max|a| · max|b|`` fits in
+    ``int64`` no partial sum of the product can overflow and NumPy's integer
+    matmul answers exactly; otherwise the inner products are summed as Python
+    integers, stopping at the first non-zero entry.
+    """
+
+    left, num_rows, inner = a
+    right, _, num_cols = b
+    rows = [i for i in range(num_rows) if any(left[i * inner : (i + 1) * inner])]
+    cols = [j for j in range(num_cols) if any(right[j::num_cols])]
+    shared = [
+        k
+        for k in range(inner)
+        if any(left[k::inner]) and any(right[k * num_cols : (k + 1) * num_cols])
+    ]
+    if not (rows and cols and shared):
+        return True
+    if len(rows) < num_rows or len(shared) < inner:
+        left = tuple(left[i * inner + k] for i in rows for k in shared)
+    if len(shared) < inner or len(cols) < num_cols:
+        right = tuple(right[k * num_cols + j] for k in shared for j in cols)
+    num_rows, inner, num_cols = len(rows), len(shared), len(cols)
+
+    if np is not None and num_rows * inner * num_cols >= _NUMPY_PRODUCT_MIN_WORK:
+        left_max = max(map(abs, left))
+        right_max = max(map(abs, right))
+        if inner * left_max * right_max <= _INT64_MAX:
+            left_array = np.array(left, dtype=np.int64).reshape(num_rows, inner)
+            right_array = np.array(right, dtype=np.int64).reshape(inner, num_cols)
+            return not (left_array @ right_array).any()
+
+    columns = [right[col::num_cols] for col in range(num_cols)]
+    for start in range(0, len(left), inner):
+        row = left[start : start + inner]
+        for column in columns:
+            if sum(map(mul, row, column)):
+                return False
+    return True
 
 
 def courtship_cohomology_story(complex_: CourtshipCochainComplex) -> Dict[int, str]:
@@ -21,8 +21,16 @@ import math
 from dataclasses import dataclass, field
 from typing import Callable, Iterable, List, Optional, Sequence
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal installs
+    np = None  # type: ignore[assignment]
+
 Vector = List[float]
 
+# Below this many segments the pure Python projection beats NumPy's call overhead.
+_NUMPY_MIN_DIMENSION = 32
+
 
 class _ProjectionError(ValueError):
     """Internal helper used to signal invalid projection parameters."""
@@ -169,16 +177,106 @@ def _project_onto_bounded_simplex(
 
 
 def _project_onto_simplex(values: Sequence[float], total: float) -> Vector:
-    lower = [0.0 for _ in values]
-    upper = [math.inf for _ in values]
-    return _project_onto_bounded_simplex(values, total, lower, upper)
+    """Project ``values`` onto ``{x | x >= 0, sum(x) = total}``.
+
+    Uses the sort-based threshold of Duchi et al.: after sorting in
+    descending order the support of the projection is a prefix, and the
+    shift ``theta`` follows from its cumulative sum.  This is exact and needs
+    a single sort instead of the bisection used for general bounds.
+    """
+
+    return _simplex_projection(values, total)[0]
+
+
+def _simplex_projection(values: Sequence[float], total: float) -> tuple[Vector, float]:
+    """Return the simplex projection of ``values`` and its shift ``theta``."""
+
+    if total <= 0:
+        raise _ProjectionError("total must be positive when projecting")
+    if not len(values):
+        raise _ProjectionError("at least one segment is required to project")
+    _ensure_finite(values)
+
+    if np is not None and len(values) >= _NUMPY_MIN_DIMENSION:
+        array = np.asarray(values, dtype=np.float64)
+        ordered = np.sort(array)[::-1]
+        cumulative = np.cumsum(ordered)
+        support = np.nonzero(ordered * np.arange(1, len(ordered) + 1) > cumulative - total)[0]
+        rho = int(support[-1])
+        theta = (cumulative[rho] - total) / (rho + 1)
+        projected = np.maximum(array - theta, 0.0)
+        projected *= total / projected.sum()
+        return projected.tolist(), float(theta)
+
+    cumulative = 0.0
+    theta = 0.0
+    for index, value in enumerate(sorted(values, reverse=True), start=1):
+        cumulative += value
+        candidate = (cumulative - total) / index
+        if value <= candidate:
+            break
+        theta = candidate
+    projected = [max(value - theta, 0.0) for value in values]
+    scale = total / sum(projected)
+    return [value * scale for value in projected], theta
+
+
+def _project_onto_simplex_warm(
+    values: Sequence[float], total: float, theta: Optional[float]
+) -> tuple[Vector, float]:
+    """Project onto the simplex starting from a previous shift ``theta``.
+
+    Consecutive optimiser iterates rarely change which coordinates stay
+    positive.  The support implied by the old ``theta`` determines a new
+    candidate shift in one pass; if that candidate induces the same support
+    it is the exact projection and no sort is needed.  Otherwise, or when
+    ``theta`` is ``None``, this falls back to :func:`_simplex_projection`.
+    """
+
+    if theta is not None and total > 0:
+        if np is not None and len(values) >= _NUMPY_MIN_DIMENSION:
+            array = np.asarray(values, dtype=np.float64)
+            support = array > theta
+            inside = array[support]
+            outside = array[~support]
+            if inside.size:
+                candidate = (float(inside.sum()) - total) / inside.size
+                if inside.min() > candidate and (not outside.size or outside.max() <= candidate):
+                    projected = np.maximum(array - candidate, 0.0)
+                    projected *= total / projected.sum()
+                    return projected.tolist(), candidate
+        else:
+            support_sum = 0.0
+            count = 0
+            inside_min = math.inf
+            outside_max = -math.inf
+            consistent = True
+            for value in values:
+                if value > theta:
+                    support_sum += value
+                    count += 1
+                    if value < inside_min:
+                        inside_min = value
+                elif value <= theta:
+                    if value > outside_max:
+                        outside_max = value
+                else:  # NaN; let the full projection report it
+                    consistent = False
+                    break
+            if consistent and count:
+                candidate = (support_sum - total) / count
+                if inside_min > candidate and outside_max <= candidate and math.isfinite(candidate):
+                    projected = [max(value - candidate, 0.0) for value in values]
+                    scale = total / sum(projected)
+                    return [value * scale for value in projected], candidate
+    return _simplex_projection(values, total)
 
 
 Objective = Callable[[Sequence[float]], tuple[float, Sequence[float]]]
 Projection = Callable[[Sequence[float]], Vector]
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosedTimelikeCurve:
     """Representation of a discretised closed timelike curve.
 
@@ -198,6 +296,7 @@ class ClosedTimelikeCurve:
     _vector: Vector = field(init=False, repr=False)
     _lower_bounds: Vector = field(init=False, repr=False)
     _upper_bounds: List[float] = field(init=False, repr=False)
+    _unbounded: bool = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.period <= 0:
@@ -247,12 +346,43 @@ class ClosedTimelikeCurve:
 
         self._lower_bounds = lower
         self._upper_bounds = upper
-        self._renormalise()
+        # Without explicit bounds the feasible set is the plain scaled simplex,
+        # which has an exact sort-based projection.
+        self._unbounded = all(value == 0.0 for value in lower) and all(
+            math.isinf(value) for value in upper
+        )
+        # Scaled segments that already respect the bounds need no projection.
+        if not self._is_feasible(self._vector):
+            self._renormalise()
 
     def _renormalise(self) -> None:
         self._vector = self._project(self._vector)
 
+    def _is_feasible(self, values: Sequence[float]) -> bool:
+        if len(values) != len(self._lower_bounds):
+            return False
+        if abs(math.fsum(values) - self.period) > 1e-9:
+            return False
+        return all(
+            low <= value <= high
+            for value, low, high in zip(values, self._lower_bounds, self._upper_bounds)
+        )
+
+    def _assign_already_projected(self, values: Sequence[float]) -> None:
+        """Store ``values`` directly when they already lie on the curve's simplex.
+
+        Anything outside the feasible set goes through :meth:`update` and is
+        projected as usual.
+        """
+
+        if self._is_feasible(values):
+            self._vector = list(values)
+        else:
+            self.update(values)
+
     def _project(self, values: Sequence[float]) -> Vector:
+        if self._unbounded:
+            return _project_onto_simplex(values, self.period)
         return _project_onto_bounded_simplex(
             values, self.period, self._lower_bounds, self._upper_bounds
         )
@@ -290,7 +420,7 @@ class ClosedTimelikeCurve:
         self._renormalise()
 
 
-@dataclass
+@dataclass(slots=True)
 class CTCOptimisationResult:
     """Outcome of the convex optimisation on a closed timelike curve."""
 
@@ -343,8 +473,23 @@ def optimise_closed_timelike_curve(
         raise ValueError("tolerance must be positive")
 
     current = curve.as_vector()
+    dimension = len(current)
+    # The curve's weights are already finite and projected; large curves keep
+    # a float64 mirror of ``current`` for the vector arithmetic.
+    vectorised = np is not None and dimension >= _NUMPY_MIN_DIMENSION
+    current_array = np.asarray(current, dtype=np.float64) if vectorised else None
+
+    if projection is None and curve._unbounded:
+        # Carry the simplex shift across iterations to warm-start the next
+        # projection.
+        period = curve.period
+        last_theta: List[Optional[float]] = [None]
+
+        def projection(values: Sequence[float]) -> Vector:  # type: ignore[redefinition]
+            projected, last_theta[0] = _project_onto_simplex_warm(values, period, last_theta[0])
+            return projected
 
-    if projection is None:
+    elif projection is None:
 
         def projection(values: Sequence[float]) -> Vector:  # type: ignore[redefinition]
             return curve._project(values)
@@ -354,22 +499,32 @@ def optimise_closed_timelike_curve(
 
     for iteration in range(1, max_iter + 1):
         objective_value, gradient = objective(current)
-        if len(gradient) != len(current):
+        if len(gradient) != dimension:
             raise ValueError("objective gradient dimension mismatch")
 
-        grad_norm = math.sqrt(sum(g * g for g in gradient))
+        if vectorised:
+            step = np.asarray(gradient, dtype=np.float64)
+            grad_norm = float(np.linalg.norm(step))
+        else:
+            # ``hypot`` and ``dist`` are single C calls that also scale
+            # against overflow and keep the tolerance test accurate.
+            grad_norm = math.hypot(*gradient)
         if grad_norm <= tolerance:
             converged = True
             if callback:
                 callback(iteration, current, objective_value)
             break
 
-        updated = [value - learning_rate * grad for value, grad in zip(current, gradient)]
-        projected = projection(updated)
-
-        delta = math.sqrt(sum((a - b) ** 2 for a, b in zip(projected, current)))
+        if vectorised:
+            projected = projection((current_array - learning_rate * step).tolist())
+            projected_array = np.asarray(projected, dtype=np.float64)
+            delta = float(np.linalg.norm(projected_array - current_array))
+            current_array = projected_array
+        else:
+            updated = [value - learning_rate * grad for value, grad in zip(current, gradient)]
+            projected = projection(updated)
+            delta = math.dist(projected, current)
         current = projected
-        curve.update(current)
 
         if callback:
             callback(iteration, current, objective_value)
@@ -378,6 +533,10 @@ def optimise_closed_timelike_curve(
             converged = True
             break
 
+    # The iterates never leave the projection's feasible set, so the curve is
+    # written back once, without another projection when nothing moved out.
+    curve._assign_already_projected(current)
+
     # Ensure the objective value reflects the final iterate.
     objective_value, _ = objective(curve.as_vector())
     iterations = iteration if converged else max_iter
@@ -17,8 +17,8 @@ structure without relying on an external linear algebra package.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Mapping, MutableMapping, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Tuple
 
 State = MutableMapping[str, float]
 
@@ -40,10 +40,13 @@ def _coerce_mapping(degrees: Mapping[str, object] | Iterable[Tuple[str, object]]
 class DegreeSpace:
     """Represent a labelled vector in the "degree" space."""
 
-    __slots__ = ("_degrees",)
+    __slots__ = ("_degrees", "_labels", "_values")
 
     def __init__(self, degrees: Mapping[str, object] | Iterable[Tuple[str, object]]):
         self._degrees = _coerce_mapping(degrees)
+        # Parallel columns of the coordinates, read by ``DegreeDual``.
+        self._labels = tuple(self._degrees)
+        self._values = tuple(self._degrees.values())
 
     def basis(self) -> Tuple[str, ...]:
         """Return the labels that span this space."""
@@ -82,7 +85,7 @@ class DegreeSpace:
         return f"DegreeSpace({self._degrees!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DegreeDual:
     """Linear functional over a :class:`DegreeSpace`.
 
@@ -98,9 +101,27 @@ class DegreeDual:
 
     degrees: Mapping[str, float]
     sign: float = 1.0
+    _items: Tuple[Tuple[str, float], ...] = field(init=False, repr=False, compare=False)
+    _alignment: List[object] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "degrees", _coerce_mapping(self.degrees))
+        degrees = _coerce_mapping(self.degrees)
+        object.__setattr__(self, "degrees", degrees)
+        object.__setattr__(self, "_items", tuple(degrees.items()))
+        # Last space basis seen, with the positions of the shared labels in
+        # it and their coefficients.
+        object.__setattr__(self, "_alignment", [None, (), ()])
+
+    def _align(self, labels: Tuple[str, ...]) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+        alignment = self._alignment
+        cached = alignment[0]
+        if cached is not labels and cached != labels:
+            position = {label: index for index, label in enumerate(labels)}
+            shared = [(position[label], value) for label, value in self._items if label in position]
+            alignment[0] = labels
+            alignment[1] = tuple(index for index, _ in shared)
+            alignment[2] = tuple(value for _, value in shared)
+        return alignment[1], alignment[2]  # type: ignore[return-value]
 
     def __call__(self, vector: Mapping[str, object] | DegreeSpace) -> float:
         """Evaluate the functional against ``vector``.
@@ -111,13 +132,22 @@ class DegreeDual:
         """
 
         if isinstance(vector, DegreeSpace):
-            coordinates = vector.as_state()
-        else:
-            coordinates = _coerce_mapping(vector)
-
+            # Repeated evaluation against spaces sharing a basis reuses the
+            # label positions, so each term is a tuple index instead of a
+            # hashed lookup.
+            indices, coefficients = self._align(vector._labels)
+            values = vector._values
+            total = 0.0
+            for index, coefficient in zip(indices, coefficients):
+                total += coefficient * values[index]
+            return self.sign * total
+
+        coordinates = _coerce_mapping(vector)
+
+        get = coordinates.get
         total = 0.0
-        for label, coefficient in self.degrees.items():
-            total += coefficient * coordinates.get(label, 0.0)
+        for label, coefficient in self._items:
+            total += coefficient * get(label, 0.0)
         return self.sign * total
 
     def tensor(self, other: "DegreeDual") -> "DegreeTensor":
@@ -126,7 +156,7 @@ class DegreeDual:
         return DegreeTensor(self, other)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DegreeTensor:
     """Tensor product of two dual functionals."""
 
@@ -142,6 +172,41 @@ class DegreeTensor:
 
         return self.left(left_vector) * self.right(right_vector)
 
+    def batched(
+        self,
+        pairs: Iterable[
+            Tuple[Mapping[str, object] | DegreeSpace, Mapping[str, object] | DegreeSpace]
+        ],
+    ) -> List[float]:
+        """Evaluate the tensor on each ``(left_vector, right_vector)`` pair.
+
+        :class:`DegreeSpace` vectors are immutable, so each one is evaluated
+        once per side however many pairs it appears in; sweeping a grid of
+        spaces costs one functional call per space rather than per pair.
+        Plain mappings are evaluated afresh every time.
+        """
+
+        left = self.left
+        right = self.right
+        left_values: Dict[DegreeSpace, float] = {}
+        right_values: Dict[DegreeSpace, float] = {}
+        results: List[float] = []
+        for left_vector, right_vector in pairs:
+            if isinstance(left_vector, DegreeSpace):
+                left_value = left_values.get(left_vector)
+                if left_value is None:
+                    left_value = left_values[left_vector] = left(left_vector)
+            else:
+                left_value = left(left_vector)
+            if isinstance(right_vector, DegreeSpace):
+                right_value = right_values.get(right_vector)
+                if right_value is None:
+                    right_value = right_values[right_vector] = right(right_vector)
+            else:
+                right_value = right(right_vector)
+            results.append(left_value * right_value)
+        return results
+
 
 def tensor_product(left: DegreeDual, right: DegreeDual) -> DegreeTensor:
     """Construct the tensor product of two duals."""
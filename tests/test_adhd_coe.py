@@ -5,8 +5,10 @@ import pytest
 from compute_god.adhd import (
     ADHDProfile,
     CoefficientOfEngagement,
+    StimulusBatch,
     StimulusProfile,
     simulate_coe,
+    simulate_coe_array,
 )
 
 
@@ -114,3 +116,233 @@ def test_simulate_coe_runs_sequence_and_resets():
     assert tracker.history == []
     assert tracker.responses == []
 
+
+
+def test_simulate_coe_array_matches_object_simulation():
+    def make_profile():
+        return ADHDProfile(
+            baseline_focus=0.45,
+            novelty_bias=0.7,
+            structure_bias=0.5,
+            reward_bias=0.4,
+            variability=0.3,
+        )
+
+    novelty = [0.7, 0.3, 1.4, 0.1, 0.55]
+    structure = [0.5, 0.4, 0.8, -0.2, 0.9]
+    reward = [0.6, 0.2, 0.9, 0.3, 0.0]
+    duration = [1.0, 0.5, 2.0, -1.0, 0.25]
+    stimuli = [StimulusProfile(*values) for values in zip(novelty, structure, reward, duration)]
+
+    profile = make_profile()
+    tracker, responses = simulate_coe(profile, stimuli, smoothing=0.2)
+    array_profile = make_profile()
+    focus, regulation, energy, engagement, history = simulate_coe_array(
+        array_profile, novelty, structure, reward, duration, smoothing=0.2
+    )
+
+    assert focus.tolist() == [response.focus for response in responses]
+    assert regulation.tolist() == [response.regulation for response in responses]
+    assert energy.tolist() == [response.energy for response in responses]
+    assert engagement.tolist() == [response.engagement for response in responses]
+    assert history.tolist() == tracker.history
+    assert array_profile._last_focus == profile._last_focus
+
+    with pytest.raises(ValueError):
+        simulate_coe_array(make_profile(), [0.1, 0.2], [0.3], [0.4, 0.5])
+
+
+def test_trend_sums_the_current_history_window():
+    profile = ADHDProfile()
+    tracker = CoefficientOfEngagement(smoothing=0.5)
+    streaming = CoefficientOfEngagement(smoothing=0.5, window_capacity=5)
+    for index in range(20):
+        response = profile.respond(StimulusProfile(index % 3 / 2, 0.5, index % 5 / 4))
+        tracker.observe(response)
+        streaming.observe(response)
+
+    for window in (1, 5, 20):
+        assert tracker.trend(window) == sum(tracker.history[-window:]) / window
+    assert streaming.trend(5) == tracker.trend(5)
+
+    tracker.history.append(1.0)
+    assert tracker.trend(2) == (tracker.history[-2] + 1.0) / 2
+    tracker.history[-1] = 10.0
+    assert tracker.trend(2) == (tracker.history[-2] + 10.0) / 2
+
+    tracker.reset()
+    tracker.observe(profile.respond(StimulusProfile(0.5, 0.5, 0.5)))
+    assert tracker.trend(1) == tracker.value
+
+
+def test_coefficient_exposes_responses_column_wise():
+    profile = ADHDProfile()
+    stimuli = [StimulusProfile(0.9, 0.2, 0.4), StimulusProfile(0.1, 0.7, 0.8, duration=0.5)]
+    tracker, responses = simulate_coe(profile, stimuli)
+
+    columns = tracker.as_soa()
+
+    assert list(columns) == ["focus", "regulation", "energy", "engagement", "duration"]
+    assert columns["focus"].tolist() == [response.focus for response in responses]
+    assert columns["duration"].tolist() == [1.0, 0.5]
+
+    tracker.reset()
+    assert tracker.as_soa()["engagement"].shape == (0,)
+
+
+def test_respond_many_matches_repeated_respond():
+    stimuli = [
+        StimulusProfile(0.9, 0.2, 0.8),
+        StimulusProfile(0.1, 0.8, 0.3, duration=0.5),
+        StimulusProfile(0.6, 0.6, 1.0, duration=2.0),
+    ]
+    single = ADHDProfile(baseline_focus=0.4, novelty_bias=0.8, variability=0.5)
+    batched = ADHDProfile(baseline_focus=0.4, novelty_bias=0.8, variability=0.5)
+
+    expected = [single.respond(stimulus) for stimulus in stimuli]
+
+    assert batched.respond_many(stimuli) == expected
+    assert batched.respond_many([]) == []
+    assert batched.respond(stimuli[0]) == single.respond(stimuli[0])
+
+
+def test_stimulus_batch_matches_per_instance_clamping_and_responses():
+    novelty = [1.4, 0.2, -0.3]
+    structure = [0.5, 2.0, 0.1]
+    reward = [0.9, -1.0, 0.6]
+    duration = [1.0, -2.0, 0.5]
+
+    batch = StimulusProfile.from_arrays(novelty, structure, reward, duration)
+    stimuli = [StimulusProfile(*values) for values in zip(novelty, structure, reward, duration)]
+
+    assert isinstance(batch, StimulusBatch)
+    assert len(batch) == 3
+    assert batch.novelty.tolist() == [stimulus.novelty for stimulus in stimuli]
+    assert batch.structure.tolist() == [stimulus.structure for stimulus in stimuli]
+    assert batch.reward.tolist() == [stimulus.reward for stimulus in stimuli]
+    assert batch.duration.tolist() == [stimulus.duration for stimulus in stimuli]
+
+    single = ADHDProfile(variability=0.3)
+    batched = ADHDProfile(variability=0.3)
+    expected = [single.respond(stimulus) for stimulus in stimuli]
+    focus, regulation, energy, engagement = batched.respond_batch(batch)
+
+    assert focus.tolist() == [response.focus for response in expected]
+    assert regulation.tolist() == pytest.approx([response.regulation for response in expected])
+    assert energy.tolist() == pytest.approx([response.energy for response in expected])
+    assert engagement.tolist() == pytest.approx([response.engagement for response in expected])
+    assert batched._last_focus == single._last_focus
+
+    with pytest.raises(ValueError):
+        StimulusProfile.from_arrays([0.1, 0.2], [0.3], [0.4, 0.5])
+
+    twin = StimulusProfile.from_arrays(novelty, structure, reward, duration)
+    assert batch == batch
+    assert batch != twin
+    assert len({batch, twin}) == 2
+
+
+def test_regulation_keeps_its_summation_order_in_every_path():
+    stimuli = [
+        StimulusProfile(novelty / 7, structure / 5, 0.3)
+        for novelty in range(8)
+        for structure in range(6)
+    ]
+    profile = ADHDProfile(structure_bias=0.37, variability=0.61)
+    expected = [
+        0.5 + 0.37 * (stimulus.structure - 0.5) - 0.61 * (stimulus.novelty - 0.5)
+        for stimulus in stimuli
+    ]
+
+    assert all(0.0 < value < 1.0 for value in expected)
+    assert [profile.respond(stimulus).regulation for stimulus in stimuli] == expected
+    assert [response.regulation for response in profile.respond_many(stimuli)] == expected
+    batch = StimulusProfile.from_arrays(
+        [stimulus.novelty for stimulus in stimuli],
+        [stimulus.structure for stimulus in stimuli],
+        [stimulus.reward for stimulus in stimuli],
+    )
+    assert profile.respond_batch(batch)[1].tolist() == expected
+
+
+def test_profile_response_and_tracker_are_slotted():
+    profile = ADHDProfile()
+    response = profile.respond(StimulusProfile(0.4, 0.6, 0.5))
+    tracker = CoefficientOfEngagement()
+    tracker.observe(response)
+
+    assert not hasattr(profile, "__dict__")
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(tracker, "__dict__")
+    assert profile._last_focus == response.focus
+
+
+def test_observe_many_matches_repeated_observe():
+    profile = ADHDProfile(variability=0.4)
+    responses = profile.respond_many(
+        StimulusProfile(index % 4 / 3, 0.6, index % 3 / 2, duration=index % 2 + 0.5)
+        for index in range(12)
+    )
+    single = CoefficientOfEngagement(smoothing=0.3)
+    batched = CoefficientOfEngagement(smoothing=0.3)
+
+    expected = [single.observe(response) for response in responses[:7]]
+    expected += [single.observe(response) for response in responses[7:]]
+    values = batched.observe_many(responses[:7]) + batched.observe_many(responses[7:])
+
+    assert values == expected
+    assert batched.history == single.history
+    assert batched.responses == single.responses
+    assert batched.observe_many([]) == []
+    assert batched.value == single.value
+
+
+def test_streaming_coefficient_keeps_a_bounded_window():
+    profile = ADHDProfile()
+    responses = profile.respond_many(
+        StimulusProfile(index % 3 / 2, 0.5, index % 5 / 4) for index in range(40)
+    )
+    full = CoefficientOfEngagement(smoothing=0.4)
+    streaming = CoefficientOfEngagement(smoothing=0.4, window_capacity=5)
+
+    for response in responses[:30]:
+        full.observe(response)
+        streaming.observe(response)
+    full.observe_many(responses[30:])
+    streaming.observe_many(responses[30:])
+
+    assert streaming.value == full.value
+    assert list(streaming.history) == full.history[-5:]
+    assert list(streaming.responses) == full.responses[-5:]
+    for window in (1, 3, 5):
+        assert streaming.trend(window) == full.trend(window)
+        assert streaming.is_stable(epsilon=0.2, window=max(window, 2)) is full.is_stable(
+            epsilon=0.2, window=max(window, 2)
+        )
+    with pytest.raises(ValueError):
+        streaming.trend(6)
+
+    streaming.reset()
+    assert streaming.value is None and len(streaming.history) == 0
+    with pytest.raises(ValueError):
+        CoefficientOfEngagement(window_capacity=-1)
+
+
+def test_simulate_coe_can_skip_response_objects():
+    stimuli = [
+        StimulusProfile(index % 4 / 3, index % 3 / 2, 0.7, duration=index % 2 + 0.5)
+        for index in range(15)
+    ]
+    full_profile = ADHDProfile(variability=0.6)
+    light_profile = ADHDProfile(variability=0.6)
+
+    full, responses = simulate_coe(full_profile, stimuli, smoothing=0.3)
+    light, skipped = simulate_coe(light_profile, stimuli, smoothing=0.3, return_responses=False)
+
+    assert skipped == []
+    assert light.responses == []
+    assert light.history == pytest.approx(full.history, abs=1e-12)
+    assert light.value == pytest.approx(full.value, abs=1e-12)
+    assert light.trend(4) == pytest.approx(full.trend(4), abs=1e-12)
+    assert light_profile._last_focus == full_profile._last_focus
+    assert len(responses) == 15
@@ -5,6 +5,8 @@ from compute_god import (
     AntiQuantumDual,
     QuantumAttackSurface,
     anti_quantum_dual,
+    anti_quantum_dual_batch,
+    anti_quantum_duality_index,
     抗量子对偶,
 )
 
@@ -67,3 +69,94 @@ def test_chinese_alias():
 
     assert 抗量子对偶(algorithm, attack) is None
 
+
+
+def test_attack_surface_caches_speedup_bits_outside_equality():
+    attack = QuantumAttackSurface(
+        name="Grover",
+        quantum_speedup=16.0,
+        required_security_bits=100,
+        decoherence_rate=0.01,
+    )
+
+    assert attack._speedup_bits == 4.0
+    assert attack == QuantumAttackSurface("Grover", 16.0, 100, 0.01)
+    assert "_speedup_bits" not in repr(attack)
+
+
+def test_anti_quantum_dual_batch_matches_scalar_grid():
+    algorithms = [
+        AntiQuantumAlgorithm("Falcon-like", "lattice", 256, 0.12),
+        AntiQuantumAlgorithm("Toy Scheme", "hash", 128, 0.1),
+        AntiQuantumAlgorithm("Kyber-like", "module-lattice", 192, 0.06),
+    ]
+    attacks = [
+        QuantumAttackSurface("Grover boosted", 8.0, 240, 0.04),
+        QuantumAttackSurface("Amplified", 32.0, 120, 0.02),
+        QuantumAttackSurface("Surface", 4.0, 170, 0.08),
+    ]
+
+    withstands, effective, margin, index = anti_quantum_dual_batch(
+        [[algorithm.security_bits] for algorithm in algorithms],
+        [[algorithm.noise_budget] for algorithm in algorithms],
+        [attack.quantum_speedup for attack in attacks],
+        [attack.required_security_bits for attack in attacks],
+        [attack.decoherence_rate for attack in attacks],
+    )
+
+    assert withstands.shape == effective.shape == margin.shape == index.shape == (3, 3)
+    for row, algorithm in enumerate(algorithms):
+        for column, attack in enumerate(attacks):
+            dual = anti_quantum_dual(algorithm, attack)
+            assert bool(withstands[row, column]) is (dual is not None)
+            if dual is not None:
+                assert effective[row, column] == dual.effective_security_bits
+                assert margin[row, column] == dual.decoherence_margin
+                assert index[row, column] == dual.duality_index
+
+    with pytest.raises(ValueError):
+        anti_quantum_dual_batch(128, 0.1, [2.0, 0.0], 100, 0.01)
+
+
+def test_anti_quantum_dual_is_memoised_on_field_values():
+    anti_quantum_dual.cache_clear()
+    algorithm = AntiQuantumAlgorithm("Falcon-like", "lattice", 256, 0.12)
+    attack = QuantumAttackSurface("Grover boosted", 8.0, 240, 0.04)
+
+    first = anti_quantum_dual(algorithm, attack)
+    again = anti_quantum_dual(
+        AntiQuantumAlgorithm("Falcon-like", "lattice", 256, 0.12),
+        QuantumAttackSurface("Grover boosted", 8.0, 240, 0.04),
+    )
+
+    assert again is first
+    assert anti_quantum_dual.cache_info().hits == 1
+    anti_quantum_dual.cache_clear()
+    assert anti_quantum_dual.cache_info().currsize == 0
+
+
+def test_anti_quantum_duality_index_marks_failures():
+    security_bits = [[256.0], [128.0]]
+    noise_budget = [[0.12], [0.1]]
+    columns = ([8.0, 32.0, 4.0], [240.0, 120.0, 170.0], [0.04, 0.02, 0.2])
+
+    withstands, _, _, expected = anti_quantum_dual_batch(security_bits, noise_budget, *columns)
+    index = anti_quantum_duality_index(security_bits, noise_budget, *columns)
+
+    assert index.shape == (2, 3)
+    assert index[withstands].tolist() == expected[withstands].tolist()
+    assert (index[~withstands] == -1.0).all()
+    assert (index[withstands] >= 0).all()
+    with pytest.raises(ValueError):
+        anti_quantum_duality_index(128, -0.1, 2.0, 100, 0.01)
+
+
+def test_anti_quantum_duality_index_accepts_scalar_inputs():
+    withstands, _, _, expected = anti_quantum_dual_batch(128, 1, 4, 64, 0.1)
+
+    index = anti_quantum_duality_index(128, 1, 4, 64, 0.1)
+    failing = anti_quantum_duality_index(128, 1, 4, 200, 0.1)
+
+    assert bool(withstands) is True
+    assert float(index) == float(expected)
+    assert float(failing) == -1.0
@@ -191,3 +191,515 @@ def test_multi_tape_turing_machine_copies_symbol() -> None:
     assert mttm.run("1")
     assert not mttm.run("")
 
+
+
+def test_dfa_accepts_many_matches_accepts_and_reports_errors() -> None:
+    dfa = DeterministicFiniteAutomaton(
+        states=frozenset({"even", "odd", "dead"}),
+        alphabet=frozenset({"0", "1", "2"}),
+        transitions={
+            ("even", "0"): "odd",
+            ("even", "1"): "even",
+            ("odd", "0"): "even",
+            ("odd", "1"): "odd",
+            ("even", "2"): "dead",
+        },
+        initial_state="even",
+        accepting_states=frozenset({"even"}),
+    )
+    words = ["", "0", "0101", "000", "1", "10", "12"]
+
+    assert dfa.accepts_many(words) == [dfa.accepts(word) for word in words]
+    assert dfa.accepts_many([]) == []
+    for bad in (["01", "0x"], ["22"]):
+        try:
+            dfa.accepts_many(bad)
+        except AutomatonError:
+            pass
+        else:
+            assert False, "invalid words should raise"
+    try:
+        dfa.accepts("x")
+    except AutomatonError as error:
+        assert "not in alphabet" in str(error)
+    try:
+        dfa.accepts("22")
+    except AutomatonError as error:
+        assert "missing deterministic transition" in str(error)
+
+
+def test_nfa_tracks_more_than_64_states() -> None:
+    # Accepts words whose 70th symbol from the end is an "a".
+    depth = 70
+    states = [f"q{index}" for index in range(depth + 1)]
+    transitions = {
+        ("q0", "a"): frozenset({"q0", "q1"}),
+        ("q0", "b"): frozenset({"q0"}),
+    }
+    for index in range(1, depth):
+        for symbol in "ab":
+            transitions[(states[index], symbol)] = frozenset({states[index + 1]})
+    nfa = NondeterministicFiniteAutomaton(
+        states=frozenset(states),
+        alphabet=frozenset({"a", "b"}),
+        transitions=transitions,
+        initial_states=frozenset({"q0"}),
+        accepting_states=frozenset({states[depth]}),
+    )
+
+    assert nfa.accepts("b" + "a" + "b" * (depth - 1))
+    assert not nfa.accepts("a" + "b" * depth)
+    try:
+        nfa.accepts("abc")
+    except AutomatonError:
+        pass
+    else:
+        assert False, "unknown symbols should raise"
+
+
+def test_epsilon_nfa_follows_transitive_epsilon_chains() -> None:
+    enfa = EpsilonNFA(
+        states=frozenset({"s0", "s1", "s2", "s3"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={
+            ("s2", "a"): frozenset({"s0"}),
+            ("s3", "b"): frozenset({"s3"}),
+        },
+        initial_states=frozenset({"s0"}),
+        accepting_states=frozenset({"s3"}),
+        epsilon_transitions={
+            "s0": frozenset({"s1"}),
+            "s1": frozenset({"s2"}),
+            "s2": frozenset({"s3"}),
+        },
+    )
+    assert enfa.accepts("")
+    assert enfa.accepts("aab")
+    assert enfa.accepts("bb")
+    assert not enfa.accepts("ba")
+    try:
+        EpsilonNFA(
+            states=frozenset({"s0"}),
+            alphabet=frozenset({"a"}),
+            transitions={},
+            initial_states=frozenset({"s0"}),
+            accepting_states=frozenset(),
+            epsilon_transitions={"s0": frozenset({"ghost"})},
+        )
+    except AutomatonError:
+        pass
+    else:
+        assert False, "unknown ε-targets should raise"
+
+
+def test_weighted_automata_stop_at_dead_paths_and_reject_unknown_symbols() -> None:
+    wfa = WeightedFiniteAutomaton(
+        states=frozenset({"start", "mid", "accept"}),
+        alphabet=frozenset({"x"}),
+        transitions={
+            ("start", "x"): {"mid": 0.3, "accept": 0.2},
+            ("mid", "x"): {"accept": 2.0},
+        },
+        initial_states={"start": 1.0},
+        accepting_states={"accept": 1.0, "mid": 0.5},
+    )
+    pfa = ProbabilisticFiniteAutomaton(
+        states=frozenset({"start", "accept"}),
+        alphabet=frozenset({"0", "1"}),
+        transitions={("start", "0"): {"accept": 0.25, "start": 0.75}},
+        initial_state="start",
+        accepting_states=frozenset({"accept"}),
+    )
+
+    assert abs(wfa.weight_of("") - 0.0) < 1e-12
+    assert abs(wfa.weight_of("x") - 0.35) < 1e-12
+    assert wfa.weight_of("xxx") == 0.0
+    assert wfa.weight_of("xxxy") == 0.0
+    assert abs(pfa.acceptance_probability("00") - 0.1875) < 1e-12
+    assert pfa.acceptance_probability("010") == 0.0
+    for evaluate, word in ((wfa.weight_of, "y"), (pfa.acceptance_probability, "02")):
+        try:
+            evaluate(word)
+        except AutomatonError:
+            pass
+        else:
+            assert False, "unknown symbols should raise while weight remains"
+
+
+def test_weighted_batches_share_prefixes_and_match_single_words() -> None:
+    wfa = WeightedFiniteAutomaton(
+        states=frozenset({"start", "mid", "accept"}),
+        alphabet=frozenset({"x", "y"}),
+        transitions={
+            ("start", "x"): {"mid": 0.3, "accept": 0.2},
+            ("start", "y"): {"start": 0.5},
+            ("mid", "x"): {"accept": 2.0},
+            ("mid", "y"): {"mid": 1.5, "start": 0.1},
+        },
+        initial_states={"start": 1.0},
+        accepting_states={"accept": 1.0, "mid": 0.5},
+    )
+    pfa = ProbabilisticFiniteAutomaton(
+        states=frozenset({"start", "accept"}),
+        alphabet=frozenset({"0", "1"}),
+        transitions={
+            ("start", "0"): {"accept": 0.25, "start": 0.75},
+            ("accept", "1"): {"accept": 1.0},
+        },
+        initial_state="start",
+        accepting_states=frozenset({"accept"}),
+    )
+    words = ["", "x", "xx", "xy", "xyx", "yx", "yyxy", "xx", "xxxz"]
+    binary = ["", "0", "01", "001", "0101", "1", "01"]
+
+    for expected, actual in zip([wfa.weight_of(word) for word in words], wfa.weight_many(words)):
+        assert abs(expected - actual) < 1e-12
+    expected_probabilities = [pfa.acceptance_probability(word) for word in binary]
+    for expected, actual in zip(expected_probabilities, pfa.acceptance_probability_many(binary)):
+        assert abs(expected - actual) < 1e-12
+    assert wfa.weight_many([]) == []
+    try:
+        wfa.weight_many(["x", "z"])
+    except AutomatonError:
+        pass
+    else:
+        assert False, "unknown symbols should raise while weight remains"
+
+
+def test_pushdown_automaton_handles_deep_stacks() -> None:
+    pda = PushdownAutomaton(
+        states=frozenset({"start", "read_b", "accept"}),
+        input_alphabet=frozenset({"a", "b"}),
+        stack_alphabet=frozenset({"Z", "A"}),
+        transitions={
+            ("start", "a", "Z"): frozenset({("start", ("Z", "A"))}),
+            ("start", "a", "A"): frozenset({("start", ("A", "A"))}),
+            ("start", "b", "A"): frozenset({("read_b", ())}),
+            ("read_b", "b", "A"): frozenset({("read_b", ())}),
+            ("read_b", None, "Z"): frozenset({("accept", ("Z",))}),
+        },
+        initial_state="start",
+        initial_stack_symbol="Z",
+        accepting_states=frozenset({"accept"}),
+    )
+    depth = 500
+    assert pda.accepts("a" * depth + "b" * depth, max_steps=4 * depth)
+    assert not pda.accepts("a" * depth + "b" * (depth - 1), max_steps=4 * depth)
+    assert not pda.accepts("a" * depth + "b" * depth, max_steps=depth)
+
+
+def test_multi_tape_turing_machine_walks_past_both_ends_of_the_input() -> None:
+    copy = {
+        ("copy", (symbol, "_")): ("copy", (symbol, symbol), ("R", "R")) for symbol in "ab"
+    }
+    rewind = {
+        ("rewind", ("_", symbol)): ("rewind", ("_", symbol), ("S", "L")) for symbol in "ab"
+    }
+    mttm = MultiTapeTuringMachine(
+        states=frozenset({"copy", "rewind", "left", "accept"}),
+        tape_alphabet=frozenset({"a", "b", "_", "x"}),
+        blank_symbol="_",
+        transitions={
+            **copy,
+            ("copy", ("_", "_")): ("rewind", ("_", "_"), ("S", "L")),
+            **rewind,
+            # Past the origin: mark a blank cell and keep walking left.
+            ("rewind", ("_", "_")): ("left", ("_", "x"), ("S", "L")),
+            ("left", ("_", "_")): ("accept", ("_", "_"), ("S", "S")),
+        },
+        initial_state="copy",
+        accepting_states=frozenset({"accept"}),
+        rejecting_states=frozenset(),
+        tapes=2,
+    )
+    word = "ab" * 300
+    assert mttm.run(word, max_steps=4 * len(word))
+    assert mttm.run("", max_steps=4)
+    try:
+        mttm.run("abz")
+    except AutomatonError as error:
+        assert "'z'" in str(error)
+    else:
+        assert False, "unknown tape symbols should raise"
+
+
+def test_turing_machine_grows_tape_in_both_directions() -> None:
+    # Walk 40 cells left of the input, mark the cell, then walk back to the
+    # origin and on to the far end of the input.
+    distance = 40
+    transitions = {}
+    for step in range(distance):
+        for symbol in "a_":
+            transitions[(f"left{step}", symbol)] = (f"left{step + 1}", symbol, "L")
+            transitions[(f"back{step}", symbol)] = (f"back{step + 1}", symbol, "R")
+    transitions[(f"left{distance}", "_")] = ("back0", "x", "R")
+    transitions[(f"back{distance}", "a")] = (f"back{distance}", "a", "R")
+    transitions[(f"back{distance}", "_")] = ("accept", "_", "S")
+    tm = TuringMachine(
+        states=frozenset({state for state, _ in transitions} | {"accept"}),
+        tape_alphabet=frozenset({"a", "x", "_"}),
+        blank_symbol="_",
+        transitions=transitions,
+        initial_state="left0",
+        accepting_states=frozenset({"accept"}),
+        rejecting_states=frozenset(),
+    )
+    assert tm.run("")
+    assert tm.run("a" * 100, max_steps=200)
+    assert not tm.run("x")
+
+    symbols = [f"s{index}" for index in range(300)]
+    wide = TuringMachine(
+        states=frozenset({"scan", "accept"}),
+        tape_alphabet=frozenset(symbols + ["_"]),
+        blank_symbol="_",
+        transitions={
+            **{("scan", symbol): ("scan", symbols[-1], "R") for symbol in symbols[:-1]},
+            ("scan", symbols[-1]): ("accept", symbols[-1], "S"),
+        },
+        initial_state="scan",
+        accepting_states=frozenset({"accept"}),
+        rejecting_states=frozenset(),
+    )
+    assert wide.run(symbols[:5] + symbols[-1:])
+    assert not wide.run(symbols[:5])
+
+
+def test_nfa_to_dfa_builds_reachable_subsets_once() -> None:
+    nfa = NondeterministicFiniteAutomaton(
+        states=frozenset({"start", "seen_a", "accept", "unreachable"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={
+            ("start", "a"): frozenset({"start", "seen_a"}),
+            ("start", "b"): frozenset({"start"}),
+            ("seen_a", "b"): frozenset({"accept"}),
+            ("unreachable", "a"): frozenset({"accept"}),
+        },
+        initial_states=frozenset({"start"}),
+        accepting_states=frozenset({"accept"}),
+    )
+    words = ["", "ab", "aab", "aba", "abab", "bbb", "ba"]
+    expected = [nfa.accepts(word) for word in words]
+
+    dfa = nfa.to_dfa()
+
+    assert nfa.to_dfa() is dfa
+    assert dfa.states == frozenset({"{'start'}", "{'seen_a', 'start'}", "{'accept', 'start'}"})
+    assert dfa.accepting_states == frozenset({"{'accept', 'start'}"})
+    assert [dfa.accepts(word) for word in words] == expected
+    assert [nfa.accepts(word) for word in words] == expected
+    # A built DFA is returned without exploring the subsets again.
+    assert nfa.to_dfa(max_states=2) is dfa
+
+    blowup = NondeterministicFiniteAutomaton(
+        states=frozenset({"start", "seen_a", "accept"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={
+            ("start", "a"): frozenset({"start", "seen_a"}),
+            ("seen_a", "a"): frozenset({"accept"}),
+            ("seen_a", "b"): frozenset({"accept"}),
+        },
+        initial_states=frozenset({"start"}),
+        accepting_states=frozenset({"accept"}),
+    )
+    try:
+        blowup.to_dfa(max_states=3)
+    except AutomatonError as error:
+        assert "exceeds 3 states" in str(error)
+    else:
+        assert False, "too many subsets should raise"
+    assert blowup.accepts("ab")
+    assert not blowup.accepts("b")
+
+
+def test_weighted_mapping_walk_matches_matrix_form() -> None:
+    wfa = WeightedFiniteAutomaton(
+        states=frozenset({"start", "mid", "accept"}),
+        alphabet=frozenset({"x", "y"}),
+        transitions={
+            ("start", "x"): {"mid": 0.3, "accept": 0.2},
+            ("start", "y"): {"start": 0.5},
+            ("mid", "x"): {"accept": 2.0},
+        },
+        initial_states={"start": 1.0},
+        accepting_states={"accept": 1.0, "mid": 0.5},
+    )
+    walker = WeightedFiniteAutomaton(
+        wfa.states, wfa.alphabet, wfa.transitions, wfa.initial_states, wfa.accepting_states
+    )
+    # Force the NumPy-free path taken when the matrix form is unavailable.
+    object.__setattr__(walker, "_matrix_form", None)
+
+    for word in ["", "x", "yx", "yyxx", "xxx", "xxxz", "xy"]:
+        assert abs(walker.weight_of(word) - wfa.weight_of(word)) < 1e-12
+    for word in ["z", "yz", "xz"]:
+        for automaton in (wfa, walker):
+            try:
+                automaton.weight_of(word)
+            except AutomatonError as error:
+                assert "'z'" in str(error)
+            else:
+                assert False, "unknown symbols should raise while weight remains"
+
+
+def test_pushdown_automaton_branches_and_blocks_on_unknown_symbols() -> None:
+    # Even-length palindromes over {a, b}: guess the middle nondeterministically.
+    transitions = {}
+    for symbol in "ab":
+        for top in ("Z", "a", "b"):
+            transitions[("push", symbol, top)] = frozenset({("push", (top, symbol))})
+            transitions[("push", None, top)] = frozenset({("pop", (top,))})
+        transitions[("pop", symbol, symbol)] = frozenset({("pop", ())})
+    transitions[("pop", None, "Z")] = frozenset({("accept", ("Z",))})
+    pda = PushdownAutomaton(
+        states=frozenset({"push", "pop", "accept"}),
+        input_alphabet=frozenset({"a", "b"}),
+        stack_alphabet=frozenset({"Z", "a", "b"}),
+        transitions=transitions,
+        initial_state="push",
+        initial_stack_symbol="Z",
+        accepting_states=frozenset({"accept"}),
+    )
+
+    assert pda.accepts("")
+    assert pda.accepts("abba")
+    assert pda.accepts("baab")
+    assert not pda.accepts("abab")
+    assert not pda.accepts("abcba")
+    assert not pda.accepts("cc")
+
+
+def test_large_sparse_probabilistic_automaton_matches_mapping_walk() -> None:
+    size = 200
+    states = [f"s{index:03d}" for index in range(size)]
+    transitions = {}
+    for index, state in enumerate(states):
+        transitions[(state, "0")] = {states[(index + 1) % size]: 0.5, state: 0.5}
+        transitions[(state, "1")] = {states[(3 * index) % size]: 1.0}
+    pfa = ProbabilisticFiniteAutomaton(
+        states=frozenset(states),
+        alphabet=frozenset({"0", "1"}),
+        transitions=transitions,
+        initial_state=states[0],
+        accepting_states=frozenset(states[::7]),
+    )
+    walker = ProbabilisticFiniteAutomaton(
+        pfa.states, pfa.alphabet, pfa.transitions, pfa.initial_state, pfa.accepting_states
+    )
+    object.__setattr__(walker, "_matrix_form", None)
+    words = ["", "0", "01", "0011", "1010101", "0" * 30 + "1" * 5, "01" * 20]
+
+    matrices, _, _, sparse = pfa._matrix_form
+    assert matrices == {}
+    assert sorted(sparse) == ["0", "1"]
+
+    batched = pfa.acceptance_probability_many(words)
+    for word, probability in zip(words, batched):
+        assert abs(pfa.acceptance_probability(word) - walker.acceptance_probability(word)) < 1e-12
+        assert abs(probability - walker.acceptance_probability(word)) < 1e-12
+    try:
+        pfa.acceptance_probability("012")
+    except AutomatonError:
+        pass
+    else:
+        assert False, "unknown symbols should raise while weight remains"
+
+
+def test_deterministic_pushdown_single_run_matches_search_budget() -> None:
+    transitions = {
+        ("start", "a", "Z"): frozenset({("start", ("Z", "A"))}),
+        ("start", "a", "A"): frozenset({("start", ("A", "A"))}),
+        ("start", "b", "A"): frozenset({("read_b", ())}),
+        ("read_b", "b", "A"): frozenset({("read_b", ())}),
+        ("read_b", None, "Z"): frozenset({("drain", ("Z",))}),
+        ("drain", None, "Z"): frozenset({("accept", ())}),
+    }
+    machines = [
+        cls(
+            states=frozenset({"start", "read_b", "drain", "accept"}),
+            input_alphabet=frozenset({"a", "b"}),
+            stack_alphabet=frozenset({"Z", "A"}),
+            transitions=transitions,
+            initial_state="start",
+            initial_stack_symbol="Z",
+            accepting_states=frozenset({"accept"}),
+        )
+        for cls in (PushdownAutomaton, DeterministicPushdownAutomaton)
+    ]
+
+    for word in ["ab", "aabb", "aab", "abb", "ba", "", "abc"]:
+        for max_steps in range(12):
+            general, deterministic = (pda.accepts(word, max_steps=max_steps) for pda in machines)
+            assert general == deterministic
+    assert machines[1].accepts("a" * 300 + "b" * 300, max_steps=1000)
+
+
+def test_nfa_accepts_keeps_dead_run_semantics_after_to_dfa() -> None:
+    nfa = NondeterministicFiniteAutomaton(
+        states=frozenset({"start", "seen_a", "accept"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={
+            ("start", "a"): frozenset({"start", "seen_a"}),
+            ("seen_a", "b"): frozenset({"accept"}),
+        },
+        initial_states=frozenset({"start"}),
+        accepting_states=frozenset({"accept"}),
+    )
+    words = ["ab", "aab", "b", "bz", "abbz"]
+    before = [nfa.accepts(word) for word in words]
+
+    dfa = nfa.to_dfa()
+
+    assert before == [True, True, False, False, False]
+    assert [nfa.accepts(word) for word in words] == before
+    try:
+        dfa.accepts("bz")
+    except AutomatonError:
+        pass
+    else:
+        assert False, "the DFA walks through its dead state and rejects unknown symbols"
+    try:
+        nfa.accepts("abz")
+    except AutomatonError:
+        pass
+    else:
+        assert False, "unknown symbols should raise while the run is alive"
+
+
+def test_weighted_automata_raise_on_unknown_symbols_while_states_remain_reachable() -> None:
+    pfa = ProbabilisticFiniteAutomaton(
+        states=frozenset({"q0", "q1"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={("q0", "a"): {"q0": 0.0}, ("q1", "b"): {"q1": 1.0}},
+        initial_state="q0",
+        accepting_states=frozenset({"q0"}),
+    )
+    wfa = WeightedFiniteAutomaton(
+        states=frozenset({"q0", "q1", "q2"}),
+        alphabet=frozenset({"a", "b"}),
+        transitions={
+            ("q0", "a"): {"q2": 1.0},
+            ("q1", "a"): {"q2": 1.0},
+            ("q2", "b"): {"q0": 1.0},
+        },
+        initial_states={"q0": 1.0, "q1": -1.0},
+        accepting_states={"q2": 1.0},
+    )
+    checks = [
+        (pfa.acceptance_probability, pfa.acceptance_probability_many),
+        (wfa.weight_of, wfa.weight_many),
+    ]
+
+    for single, many in checks:
+        # Zero and cancelling weights leave states reachable, so ``c`` is
+        # rejected, while a run without transitions dies out before it.
+        assert single(["a"]) == 0.0
+        assert single(["b", "c"]) == 0.0
+        assert many([["b", "c"], ["a"]]) == [0.0, 0.0]
+        for call, word in ((single, ["a", "c"]), (many, [["a"], ["a", "c"]])):
+            try:
+                call(word)
+            except AutomatonError:
+                pass
+            else:
+                assert False, "unknown symbols should raise while states remain reachable"
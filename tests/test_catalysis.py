@@ -6,6 +6,7 @@ from compute_god.catalysis import (
     CatalysisOutcome,
     Chanzi,
     Jiuzi,
+    catalyse_batch,
     catalyse_jiuzi_and_chanzi,
 )
 
@@ -68,3 +69,50 @@ def test_catalysis_requires_positive_drivers(catalyst: float, agitation: float)
 
     with pytest.raises(ValueError):
         catalyse_jiuzi_and_chanzi(jiuzi, chanzi, catalyst=catalyst, agitation=agitation)
+
+
+def test_participants_are_frozen_with_precomputed_intensity() -> None:
+    jiuzi = Jiuzi(loops=3, twist=1.5, coherence=0.5)
+    chanzi = Chanzi(strands=2, torsion=0.75)
+
+    assert jiuzi.intensity == 3 * 1.5 * 0.5
+    assert chanzi.intensity == 2 * 0.75
+    assert jiuzi == Jiuzi(loops=3, twist=1.5, coherence=0.5)
+    assert "intensity" not in repr(chanzi)
+    with pytest.raises(AttributeError):
+        jiuzi.loops = 4  # type: ignore[misc]
+
+
+def test_catalyse_batch_matches_scalar_pairs_over_a_grid() -> None:
+    np = pytest.importorskip("numpy")
+    knots = [Jiuzi(loops=2, twist=1.2, coherence=0.8), Jiuzi(loops=5, twist=0.4, coherence=1.3)]
+    coils = [
+        Chanzi(strands=2, torsion=0.9, resonance=1.1),
+        Chanzi(strands=3, torsion=1.7, resonance=0.6),
+        Chanzi(strands=7, torsion=0.2, resonance=2.0),
+    ]
+
+    entanglement, alignment, stability, yield_strength = catalyse_batch(
+        np.array([[knot.loops] for knot in knots]),
+        np.array([[knot.twist] for knot in knots]),
+        np.array([[knot.coherence] for knot in knots]),
+        [coil.strands for coil in coils],
+        [coil.torsion for coil in coils],
+        [coil.resonance for coil in coils],
+        catalyst=1.5,
+        agitation=0.6,
+    )
+
+    assert entanglement.shape == alignment.shape == (2, 3)
+    for i, knot in enumerate(knots):
+        for j, coil in enumerate(coils):
+            outcome = catalyse_jiuzi_and_chanzi(knot, coil, catalyst=1.5, agitation=0.6)
+            assert entanglement[i, j] == outcome.entanglement
+            assert alignment[i, j] == outcome.alignment
+            assert stability[i, j] == outcome.stability
+            assert yield_strength[i, j] == outcome.yield_strength
+
+    swept = catalyse_batch(2, 1.0, 1.0, 2, 1.0, 1.0, catalyst=[0.5, 1.0, 2.0])[0]
+    assert np.all(np.diff(swept) > 0)
+    with pytest.raises(ValueError, match="torsion"):
+        catalyse_batch([1, 2], 1.0, 1.0, [1, 2], [1.0, 0.0], 1.0)
@@ -1,3 +1,7 @@
+import copy
+import pickle
+
+import pytest
 from compute_god.complex_dynamics import (
     ComplexDynamicsBlueprint,
     complex_dynamics_metric,
@@ -6,6 +10,8 @@ from compute_god.complex_dynamics import (
 )
 from compute_god.observer import ObserverEvent
 
+from compute_god import ArrayState, fixpoint
+
 
 def test_complex_dynamics_converges_to_blueprint():
     result = run_complex_dynamics(epsilon=1e-4, max_epoch=192)
@@ -71,6 +77,13 @@ def test_complex_dynamics_metric_matches_coordinate_differences():
     expected = sum(abs(current[key] - previous[key]) for key in previous)
     assert abs(delta - expected) <= 1e-9
 
+    keys = tuple(design_complex_dynamics_universe().state)
+    array_delta = complex_dynamics_metric(
+        ArrayState.from_mapping(keys, previous),
+        ArrayState.from_mapping(keys, current),
+    )
+    assert abs(array_delta - expected) <= 1e-9
+
 
 def test_design_complex_dynamics_universe_applies_initial_state():
     universe = design_complex_dynamics_universe(
@@ -80,3 +93,86 @@ def test_design_complex_dynamics_universe_applies_initial_state():
     assert universe.state["energy"] == 0.6
     assert universe.state["entropy"] == 0.4
     assert "cohesion" in universe.state
+
+
+def test_complex_dynamics_fused_rules_match_individual_rules():
+    fused = run_complex_dynamics(epsilon=1e-4, max_epoch=192)
+    steps = []
+
+    def observer(event, _state, **metadata):
+        if event is ObserverEvent.STEP:
+            steps.append(metadata["rule"])
+
+    individual = run_complex_dynamics(
+        epsilon=1e-4, max_epoch=192, observers=(observer,), fused=False
+    )
+
+    assert len(design_complex_dynamics_universe().rules) == 1
+    assert steps[:4] == [
+        "stabilise-energy-flow",
+        "harmonise-feedback-loops",
+        "diffuse-innovation-cycles",
+        "synchronise-temporal-layers",
+    ]
+    assert fused.epochs == individual.epochs
+    for key, value in individual.universe.state.items():
+        assert fused.universe.state[key] == value
+
+
+def test_complex_dynamics_fused_run_matches_unfused_from_zeroed_start():
+    start = {"innovation": 0.0, "exploration": 0.0}
+    fused = run_complex_dynamics(start, epsilon=1e-4, max_epoch=192)
+    individual = run_complex_dynamics(start, epsilon=1e-4, max_epoch=192, fused=False)
+
+    assert fused.converged is individual.converged is True
+    assert fused.epochs == individual.epochs > 1
+    assert fused.universe.state["innovation"] > 0.9
+    for key, value in individual.universe.state.items():
+        assert fused.universe.state[key] == value
+
+
+def test_complex_dynamics_settle_tolerance_discards_only_settled_epochs():
+    start = {"innovation": 0.0, "exploration": 0.0}
+    full = run_complex_dynamics(start, epsilon=1e-4, max_epoch=192)
+    settled = fixpoint(
+        design_complex_dynamics_universe(start, settle_tolerance=1e-4 / 4.0),
+        metric=complex_dynamics_metric,
+        epsilon=1e-4,
+        max_epoch=192,
+    )
+
+    assert settled.converged is True
+    assert 1 < settled.epochs <= full.epochs
+    for key, value in full.universe.state.items():
+        assert abs(settled.universe.state[key] - value) <= 1e-3
+
+
+def test_design_complex_dynamics_universe_shares_rules_for_equal_blueprints():
+    first = design_complex_dynamics_universe(blueprint=ComplexDynamicsBlueprint(energy=0.9))
+    second = design_complex_dynamics_universe(blueprint=ComplexDynamicsBlueprint(energy=0.9))
+    other = design_complex_dynamics_universe(blueprint=ComplexDynamicsBlueprint(energy=0.8))
+
+    assert first.rules is second.rules
+    assert first.rules is not other.rules
+
+
+def test_complex_dynamics_blueprint_state_is_cached_and_read_only():
+    blueprint = ComplexDynamicsBlueprint(energy=0.9)
+    state = blueprint.as_state()
+
+    assert state is blueprint.as_state()
+    assert state["energy"] == 0.9
+    assert blueprint == ComplexDynamicsBlueprint(energy=0.9)
+    with pytest.raises(TypeError):
+        state["energy"] = 0.1  # type: ignore[index]
+
+
+def test_blueprint_pickles_and_copies_after_designing_a_universe():
+    blueprint = ComplexDynamicsBlueprint(innovation=0.9)
+    design_complex_dynamics_universe(blueprint=blueprint)
+
+    for clone in (pickle.loads(pickle.dumps(blueprint)), copy.deepcopy(blueprint)):
+        assert clone == blueprint
+        assert clone.as_state() == blueprint.as_state()
+    with pytest.raises(TypeError):
+        blueprint.as_state()["innovation"] = 0.1
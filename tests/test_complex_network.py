@@ -1,4 +1,5 @@
 from compute_god.complex_network import (
+    DEFAULT_COMPLEX_NETWORK,
     ComplexNetworkBlueprint,
     complex_network_metric,
     ideal_complex_network_universe,
@@ -6,6 +7,8 @@ from compute_god.complex_network import (
 )
 from compute_god.observer import ObserverEvent
 
+from compute_god import ArrayState, God, fixpoint
+
 
 def test_complex_network_converges_to_blueprint():
     result = run_complex_network(epsilon=1e-4, max_epoch=192)
@@ -78,3 +81,55 @@ def test_complex_network_metric_matches_coordinate_differences():
     delta = complex_network_metric(previous, current)
     expected = sum(abs(current[key] - previous[key]) for key in previous)
     assert abs(delta - expected) <= 1e-9
+
+
+def test_complex_network_array_state_matches_dict_state():
+    universe = ideal_complex_network_universe()
+    assert isinstance(universe.state, ArrayState)
+
+    array_result = fixpoint(universe, metric=complex_network_metric, epsilon=1e-4, max_epoch=96)
+    dict_universe = God.universe(state=dict(DEFAULT_COMPLEX_NETWORK), rules=universe.rules)
+    dict_result = fixpoint(dict_universe, metric=complex_network_metric, epsilon=1e-4, max_epoch=96)
+
+    assert array_result.epochs == dict_result.epochs
+    for key, value in dict_result.universe.state.items():
+        assert abs(array_result.universe.state[key] - value) <= 1e-12
+
+
+def test_complex_network_runs_on_pure_python_array_state(monkeypatch):
+    import compute_god.core.array_state as array_state
+
+    expected = run_complex_network(epsilon=1e-4, max_epoch=192)
+    monkeypatch.setattr(array_state, "np", None)
+    result = run_complex_network(epsilon=1e-4, max_epoch=192)
+
+    assert isinstance(result.universe.state, ArrayState)
+    assert result.universe.state.vectorised is False
+    assert result.epochs == expected.epochs
+    for key, value in expected.universe.state.items():
+        assert abs(result.universe.state[key] - value) <= 1e-12
+
+
+def test_complex_network_follows_custom_blueprint_and_shares_rules():
+    blueprint = ComplexNetworkBlueprint(structure=0.8, trust=0.7, entropy=0.1)
+    result = run_complex_network(blueprint=blueprint, epsilon=1e-6, max_epoch=256)
+
+    assert result.converged is True
+    assert result.universe.state["entropy"] >= 0.1 - 1e-9
+    assert result.universe.state["structure"] < 0.95
+
+    first = ideal_complex_network_universe(blueprint=ComplexNetworkBlueprint(structure=0.8))
+    second = ideal_complex_network_universe(blueprint=ComplexNetworkBlueprint(structure=0.8))
+    assert first.rules is second.rules
+
+
+def test_complex_network_fused_run_matches_unfused_from_zeroed_start():
+    start = {key: 0.0 for key in DEFAULT_COMPLEX_NETWORK}
+    fused = run_complex_network(start)
+    individual = run_complex_network(start, fused=False)
+
+    assert fused.converged is individual.converged is True
+    assert fused.epochs == individual.epochs > 1
+    assert fused.universe.state["trust"] > 0.9
+    for key, value in individual.universe.state.items():
+        assert fused.universe.state[key] == value
@@ -1,10 +1,12 @@
 import pytest
 
 from compute_god.cooperation_evolution import (
+    COOPERATION_BATCH_KEYS,
     CooperationParameters,
     DEFAULT_COOPERATION_STATE,
     evolve_cooperation,
     run_cooperation_evolution,
+    run_cooperation_evolution_batch,
 )
 
 
@@ -45,3 +47,44 @@ def test_evolution_clamps_invalid_inputs():
     assert 0.0 <= next_state["reputation"] <= 1.0
     assert 0.0 <= next_state["defection"] <= 1.0
     assert pytest.approx(next_state["cooperation"] + next_state["defection"], abs=1e-9) == 1.0
+
+
+def test_batch_evolution_matches_individual_trajectories():
+    np = pytest.importorskip("numpy")
+    params_batch = [
+        CooperationParameters(),
+        CooperationParameters(temptation=1.8, learning_rate=0.35),
+        CooperationParameters(reward=1.5, mutation_rate=0.0),
+    ]
+    initial_states = [
+        DEFAULT_COOPERATION_STATE,
+        {"cooperation": 1.2, "defection": -0.4, "trust": 1.7},
+        {"cooperation": 0.0, "defection": 0.0},
+    ]
+
+    batch = run_cooperation_evolution_batch(params_batch, initial_states=initial_states, epochs=48)
+
+    assert batch.shape == (49, 3, len(COOPERATION_BATCH_KEYS))
+    assert np.isnan(batch[0, :, COOPERATION_BATCH_KEYS.index("avg_payoff")]).all()
+    for column, (params, initial) in enumerate(zip(params_batch, initial_states)):
+        history = run_cooperation_evolution(initial_state=initial, params=params, epochs=48)
+        for epoch in range(1, 49):
+            for slot, key in enumerate(COOPERATION_BATCH_KEYS):
+                assert batch[epoch, column, slot] == pytest.approx(history[epoch][key], abs=1e-12)
+
+
+def test_batch_evolution_treats_empty_states_as_default():
+    np = pytest.importorskip("numpy")
+    params_batch = [CooperationParameters(), CooperationParameters(temptation=1.8)]
+
+    default = run_cooperation_evolution_batch(params_batch, epochs=12)
+    shared = run_cooperation_evolution_batch(params_batch, initial_states={}, epochs=12)
+    per_population = run_cooperation_evolution_batch(
+        params_batch, initial_states=[{}, DEFAULT_COOPERATION_STATE], epochs=12
+    )
+
+    assert np.array_equal(shared, default, equal_nan=True)
+    assert np.array_equal(per_population, default, equal_nan=True)
+    history = run_cooperation_evolution(initial_state={}, params=params_batch[0], epochs=12)
+    for slot, key in enumerate(COOPERATION_BATCH_KEYS[:-1]):
+        assert shared[0, 0, slot] == history[0][key]
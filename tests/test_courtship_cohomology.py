@@ -4,6 +4,7 @@ from fractions import Fraction
 
 import pytest
 
+import compute_god.domains.courtship_cohomology as courtship_module
 from compute_god.courtship_cohomology import (
     CochainSpace,
     CourtshipCochainComplex,
@@ -72,3 +73,172 @@ def test_invalid_complex_raises_error():
     with pytest.raises(ValueError):
         CourtshipCochainComplex(spaces, (d0, d1))
 
+
+def test_rational_differentials_use_exact_ranks():
+    spaces = {
+        0: CochainSpace(("glance",)),
+        1: CochainSpace(("smile", "laugh")),
+        2: CochainSpace(("promise",)),
+    }
+    d0 = CourtshipDifferential(domain=0, codomain=1, matrix=((Fraction(1, 2),), (Fraction(1, 3),)))
+    d1 = CourtshipDifferential(domain=1, codomain=2, matrix=((Fraction(2, 3), Fraction(-1)),))
+
+    complex_ = CourtshipCochainComplex(spaces, (d0, d1))
+
+    assert complex_.betti_numbers() == {0: 0, 1: 0, 2: 0}
+
+
+
+def test_large_differentials_match_exact_ranks():
+    # d1 = left · [I | block] has rank 3 and d0 maps onto two of its kernel
+    # vectors, large enough to take the modular rank path.
+    block = [[(5 * i + 2 * j) % 11 - 5 for j in range(9)] for i in range(3)]
+    right = [[int(i == j) for j in range(3)] + block[i] for i in range(3)]
+    left = [[(3 * i + j) % 7 - 3 for j in range(3)] for i in range(9)]
+    d1_rows = [[sum(a * b for a, b in zip(row, column)) for column in zip(*right)] for row in left]
+    kernel = [
+        [-block[k][column] for k in range(3)] + [int(j == column) for j in range(9)]
+        for column in range(2)
+    ]
+
+    spaces = {
+        0: CochainSpace(tuple(f"spark_{i}" for i in range(2))),
+        1: CochainSpace(tuple(f"gesture_{i}" for i in range(12))),
+        2: CochainSpace(tuple(f"echo_{i}" for i in range(9))),
+    }
+    d0 = CourtshipDifferential(
+        domain=0,
+        codomain=1,
+        matrix=tuple(tuple(Fraction(vector[j]) for vector in kernel) for j in range(12)),
+    )
+    d1 = CourtshipDifferential(
+        domain=1, codomain=2, matrix=tuple(tuple(Fraction(v) for v in row) for row in d1_rows)
+    )
+
+    complex_ = CourtshipCochainComplex(spaces, (d0, d1))
+
+    assert complex_.betti_numbers() == {0: 0, 1: 7, 2: 6}
+
+
+def test_differential_ranks_are_computed_once(monkeypatch):
+    calls = []
+    original = courtship_module._rank
+
+    def counting_rank(matrix):
+        calls.append(matrix)
+        return original(matrix)
+
+    monkeypatch.setattr(courtship_module, "_rank", counting_rank)
+    complex_ = _courtship_complex()
+    complex_.betti_numbers()
+    complex_.betti_numbers()
+
+    assert len(calls) == 2
+
+
+def test_float_coefficients_are_read_as_decimals_unless_exact():
+    spaces = {
+        0: CochainSpace(("wink",)),
+        1: CochainSpace(("blush", "grin")),
+    }
+    d0 = CourtshipDifferential(domain=0, codomain=1, matrix=((0.1,), (0.3,)))
+
+    complex_ = CourtshipCochainComplex(spaces, (d0,))
+    exact = CourtshipCochainComplex(spaces, (d0,), exact_floats=True)
+
+    assert complex_.differential(0).matrix == ((Fraction(1, 10),), (Fraction(3, 10),))
+    assert exact.differential(0).matrix == ((Fraction(0.1),), (Fraction(0.3),))
+    assert exact.betti_numbers() == complex_.betti_numbers() == {0: 0, 1: 1}
+
+
+def test_large_invalid_complex_raises_error():
+    spaces = {
+        0: CochainSpace(tuple(f"spark_{i}" for i in range(6))),
+        1: CochainSpace(tuple(f"gesture_{i}" for i in range(6))),
+        2: CochainSpace(tuple(f"echo_{i}" for i in range(6))),
+    }
+    identity = tuple(tuple(Fraction(int(i == j), 3) for j in range(6)) for i in range(6))
+    d0 = CourtshipDifferential(domain=0, codomain=1, matrix=identity)
+    d1 = CourtshipDifferential(domain=1, codomain=2, matrix=identity)
+
+    with pytest.raises(ValueError):
+        CourtshipCochainComplex(spaces, (d0, d1))
+
+
+def test_degree_lookups_respect_offsets_and_missing_degrees():
+    spaces = {
+        -1: CochainSpace(("hello",)),
+        0: CochainSpace(("coffee", "walk")),
+    }
+    d = CourtshipDifferential(domain=-1, codomain=0, matrix=((Fraction(1),), (Fraction(2),)))
+
+    complex_ = CourtshipCochainComplex(spaces, (d,))
+
+    assert complex_.betti_numbers() == {-1: 0, 0: 1}
+    assert complex_.space(0).basis == ("coffee", "walk")
+    assert complex_.differential(-1) is not None
+    assert complex_.differential(0) is None
+    assert complex_.differential(7) is None
+    with pytest.raises(KeyError):
+        complex_.cohomology_dimension(1)
+    with pytest.raises(KeyError):
+        complex_.space(-2)
+
+
+def test_short_binary_floats_are_taken_exactly():
+    spaces = {0: CochainSpace(("nod",)), 1: CochainSpace(("wave", "smile"))}
+    d0 = CourtshipDifferential(domain=0, codomain=1, matrix=((1.5,), (2.0**-19,)))
+
+    complex_ = CourtshipCochainComplex(spaces, (d0,))
+
+    assert complex_.differential(0).matrix == ((Fraction(3, 2),), (Fraction(1, 2**19),))
+
+
+def test_disjoint_supports_compose_to_zero():
+    spaces = {
+        0: CochainSpace(("glance", "grin")),
+        1: CochainSpace(("chat", "dance", "dinner")),
+        2: CochainSpace(("trust",)),
+    }
+    # d0 only reaches "chat" while d1 only reads "dance" and "dinner".
+    d0 = CourtshipDifferential(
+        domain=0,
+        codomain=1,
+        matrix=((Fraction(1), Fraction(2)), (Fraction(0), Fraction(0)), (Fraction(0), Fraction(0))),
+    )
+    d1 = CourtshipDifferential(
+        domain=1, codomain=2, matrix=((Fraction(0), Fraction(3), Fraction(-1, 2)),)
+    )
+
+    complex_ = CourtshipCochainComplex(spaces, (d0, d1))
+
+    assert complex_.betti_numbers() == {0: 1, 1: 1, 2: 0}
+
+
+def test_fraction_differentials_are_reused_and_others_coerced():
+    complex_ = _courtship_complex()
+    d0 = complex_.differential(0)
+
+    rebuilt = CourtshipCochainComplex({d: complex_.space(d) for d in (0, 1, 2)}, (d0,))
+    mixed = CourtshipDifferential(
+        domain=0, codomain=1, matrix=((1, 1.0), (0, 0), (Fraction(0), 0.0))
+    )
+    coerced = CourtshipCochainComplex({d: complex_.space(d) for d in (0, 1, 2)}, (mixed,))
+
+    assert rebuilt.differential(0) is d0
+    assert coerced.differential(0) == d0
+    assert all(type(value) is Fraction for row in coerced.differential(0).matrix for value in row)
+
+
+def test_differentials_from_or_into_empty_spaces_have_rank_zero():
+    from_empty = CourtshipCochainComplex(
+        {0: CochainSpace(()), 1: CochainSpace(("a", "b"))},
+        [CourtshipDifferential(0, 1, ((), ()))],
+    )
+
+    assert from_empty.betti_numbers() == {0: 0, 1: 2}
+    # Differentials need at least one row, so an empty target only reaches
+    # the rank helpers directly.
+    assert courtship_module._rank(((), 0, 4)) == 0
+    assert courtship_module._modular_rank(((), 4, 0)) == 0
+    assert courtship_module._modular_rank(((), 0, 4)) == 0
@@ -1,5 +1,8 @@
 import math
 
+import pytest
+
+import compute_god.domains.ctc as ctc_module
 from compute_god import (
     ClosedTimelikeCurve,
     optimise_closed_timelike_curve,
@@ -85,3 +88,89 @@ def test_ctc_bounded_projection_respects_limits():
     # The target for the second segment exceeds its upper bound, so the
     # optimiser should saturate it at the provided limit.
     assert math.isclose(vector[1], 0.5, rel_tol=1e-8, abs_tol=1e-8)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ctc_simplex_projection_matches_bounded_projection(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ctc_module, "np", None)
+    values = [math.sin(3.7 * index) * 2.0 for index in range(40)]
+    lower = [0.0] * len(values)
+    upper = [math.inf] * len(values)
+
+    projected = ctc_module._project_onto_simplex(values, 3.0)
+    reference = ctc_module._project_onto_bounded_simplex(values, 3.0, lower, upper)
+
+    assert math.isclose(sum(projected), 3.0, rel_tol=1e-12)
+    assert all(value >= 0.0 for value in projected)
+    for value, expected in zip(projected, reference):
+        assert math.isclose(value, expected, abs_tol=1e-8)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ctc_large_curve_optimisation(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ctc_module, "np", None)
+    dimension = 48
+    curve = ClosedTimelikeCurve(segments=[1.0] * dimension, period=4.0)
+    target = [abs(math.cos(index)) * 0.2 for index in range(dimension)]
+    seen = []
+
+    result = optimise_closed_timelike_curve(
+        curve,
+        quadratic_objective(target),
+        learning_rate=0.2,
+        max_iter=256,
+        tolerance=1e-9,
+        callback=lambda iteration, vector, value: seen.append(list(vector)),
+    )
+
+    assert result.converged is True
+    vector = curve.as_vector()
+    assert math.isclose(sum(vector), 4.0, rel_tol=1e-9)
+    assert all(value >= 0.0 for value in vector)
+    for value, expected in zip(vector, seen[-1]):
+        assert math.isclose(value, expected, abs_tol=1e-9)
+
+
+def test_ctc_feasible_segments_skip_projection(monkeypatch):
+    calls = []
+    original = ctc_module._project_onto_bounded_simplex
+
+    def counting_projection(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(ctc_module, "_project_onto_bounded_simplex", counting_projection)
+    curve = ClosedTimelikeCurve(
+        segments=[0.3, 0.3, 0.4],
+        period=2.0,
+        lower_bounds=[0.1, 0.1, 0.1],
+        upper_bounds=[1.0, 1.0, 1.0],
+    )
+    assert calls == []
+    assert curve.as_vector() == [0.6, 0.6, 0.8]
+
+    ClosedTimelikeCurve(
+        segments=[0.05, 0.45, 0.5],
+        period=2.0,
+        lower_bounds=[0.2, 0.1, 0.1],
+        upper_bounds=[1.0, 1.0, 1.0],
+    )
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ctc_warm_simplex_projection_matches_cold_projection(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(ctc_module, "np", None)
+    values = [math.sin(1.3 * index) for index in range(40)]
+    _, theta = ctc_module._simplex_projection(values, 2.5)
+    nudged = [value + 1e-4 * math.cos(index) for index, value in enumerate(values)]
+
+    for guess in (theta, theta + 0.5, -10.0, None):
+        warm, warm_theta = ctc_module._project_onto_simplex_warm(nudged, 2.5, guess)
+        cold, cold_theta = ctc_module._simplex_projection(nudged, 2.5)
+        assert math.isclose(warm_theta, cold_theta, abs_tol=1e-12)
+        for value, expected in zip(warm, cold):
+            assert math.isclose(value, expected, abs_tol=1e-12)
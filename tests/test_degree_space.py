@@ -36,3 +36,36 @@ def test_tensor_product_combines_dual_and_negative_dual():
     expected_self = left_space.dual()(left_space) * right_space.negative_dual()(right_space)
     assert tensor(left_space, right_space) == pytest.approx(expected_self)
 
+
+
+def test_tensor_batched_matches_pointwise_evaluation():
+    tensor = tensor_product(
+        DegreeSpace({"a": 1.5, "b": -2.0}).dual(),
+        DegreeSpace({"a": 0.25, "c": 4.0}).negative_dual(),
+    )
+    spaces = [DegreeSpace({"a": float(i), "b": 1.0, "c": -float(i)}) for i in range(3)]
+    mapping = {"a": 2.0, "c": 0.5}
+    pairs = [(u, v) for u in spaces for v in spaces] + [(mapping, spaces[1]), (spaces[2], mapping)]
+
+    assert tensor.batched(pairs) == [tensor(u, v) for u, v in pairs]
+
+
+def test_duals_and_tensors_are_slotted():
+    dual = DegreeSpace({"a": 1.0}).dual()
+
+    assert not hasattr(dual, "__dict__")
+    assert not hasattr(tensor_product(dual, dual), "__dict__")
+
+
+def test_dual_matches_mapping_evaluation_across_changing_bases():
+    dual = DegreeSpace({"a": 0.5, "b": -1.25, "c": 2.0}).dual()
+    spaces = [
+        DegreeSpace({"a": 1.0, "b": 2.0}),
+        DegreeSpace({"a": -3.0, "b": 0.5}),
+        DegreeSpace({"c": 4.0, "a": 1.5, "z": 9.0}),
+        DegreeSpace({}),
+        DegreeSpace({"a": 2.0, "b": 2.0}),
+    ]
+
+    for space in spaces:
+        assert dual(space) == pytest.approx(dual(space.as_state()))
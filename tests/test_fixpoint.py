@@ -1,6 +1,20 @@
 import functools
+import sys
 
-from compute_god import God, fixpoint, recursive_descent_fixpoint, rule
+import pytest
+
+from compute_god import (
+    ArrayState,
+    God,
+    NoopObserver,
+    ObserverEvent,
+    combine_observers,
+    fixpoint,
+    fuse_rules,
+    linf_predicate,
+    recursive_descent_fixpoint,
+    rule,
+)
 
 
 def edit_distance(a, b):
@@ -147,3 +161,236 @@ def test_recursive_descent_fixpoint_matches_iterative():
     assert recursive_result.converged is iterative_result.converged is True
     assert recursive_result.universe.state == iterative_result.universe.state == {"counter": target}
     assert recursive_result.epochs == iterative_result.epochs
+
+
+def test_fixpoint_preserves_array_state_layout():
+    def halve(state):
+        state["x"] = state["x"] / 2.0
+        return state
+
+    universe = God.universe(state=ArrayState(("x", "y"), (1.0, 0.5)), rules=[rule("halve", halve)])
+    result = fixpoint(
+        universe,
+        metric=lambda a, b: abs(a["x"] - b["x"]),
+        epsilon=1e-3,
+        max_epoch=32,
+    )
+
+    assert result.converged is True
+    assert isinstance(result.universe.state, ArrayState)
+    assert result.universe.state["y"] == 0.5
+    assert universe.state["x"] == 1.0
+    with pytest.raises(KeyError):
+        result.universe.state["z"] = 1.0
+
+
+def test_fixpoint_keeps_previous_epoch_intact_for_in_place_rules():
+    def bump(state):
+        state["value"] += 1
+        return state
+
+    deltas = []
+
+    def metric(previous, current):
+        deltas.append(current["value"] - previous["value"])
+        return abs(current["value"] - previous["value"])
+
+    universe = God.universe(state={"value": 0}, rules=[rule("bump", bump)])
+    result = fixpoint(universe, metric=metric, epsilon=0, max_epoch=3)
+
+    assert result.converged is False
+    assert deltas == [1, 1, 1]
+    assert universe.state == {"value": 0}
+
+
+def test_fixpoint_convergence_predicate_defers_metric_to_converged_epoch():
+    def ease(state):
+        return {**state, "value": state["value"] + (8.0 - state["value"]) * 0.5}
+
+    metric_calls = []
+    events = []
+
+    def metric(a, b):
+        metric_calls.append(1)
+        return abs(a["value"] - b["value"])
+
+    def observer(event, _state, **metadata):
+        events.append((event, "delta" in metadata))
+
+    kwargs = dict(epsilon=1e-3, max_epoch=64)
+    expected = fixpoint(
+        God.universe(state={"value": 0.0}, rules=[rule("ease", ease)]),
+        metric=metric,
+        **kwargs,
+    )
+    metric_calls.clear()
+    result = fixpoint(
+        God.universe(state={"value": 0.0}, rules=[rule("ease", ease)], observers=[observer]),
+        metric=metric,
+        predicate=linf_predicate,
+        **kwargs,
+    )
+
+    assert result.converged is True
+    assert result.epochs == expected.epochs
+    assert metric_calls == [1]
+    assert events[-1] == (ObserverEvent.FIXPOINT_CONVERGED, True)
+    assert (ObserverEvent.EPOCH, False) in events
+
+
+def test_linf_predicate_scans_union_of_keys():
+    assert linf_predicate({"a": 1.0}, {"a": 1.05}, 0.1) is True
+    assert linf_predicate({"a": 1.0}, {"a": 1.2}, 0.1) is False
+    assert linf_predicate({"a": 1.0, "b": 0.5}, {"a": 1.0}, 0.1) is False
+    previous = ArrayState(("a", "b"), (0.0, 1.0))
+    assert linf_predicate(previous, ArrayState(("a", "b"), (0.05, 1.0)), 0.1) is True
+
+
+def test_fuse_rules_applies_members_in_priority_order():
+    first = rule("first", lambda state: {**state, "trace": state["trace"] + "a"}, priority=1)
+    second = rule("second", lambda state: {**state, "trace": state["trace"] + "b"})
+    fused = fuse_rules("both", [second, first])
+
+    assert fused.annotations["fused"] == ("first", "second")
+    assert fused.apply({"trace": ""}, God.rule_context()) == {"trace": "ab"}
+
+    guarded = rule("guarded", lambda state: state, guard=lambda state, ctx: False)
+    with pytest.raises(ValueError):
+        fuse_rules("invalid", [first, guarded])
+
+
+def test_combine_observers_drops_noop_observers():
+    seen = []
+
+    def record(event, _state, **metadata):
+        seen.append((event, metadata))
+
+    assert isinstance(combine_observers(NoopObserver(), NoopObserver()), NoopObserver)
+    assert combine_observers(NoopObserver(), record) is record
+
+    combined = combine_observers(record, NoopObserver(), record)
+    combined(ObserverEvent.EPOCH, {}, epoch=1)
+    assert seen == [(ObserverEvent.EPOCH, {"epoch": 1})] * 2
+
+
+def test_watched_guard_is_reevaluated_only_when_its_keys_change():
+    guard_calls = []
+
+    def gate(state, ctx):
+        guard_calls.append(state["mode"])
+        return state["mode"] == "on"
+
+    def tick(state):
+        mode = "off" if state["ticks"] >= 2 else "on"
+        return {**state, "ticks": state["ticks"] + 1, "mode": mode}
+
+    universe = God.universe(
+        state={"mode": "on", "ticks": 0},
+        rules=[rule("tick", tick, guard=gate, watches=("mode",))],
+    )
+    result = fixpoint(universe, metric=edit_distance, epsilon=0, max_epoch=8)
+
+    assert result.converged is True
+    assert result.universe.state == {"mode": "off", "ticks": 3}
+    assert guard_calls == ["on", "off"]
+
+
+def test_recursive_descent_fixpoint_is_not_bounded_by_recursion_limit():
+    epochs = sys.getrecursionlimit() + 50
+    count = rule("count", lambda state: {"counter": state["counter"] + 1})
+    universe = God.universe(state={"counter": 0}, rules=[count])
+    result = recursive_descent_fixpoint(universe, metric=edit_distance, epsilon=0, max_epoch=epochs)
+
+    assert result.converged is False
+    assert result.epochs == epochs
+    assert result.universe.state == {"counter": epochs}
+
+
+def test_worklist_skips_rules_whose_reads_did_not_change():
+    fired = []
+
+    def observer(event, _state, **metadata):
+        if event is ObserverEvent.STEP:
+            fired.append(metadata["rule"])
+
+    def grow(state):
+        state["a"] = min(state["a"] + 1, 3)
+        return state
+
+    def double(state):
+        state["b"] = state["a"] * 2
+        return state
+
+    def scale(state):
+        state["d"] = state["c"] * 10
+        return state
+
+    universe = God.universe(
+        state={"a": 0, "b": 0, "c": 1, "d": 0},
+        rules=[
+            rule("grow", grow, priority=2, writes=("a",)),
+            rule("double", double, priority=1, reads=("a",), writes=("b",)),
+            rule("scale", scale, reads=("c",), writes=("d",)),
+        ],
+        observers=[observer],
+    )
+    result = fixpoint(universe, metric=edit_distance, epsilon=0, max_epoch=10)
+
+    assert result.converged is True
+    assert result.universe.state == {"a": 3, "b": 6, "c": 1, "d": 10}
+    assert fired.count("scale") == 1
+    assert fired.count("double") == 4
+    assert fired.count("grow") == result.epochs
+
+
+def test_worklist_detects_fixpoint_without_calling_the_metric():
+    metric_calls = []
+
+    def metric(a, b):
+        metric_calls.append(1)
+        return edit_distance(a, b)
+
+    def settle(state):
+        state["a"] = min(state["a"] + 1, 2)
+        return state
+
+    universe = God.universe(
+        state={"a": 0}, rules=[rule("settle", settle, reads=("a",), writes=("a",))]
+    )
+    result = fixpoint(universe, metric=metric, epsilon=0, max_epoch=10)
+
+    assert result.converged is True
+    assert result.epochs == 3
+    assert len(metric_calls) == 2
+
+
+def test_unconditional_rules_keep_step_accounting_without_observers():
+    seen = []
+
+    def count(state, ctx):
+        seen.append(ctx.steps())
+        return {"value": min(state["value"] + 1, 2)}
+
+    rules = [rule("first", count, priority=1), rule("second", count)]
+    universe = God.universe(state={"value": 0}, rules=rules)
+    result = fixpoint(universe, metric=edit_distance, epsilon=0, max_epoch=5)
+
+    assert result.converged is True
+    assert result.epochs == 2
+    assert seen == [0, 1, 2, 3]
+
+
+def test_async_rules_are_rejected_when_the_universe_is_built():
+    async def bump(state):
+        return state
+
+    with pytest.raises(TypeError, match="Async rules"):
+        God.universe(state={}, rules=[rule("bump", bump)])
+
+    class Pending:
+        def __await__(self):
+            yield
+
+    universe = God.universe(state={}, rules=[rule("pending", lambda state: Pending())])
+    with pytest.raises(TypeError, match="Async rules"):
+        fixpoint(universe, metric=edit_distance, epsilon=0, max_epoch=1)
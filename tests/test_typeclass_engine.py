@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
 
 from compute_god.core import (
@@ -12,6 +17,7 @@ from compute_god.core import (
     MetaVar,
     ObservationalEquality,
     Sort,
+    Substitution,
     TypeClass,
     TypeClassEnvironment,
     TypeClassField,
@@ -19,6 +25,7 @@ from compute_god.core import (
     TypeExpr,
     TypeVar,
     cast,
+    unify,
 )
 
 
@@ -111,6 +118,157 @@ def test_solver_raises_on_missing_instance():
         solver.solve_all([constraint])
 
 
+def test_solutions_are_shared_across_solvers_until_instances_change():
+    eq_class = _eq_type_class()
+    environment = TypeClassEnvironment()
+    _register_eq_instances(environment, eq_class)
+    target = TypeExpr("List", (TypeExpr("Int"),))
+
+    def solve(name):
+        return ConstraintSolver(environment).solve_all(
+            [ClassConstraint(eq_class, target, MetaVar(name))]
+        )
+
+    first = solve("a")
+    second = solve("b")
+    assert first["a"] is second["b"]
+
+    environment.add_instance(
+        eq_class,
+        TypeClassInstance(
+            name="EqBool", head=TypeExpr("Bool"), builder=lambda *_: {"eq": lambda x, y: x is y}
+        ),
+    )
+    third = solve("c")
+    assert third["c"] is not first["a"]
+
+
+def test_instances_are_narrowed_by_head_constructor_in_declaration_order():
+    eq_class = _eq_type_class()
+    environment = TypeClassEnvironment()
+    _register_eq_instances(environment, eq_class)
+    fallback = TypeClassInstance(
+        name="EqAny", head=TypeVar("B"), builder=lambda *_: {"eq": lambda x, y: x == y}
+    )
+    environment.add_instance(eq_class, fallback)
+
+    def names(target: TypeExpr) -> list[str]:
+        return [instance.name for instance in environment.instances_for(eq_class, target)]
+
+    assert names(TypeExpr("Int")) == ["EqInt", "EqAny"]
+    assert names(TypeExpr("List", (TypeExpr("Int"),))) == ["EqList", "EqAny"]
+    assert names(TypeExpr("List")) == ["EqAny"]
+    assert names(TypeVar("C")) == ["EqInt", "EqList", "EqAny"]
+    assert [instance.name for instance in environment.instances_for(eq_class)] == [
+        "EqInt",
+        "EqList",
+        "EqAny",
+    ]
+
+
+def test_constraint_key_uses_the_resolved_term():
+    eq_class = _eq_type_class()
+    element = TypeVar("A")
+    substitution = unify(element, TypeExpr("Int"))
+    constraint = ClassConstraint(eq_class, TypeExpr("List", (element,)), MetaVar("eq"))
+
+    key = constraint.key(substitution)
+
+    assert key == ("Eq", TypeExpr("List", (TypeExpr("Int"),)))
+    assert hash(key) == hash(("Eq", TypeExpr("List", (TypeExpr("Int"),))))
+
+
+def test_solve_all_coalesces_duplicates_and_reports_cycles():
+    eq_class = _eq_type_class()
+    environment = TypeClassEnvironment()
+    builds = []
+
+    def int_builder(_prereqs, _subst, _eq):
+        builds.append("Int")
+        return {"eq": lambda x, y: x == y}
+
+    environment.add_instance(
+        eq_class, TypeClassInstance(name="EqInt", head=TypeExpr("Int"), builder=int_builder)
+    )
+    environment.add_instance(
+        eq_class,
+        TypeClassInstance(
+            name="EqLoop",
+            head=TypeExpr("Loop"),
+            builder=lambda prereqs, *_: prereqs["self"],
+            prerequisites=(ConstraintTemplate(eq_class, TypeExpr("Loop"), "self"),),
+        ),
+    )
+
+    solutions = ConstraintSolver(environment).solve_all(
+        [ClassConstraint(eq_class, TypeExpr("Int"), MetaVar(name)) for name in ("a", "b", "c")]
+    )
+    assert builds == ["Int"]
+    assert solutions["a"] is solutions["b"] is solutions["c"]
+
+    with pytest.raises(InstanceResolutionError, match="Cycle"):
+        ConstraintSolver(environment).solve_all(
+            [ClassConstraint(eq_class, TypeExpr("Loop"), MetaVar("loop"))]
+        )
+
+
+def test_interned_terms_share_structure():
+    int_type = TypeExpr.intern("Int")
+    list_int = TypeExpr.intern("List", (int_type,))
+
+    assert TypeExpr.intern("Int") is int_type
+    assert TypeExpr.intern("List", (TypeExpr.intern("Int"),)) is list_int
+    assert list_int == TypeExpr("List", (TypeExpr("Int"),))
+    assert TypeVar.intern("A") is TypeVar.intern("A")
+    assert list_int.map_args(lambda arg: arg) is list_int
+
+
+def test_substitution_applies_long_chains_and_deep_terms_iteratively():
+    variables = [TypeVar(f"v{i}") for i in range(5)]
+    substitution = Substitution()
+    for current, following in zip(variables, variables[1:]):
+        substitution.bind(current, following)
+    substitution.bind(variables[-1], TypeExpr("Int"))
+
+    assert substitution.apply(variables[0]) == TypeExpr("Int")
+    list_of_int = TypeExpr("List", (TypeExpr("Int"),))
+    assert substitution.apply(TypeExpr("List", (variables[1],))) == list_of_int
+
+    deep = TypeVar("leaf")
+    for _ in range(2000):
+        deep = TypeExpr("Box", (deep,))
+    applied = unify(TypeVar("leaf"), TypeExpr("Int")).apply(deep)
+    for _ in range(2000):
+        applied = applied.args[0]
+    assert applied == TypeExpr("Int")
+
+
+def test_occurs_check_and_apply_visit_shared_subterms_once():
+    from compute_god.core.typeclass import occurs_in
+
+    var = TypeVar("x")
+    shared = TypeExpr.intern("Int")
+    for _ in range(64):
+        shared = TypeExpr.intern("Pair", (shared, shared))
+
+    assert occurs_in(var, TypeExpr("Pair", (shared, var)), Substitution()) is True
+    assert occurs_in(var, shared, Substitution()) is False
+    assert unify(var, shared).apply(var) is shared
+
+
+def test_observational_equality_respects_custom_normalisers():
+    default = ObservationalEquality()
+    assert default.equivalent(1, 2, sort=Sort.OMEGA)
+    assert default.equivalent(1, 1) and not default.equivalent(1, 2)
+
+    custom = ObservationalEquality(
+        normalisers={Sort.OMEGA: lambda value: value % 2, Sort.UNIVERSE: abs}
+    )
+    assert not custom.equivalent(1, 2, sort=Sort.OMEGA)
+    assert custom.equivalent(1, 3, sort=Sort.OMEGA)
+    assert custom.equivalent(-2, 2)
+
+
 def test_observational_cast_respects_witness():
     equality = ObservationalEquality()
     term = TypeExpr("List", (TypeExpr("Int"),))
@@ -133,3 +291,26 @@ def test_observational_cast_respects_witness():
             witness=lambda _s, _t: False,
             equality=equality,
         )
+
+
+def test_pickled_type_expr_rehashes_in_a_new_process() -> None:
+    # Hash and pickle the term in a process with a different string-hash salt;
+    # the cached hash must not travel with it.
+    script = (
+        "import pickle, sys\n"
+        "from compute_god.core import TypeExpr\n"
+        "term = TypeExpr('List', (TypeExpr('Int'),))\n"
+        "hash(term)\n"
+        "sys.stdout.buffer.write(pickle.dumps(term))\n"
+    )
+    env = dict(os.environ, PYTHONHASHSEED="1", PYTHONPATH=os.pathsep.join(sys.path))
+    payload = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, env=env
+    ).stdout
+
+    loaded = pickle.loads(payload)
+    fresh = TypeExpr("List", (TypeExpr("Int"),))
+
+    assert "_hash" not in loaded.__dict__
+    assert hash(loaded) == hash(fresh)
+    assert {fresh: "found"}[loaded] == "found"
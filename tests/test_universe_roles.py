@@ -15,3 +15,28 @@ def test_rules_by_role_filters_and_preserves_priority_order() -> None:
 
     all_rules = universe.rules_by_role(None)
     assert all_rules == [high_priority, other_role, low_priority]
+
+
+def test_rule_order_is_resolved_once_per_universe() -> None:
+    low = rule("low", lambda state: state, priority=1)
+    high = rule("high", lambda state: state, priority=10)
+
+    universe = God.universe(state={}, rules=[low, high])
+
+    assert universe.ordered_rules == (high, low)
+    assert universe.sorted_rules() == [high, low]
+    assert universe.sorted_rules() is not universe.sorted_rules()
+    assert universe == God.universe(state={}, rules=[low, high])
+
+
+def test_rule_columns_follow_priority_order_and_skip_trivial_predicates() -> None:
+    guarded = rule("guarded", lambda state: state, guard=lambda state, ctx: True, priority=3)
+    plain = rule("plain", lambda state: state, until=lambda state, ctx: True)
+
+    universe = God.universe(state={}, rules=[plain, guarded])
+
+    assert universe.rule_names == ("guarded", "plain")
+    assert universe.rule_priorities == (3, 0)
+    assert universe.rule_guards[0] is not None and universe.rule_guards[1] is None
+    assert universe.rule_stops[0] is None and universe.rule_stops[1] is not None
+    assert universe.rule_records[1] == ("plain", None, plain.apply, universe.rule_stops[1])